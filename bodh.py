@@ -4,25 +4,396 @@ Bodh - Modular Markdown to PDF Presentation Tool
 """
 
 import argparse
+import atexit
+import errno
+import functools
+import hashlib
+import itertools
+import mmap
 import os
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import markdown
-from jinja2 import Template
+from urllib.parse import quote_plus
 import json
 import base64
+import re
 import yaml
 import tempfile
 import subprocess
 import shutil
 from config import PresentationConfig, load_config, create_sample_config
 from font_manager import FontManager
-from playwright.sync_api import sync_playwright
+from utils import LATEX_RERUN_NEEDED, SlideCache, read_latex_log, read_markdown, source_fingerprint, user_cache_dir
 
+# orjson parses theme JSON several times faster when it is installed (optional)
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# markdown, jinja2 and playwright are imported where used, so --help and --list-themes start fast
 PDF_BACKEND = 'playwright' # Default to playwright
-from playwright.sync_api import sync_playwright
+
+# Chromium launch options with CI-friendly flags, shared by every browser launch
+BROWSER_LAUNCH_OPTIONS = {
+    'headless': True,
+    'args': [
+        '--no-sandbox',
+        '--disable-setuid-sandbox',
+        '--disable-dev-shm-usage',
+        '--disable-gpu',
+        '--no-first-run',
+        '--no-default-browser-check',
+        '--disable-default-apps',
+        '--disable-translate',
+        '--disable-extensions',
+        '--disable-background-timer-throttling',
+        '--disable-backgrounding-occluded-windows',
+        '--disable-renderer-backgrounding',
+        '--disable-features=TranslateUI',
+        '--disable-ipc-flooding-protection'
+    ]
+}
+
+# LaTeX document preamble for the LaTeX backend; filled in with theme RGB colors via str.format
+LATEX_PREAMBLE = """\\documentclass[11pt]{{article}}
+
+% Packages
+\\usepackage[landscape,margin=0.5in]{{geometry}}
+\\usepackage[utf8]{{inputenc}}
+\\usepackage[T1]{{fontenc}}
+\\usepackage{{xcolor}}
+\\usepackage{{amsmath}}
+\\usepackage{{amsfonts}}
+\\usepackage{{amssymb}}
+\\usepackage{{enumitem}}
+\\usepackage{{listings}}
+\\usepackage{{graphicx}}
+\\usepackage{{fancyhdr}}
+\\usepackage{{multicol}}
+
+% Colors
+\\definecolor{{bgcolor}}{{RGB}}{{{bg_color}}}
+\\definecolor{{textcolor}}{{RGB}}{{{text_color}}}
+\\definecolor{{accentcolor}}{{RGB}}{{{accent_color}}}
+
+% Page setup
+\\pagecolor{{bgcolor}}
+\\color{{textcolor}}
+\\pagestyle{{empty}}
+
+% Commands
+\\newcommand{{\\slidetitle}}[1]{{%
+  \\begin{{center}}
+  \\textcolor{{accentcolor}}{{\\huge\\textbf{{#1}}}}
+  \\end{{center}}
+  \\vspace{{0.5cm}}
+}}
+
+% Math setup
+\\everymath{{\\displaystyle}}
+
+% List styling
+\\setlist[itemize]{{leftmargin=1cm,itemsep=0.3cm}}
+\\renewcommand{{\\labelitemi}}{{\\textcolor{{accentcolor}}{{\\textbullet}}}}
+
+\\begin{{document}}
+
+"""
+
+LATEX_POSTAMBLE = "\\end{document}"
+
+
+def _hex_to_latex_rgb(hex_color):
+    """Convert a hex color to a LaTeX RGB triple (integer values 0-255)"""
+    hex_color = hex_color.lstrip('#')
+    if len(hex_color) != 6:
+        return "0,0,0"
+    try:
+        r = int(hex_color[0:2], 16)
+        g = int(hex_color[2:4], 16)
+        b = int(hex_color[4:6], 16)
+        return f"{r},{g},{b}"
+    except ValueError:
+        return "0,0,0"
+
+
+@functools.lru_cache(maxsize=32)
+def _latex_preamble(background, text, accent):
+    """LATEX_PREAMBLE filled in with theme colors, built once per color combination"""
+    return LATEX_PREAMBLE.format(bg_color=_hex_to_latex_rgb(background),
+                                 text_color=_hex_to_latex_rgb(text),
+                                 accent_color=_hex_to_latex_rgb(accent))
+
+
+# Precompiled patterns for the markdown -> LaTeX conversion, shared across slides
+# Either a fenced code block (skipped whole) or a --- slide separator line
+_LATEX_SLIDE_SEPARATOR = re.compile(r'^```.*?^```[^\n]*$|^(?P<sep>---)[ \t]*$', re.MULTILINE | re.DOTALL)
+_LATEX_COLUMNS_OPEN = re.compile(r':::: columns\s*\n')
+_LATEX_COLUMNS_CLOSE = re.compile(r'\n::::\s*\n')
+_LATEX_COLUMNS_CLOSE_END = re.compile(r'\n::::\s*$')
+_LATEX_COLUMN_LEFT = re.compile(r'::: left\s*\n')
+_LATEX_COLUMN_BREAK = re.compile(r'\n:::\s*\n')
+_LATEX_COLUMN_RIGHT = re.compile(r'::: right\s*\n')
+_LATEX_COLUMN_END = re.compile(r'\n:::\s*$')
+_LATEX_DISPLAY_MATH = re.compile(r'\$\$(.+?)\$\$', re.DOTALL)
+_H3 = re.compile(r'^### (.+)$', re.MULTILINE)
+_H2 = re.compile(r'^## (.+)$', re.MULTILINE)
+_BOLD = re.compile(r'\*\*(.+?)\*\*')
+_ITAL = re.compile(r'\*([^*]+?)\*')
+_LIST_ITEM = re.compile(r'^- (.+)$', re.MULTILINE)
+# A run of consecutive \item lines, wrapped in one itemize environment by a single sub
+_LIST_ITEM_RUN = re.compile(r'(?:^[^\S\n]*\\item[^\n]*(?:\n|\Z))+', re.MULTILINE)
+_CODE_BLOCK = re.compile(r'```(\w+)?\n(.+?)\n```', re.DOTALL)
+_INLINE_CODE = re.compile(r'`(.+?)`')
+_PARAGRAPH_BREAK = re.compile(r'\n\n')
+
+
+def _wrap_itemize(match):
+    """Wrap a matched run of \\item lines in an itemize environment"""
+    items = match.group()
+    if items.endswith('\n'):
+        return '\\begin{itemize}\n' + items + '\\end{itemize}\n'
+    return '\\begin{itemize}\n' + items + '\n\\end{itemize}'
+
+
+# MathJax and its fonts, as requested by the CDN math mode
+MATHJAX_CDN_URL_PATTERN = "https://cdn.jsdelivr.net/npm/mathjax@3/**"
+
+# Any delimiter MathJax would typeset ($, $$, \(, \[ or a bare environment); decks without one skip MathJax
+_MATH_DELIMITERS = re.compile(r'\$|\\[(\[]|\\begin\{')
+
+# Start of the MathJax configuration script, only emitted for decks that contain math
+MATHJAX_CONFIG_MARKER = 'window.MathJax = {'
+
+
+def _slides_have_math(slides):
+    """Whether any rendered slide contains a math delimiter"""
+    return any(_MATH_DELIMITERS.search(slide) for slide in slides)
+
+
+# CDN responses shared by every browser context in this process (url -> (status, headers, body)),
+# so MathJax is downloaded once per run instead of once per rendered page
+_CDN_RESPONSE_CACHE = {}
+
+
+def _serve_cdn_from_cache(route):
+    """Playwright route handler fulfilling CDN requests from the process-wide cache"""
+    url = route.request.url
+    cached = _CDN_RESPONSE_CACHE.get(url)
+    if cached is None:
+        response = route.fetch()
+        cached = (response.status, response.headers, response.body())
+        if response.ok:
+            _CDN_RESPONSE_CACHE[url] = cached
+    status, headers, body = cached
+    route.fulfill(status=status, headers=headers, body=body)
+
+
+async def _serve_cdn_from_cache_async(route):
+    """Async variant of _serve_cdn_from_cache"""
+    url = route.request.url
+    cached = _CDN_RESPONSE_CACHE.get(url)
+    if cached is None:
+        response = await route.fetch()
+        cached = (response.status, response.headers, await response.body())
+        if response.ok:
+            _CDN_RESPONSE_CACHE[url] = cached
+    status, headers, body = cached
+    await route.fulfill(status=status, headers=headers, body=body)
+
+
+async def render_html_to_pdf_async(html_content, output_file, browser, config, _test_mode=False):
+    """Render print HTML to PDF in a fresh context of an already-running async browser (config: math settings)"""
+    context = await browser.new_context()
+    try:
+        await context.route(MATHJAX_CDN_URL_PATTERN, _serve_cdn_from_cache_async)
+        page = await context.new_page()
+        await page.set_viewport_size(PDF_VIEWPORT)
+        await page.set_content(html_content, wait_until='domcontentloaded')
+        await page.wait_for_timeout(1000)
+        
+        # Wait for MathJax if the page loads it - these waits overlap across concurrent renders
+        if config.get('math.enabled', True) and not _test_mode and MATHJAX_CONFIG_MARKER in html_content:
+            math_mode = config.get('math.mode', 'cdn')
+            math_timeout = config.get('math.timeout', 8000)
+            
+            if math_mode in ['local', 'fast']:
+                await page.wait_for_timeout(500)
+            else:
+                try:
+                    await page.wait_for_function(MATHJAX_READY_JS, timeout=math_timeout)
+                except Exception as e:
+                    print(f"Warning: MathJax CDN timeout ({e}), continuing without waiting")
+        
+        await page.pdf(path=output_file, **PDF_PAGE_OPTIONS)
+    finally:
+        await context.close()
+
+
+# Markdown extensions (and their settings) used for slide (and column) content
+SLIDE_MARKDOWN_EXTENSIONS = ['fenced_code', 'tables', 'codehilite', 'extra']
+SLIDE_MARKDOWN_EXTENSION_CONFIGS = {}
+
+# Rendered slide HTML is cached by content hash in a per-user directory (BODH_SLIDE_CACHE=0 disables it)
+SLIDE_CACHE_SUBDIR = ('bodh', 'slides')
+
+# Decks with at least this many slides render markdown in a process pool; smaller ones don't repay the worker startup
+PARALLEL_SLIDE_THRESHOLD = 64
+
+
+# Per-thread Markdown converter, built once and reset between slides instead of per call
+_slide_markdown = threading.local()
+
+
+def _render_slide_markdown(slide_content):
+    """Render one slide's markdown to HTML (top-level so process pool workers can pickle it)"""
+    md = getattr(_slide_markdown, 'converter', None)
+    if md is None:
+        import markdown
+        md = _slide_markdown.converter = markdown.Markdown(extensions=SLIDE_MARKDOWN_EXTENSIONS,
+                                                           extension_configs=SLIDE_MARKDOWN_EXTENSION_CONFIGS)
+    return md.reset().convert(slide_content)
+
+
+def _slide_cache():
+    """Slide cache for this renderer: this module's code, markdown/Pygments versions and the extension setup"""
+    import markdown
+    import pygments
+    key = '|'.join([
+        source_fingerprint(__file__), markdown.__version__, pygments.__version__,
+        json.dumps([SLIDE_MARKDOWN_EXTENSIONS, SLIDE_MARKDOWN_EXTENSION_CONFIGS], sort_keys=True)
+    ])
+    return SlideCache(SLIDE_CACHE_SUBDIR, key)
+
+
+def _render_slides_markdown(slide_contents):
+    """Render slides to HTML in order, reusing cached slides and spreading large decks across CPU cores"""
+    cache = _slide_cache() if os.environ.get('BODH_SLIDE_CACHE', '1') != '0' else None
+    if cache is None:
+        slides = [None] * len(slide_contents)
+    else:
+        slides = [cache.get(slide_content) for slide_content in slide_contents]
+    
+    misses = [i for i, html in enumerate(slides) if html is None]
+    pending = [slide_contents[i] for i in misses]
+    if len(pending) < PARALLEL_SLIDE_THRESHOLD or (os.cpu_count() or 1) < 2:
+        rendered = [_render_slide_markdown(slide_content) for slide_content in pending]
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            rendered = list(executor.map(_render_slide_markdown, pending, chunksize=4))
+    
+    for i, html in zip(misses, rendered):
+        slides[i] = html
+        if cache is not None:
+            cache.put(slide_contents[i], html)
+    if cache is not None:
+        cache.prune()
+    return slides
+
+
+# Per-process LaTeX work directory, created on first use and removed at exit
+_latex_work_dir = None
+_latex_job_ids = itertools.count()
+
+
+def _get_latex_work_dir(configured_dir=None) -> Path:
+    """Return the configured LaTeX work directory, or this process's temporary one"""
+    global _latex_work_dir
+    if configured_dir:
+        work_dir = Path(configured_dir)
+        work_dir.mkdir(parents=True, exist_ok=True)
+        return work_dir
+    if _latex_work_dir is None:
+        _latex_work_dir = Path(tempfile.mkdtemp(prefix='bodh_latex_'))
+        atexit.register(shutil.rmtree, _latex_work_dir, ignore_errors=True)
+    return _latex_work_dir
+
+
+# Compiled template bytecode is kept in a per-user cache directory so re-runs skip the Jinja compile step
+TEMPLATE_BYTECODE_CACHE_SUBDIR = ('bodh', 'jinja')
+
+# Template sources registered by _compile_template, keyed by content hash
+_template_sources = {}
+
+
+def _load_template_source(name):
+    """Loader for templates registered in-process; sources never change under a name"""
+    source = _template_sources.get(name)
+    if source is None:
+        return None
+    return source, None, lambda: True
+
+
+@functools.lru_cache(maxsize=None)
+def _template_environment(**options):
+    """One Jinja2 environment per option set, backed by the on-disk bytecode cache"""
+    from jinja2 import Environment, FileSystemBytecodeCache, FunctionLoader
+    cache_dir = user_cache_dir(*TEMPLATE_BYTECODE_CACHE_SUBDIR)
+    bytecode_cache = FileSystemBytecodeCache(str(cache_dir)) if cache_dir is not None else None
+    return Environment(loader=FunctionLoader(_load_template_source),
+                       bytecode_cache=bytecode_cache, auto_reload=False, **options)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_template(source, **options):
+    """Compile a Jinja2 template once per distinct source and share it across converters"""
+    name = hashlib.sha1(source.encode('utf-8')).hexdigest()
+    _template_sources[name] = source
+    return _template_environment(**options).get_template(name)
+
+
+# A4 landscape at 96 DPI, for consistent rendering
+PDF_VIEWPORT = {"width": 1123, "height": 794}
+
+# PDF options for presentation format - let CSS handle margins
+PDF_PAGE_OPTIONS = {
+    'format': 'A4',
+    'landscape': True,
+    'margin': {'top': '0', 'bottom': '0', 'left': '0', 'right': '0'},
+    'print_background': True,
+    'prefer_css_page_size': True,
+    'display_header_footer': False,
+    'width': '11.7in',  # A4 landscape width
+    'height': '8.3in'   # A4 landscape height
+}
+
+MATHJAX_READY_JS = """
+    () => {
+        return window.MathJax && window.MathJax.startup && window.MathJax.startup.document.state() >= 6;
+    }
+"""
+
+
+@functools.lru_cache(maxsize=32)
+def _read_text(path, mtime_ns):
+    """Read a text file once per modification time"""
+    return Path(path).read_text(encoding='utf-8')
 
 
+def _read_text_cached(path):
+    """Read a theme or template file, shared across converters until the file changes"""
+    path = os.path.abspath(path)
+    return _read_text(path, os.stat(path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=64)
+def _read_base64(path, mtime_ns):
+    """Base64-encode a file straight from a read-only mapping, once per modification time"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ''
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return base64.b64encode(mm).decode('ascii')
+
+
+def _read_base64_cached(path):
+    """Base64 contents of an image, shared across slides and builds until the file changes"""
+    path = os.path.abspath(path)
+    return _read_base64(path, os.stat(path).st_mtime_ns)
+
 
 class ThemeLoader:
     def __init__(self, themes_dir="themes"):
@@ -30,18 +401,21 @@ class ThemeLoader:
         self._themes_cache = {}
     
     def load_theme(self, theme_name):
-        """Load theme configuration from JSON file"""
-        if theme_name in self._themes_cache:
-            return self._themes_cache[theme_name]
-        
+        """Load theme configuration from JSON file, re-parsing it only after the file changes"""
         theme_file = self.themes_dir / f"{theme_name}.json"
-        if not theme_file.exists():
-            raise FileNotFoundError(f"Theme '{theme_name}' not found at {theme_file}")
+        try:
+            mtime_ns = theme_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Theme '{theme_name}' not found at {theme_file}") from None
+        
+        # One (mtime, data) entry per theme name, so an edited theme replaces its stale entry
+        cached = self._themes_cache.get(theme_name)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
         
-        with open(theme_file, 'r') as f:
-            theme_data = json.load(f)
+        theme_data = _json_loads(_read_text(os.path.abspath(theme_file), mtime_ns))
         
-        self._themes_cache[theme_name] = theme_data
+        self._themes_cache[theme_name] = (mtime_ns, theme_data)
         return theme_data
     
     def list_themes(self):
@@ -72,8 +446,7 @@ class StyleGenerator:
         if not css_template_path.exists():
             raise FileNotFoundError(f"CSS template not found at {css_template_path}")
         
-        with open(css_template_path, 'r') as f:
-            css_content = f.read()
+        css_content = _read_text_cached(css_template_path)
         
         # Calculate font sizes based on config
         base_size = font_size or 20
@@ -93,7 +466,7 @@ class StyleGenerator:
             'text': text_size / base_size if text_size else 1.2
         }
         
-        template = Template(css_content)
+        template = _compile_template(css_content)
         return template.render(
             theme=theme_data,
             font_family=font_family,
@@ -143,6 +516,8 @@ class MarkdownToPDF:
         
         # Get optimized font CSS
         self.font_css = self.font_manager.get_optimized_font_css(self.font_family)
+        # Query-string form of the family for the web font link, encoded once per converter
+        self._font_family_url = quote_plus(self.font_family)
         
         self.template = self._get_html_template()
         self.mock_mathjax_js = self._get_mock_mathjax_js()
@@ -214,10 +589,9 @@ class MarkdownToPDF:
             else:
                 mime_type = 'image/png'  # Default fallback
                 
-            with open(full_path, 'rb') as img_file:
-                data = base64.b64encode(img_file.read()).decode('utf-8')
-                print(f"Successfully encoded image: {len(data)} characters, MIME: {mime_type}")
-                return {'data': data, 'mime_type': mime_type}
+            data = _read_base64_cached(full_path)
+            print(f"Successfully encoded image: {len(data)} characters, MIME: {mime_type}")
+            return {'data': data, 'mime_type': mime_type}
         except Exception as e:
             print(f"Warning: Could not load image {image_path}: {e}")
             return None
@@ -251,6 +625,15 @@ class MarkdownToPDF:
             print(f"Warning: Could not convert PDF {pdf_path}: {e}")
             return None
     
+    def slide_parse_key(self):
+        """Settings that affect parse_markdown_slides output; converters with equal keys can share parsed slides"""
+        return (
+            self.slide_separator,
+            self.config.get('overlays.enabled', False),
+            self.config.get('style.hrule.enabled', False) or
+            self.theme_data.get('special_features', {}).get('title_hrule', False)
+        )
+    
     def parse_markdown_slides(self, md_content, base_dir=None):
         """Parse markdown content into individual slides with advanced features"""
         slides = []
@@ -276,13 +659,10 @@ class MarkdownToPDF:
                    self.theme_data.get('special_features', {}).get('title_hrule', False):
                     slide_content = self._process_hrules(slide_content)
                 
-                html_content = markdown.markdown(
-                    slide_content.strip(), 
-                    extensions=['fenced_code', 'tables', 'codehilite', 'extra']
-                )
-                slides.append(html_content)
+                slides.append(slide_content.strip())
         
-        return slides
+        # Markdown rendering has no cross-slide state, so large decks render in parallel
+        return _render_slides_markdown(slides)
     
     def _validate_slide_content(self, content, slide_number):
         """Validate slide content and warn about potential issues"""
@@ -342,7 +722,6 @@ class MarkdownToPDF:
         # Look for column separators with various formats
         if ':::' in content:
             # Handle both `::: {.column}` and `:::` formats
-            import re
             
             # Pattern to match ::: {.column} content :::
             column_pattern = r'::: \{\.column\}(.*?):::'
@@ -354,10 +733,7 @@ class MarkdownToPDF:
                 for match in matches:
                     if match.strip():
                         # CRITICAL FIX: Process column content as markdown!
-                        column_html = markdown.markdown(
-                            match.strip(), 
-                            extensions=['fenced_code', 'tables', 'codehilite', 'extra']
-                        )
+                        column_html = _render_slide_markdown(match.strip())
                         column_content.append(f'<div class="column">{column_html}</div>')
                 
                 if column_content:
@@ -374,10 +750,7 @@ class MarkdownToPDF:
                     for i in range(1, len(parts), 2):  # Take every second part (content)
                         if parts[i].strip():
                             # CRITICAL FIX: Process column content as markdown!
-                            column_html = markdown.markdown(
-                                parts[i].strip(), 
-                                extensions=['fenced_code', 'tables', 'codehilite', 'extra']
-                            )
+                            column_html = _render_slide_markdown(parts[i].strip())
                             column_content.append(f'<div class="column">{column_html}</div>')
                     
                     if column_content:
@@ -389,8 +762,6 @@ class MarkdownToPDF:
     
     def _process_images(self, content, base_dir=None):
         """Process images in markdown content, converting to base64 data URLs"""
-        import re
-        
         # Pattern to match markdown images: ![alt text](image_path)
         image_pattern = r'!\[([^\]]*)\]\(([^)]+)\)'
         
@@ -436,7 +807,7 @@ class MarkdownToPDF:
     
     def _get_html_template(self):
         """HTML template for the presentation"""
-        return Template("""
+        return _compile_template("""
 <!DOCTYPE html>
 <html>
 <head>
@@ -447,9 +818,9 @@ class MarkdownToPDF:
         {{ font_css }}
     </style>
     {% else %}
-    <link href="https://fonts.googleapis.com/css2?family={{ font_family.replace(' ', '+') }}:wght@300;400;600;700&display=swap" rel="stylesheet">
+    <link href="https://fonts.googleapis.com/css2?family={{ font_family_url or font_family | urlencode }}:wght@300;400;600;700&display=swap" rel="stylesheet">
     {% endif %}
-    {% if config.get('math.enabled', True) %}
+    {% if (has_math if has_math is defined else config.get('math.enabled', True)) %}
     {% set math_mode = config.get('math.mode', 'cdn') %}
     {% if math_mode == 'local' or use_local_mathjax %}
     <script>
@@ -505,7 +876,7 @@ class MarkdownToPDF:
     {% endif %}
     
     {% for slide in slides %}
-    <div class="slide{% if enable_navigation and loop.first %} active{% endif %}">
+    <div class="slide{{ ' active' if enable_navigation and loop.first else '' }}">
         {% if logo_data %}
         <div class="logo logo-{{ logo_position }}">
             <img src="data:{{ logo_mime_type }};base64,{{ logo_data }}" alt="Logo">
@@ -523,7 +894,7 @@ class MarkdownToPDF:
             {{ slide | safe }}
         </div>
     </div>
-    {% if not loop.last %}<div class="page-break"></div>{% endif %}
+    {{ '' if loop.last else '<div class="page-break"></div>' }}
     {% endfor %}
     
     {% if enable_navigation %}
@@ -541,7 +912,7 @@ class MarkdownToPDF:
         {% if show_dots %}
         <div class="slide-dots" id="slide-dots">
             {% for slide in slides %}
-            <div class="dot{% if loop.first %} active{% endif %}" onclick="goToSlide({{ loop.index0 }})"></div>
+            <div class="dot{{ ' active' if loop.first else '' }}" onclick="goToSlide({{ loop.index0 }})"></div>
             {% endfor %}
         </div>
         {% endif %}
@@ -725,29 +1096,19 @@ class MarkdownToPDF:
     {% endif %}
 </body>
 </html>
-        """)
+        """, trim_blocks=True, lstrip_blocks=True)
     
-    def convert_to_pdf(self, markdown_file, output_file=None, _test_mode=False):
-        """Convert markdown file to PDF presentation"""
-        if not os.path.exists(markdown_file):
-            raise FileNotFoundError(f"Markdown file not found: {markdown_file}")
-        
-        # Check if LaTeX mode is enabled and available
-        pdf_engine = self.config.get('pdf.engine', 'playwright')
-        if pdf_engine == 'latex' and self.latex_available:
-            return self._convert_to_pdf_latex(markdown_file, output_file)
-        elif pdf_engine == 'latex' and not self.latex_available:
-            print("Warning: LaTeX mode requested but LaTeX not available, falling back to Playwright")
-        
-        # Read markdown content
-        with open(markdown_file, 'r', encoding='utf-8') as f:
-            md_content = f.read()
-        
-        # CRITICAL FIX: Get base directory for image resolution
-        base_dir = os.path.dirname(os.path.abspath(markdown_file))
-        
-        # Parse slides
-        slides = self.parse_markdown_slides(md_content, base_dir)
+    def _load_presentation(self, markdown_file, slides=None):
+        """Read and parse a markdown file (unless slides are given); returns (slides, logo_data, logo_mime_type, title)"""
+        if slides is None:
+            # Read markdown content
+            md_content = read_markdown(markdown_file)
+            
+            # CRITICAL FIX: Get base directory for image resolution
+            base_dir = os.path.dirname(os.path.abspath(markdown_file))
+            
+            # Parse slides
+            slides = self.parse_markdown_slides(md_content, base_dir)
         
         if not slides:
             raise ValueError("No slides found in markdown file")
@@ -761,114 +1122,109 @@ class MarkdownToPDF:
                 logo_data = logo_result['data']
                 logo_mime_type = logo_result['mime_type']
         
-        # Calculate initial slide number display (for PDF we don't need it, but template expects it)
-        initial_slide_number = '1'
+        return slides, logo_data, logo_mime_type, Path(markdown_file).stem
+    
+    def _render_presentation_html(self, presentation, for_pdf=False, _test_mode=False):
+        """Render a loaded presentation as navigable HTML, or as print HTML for PDF output"""
+        slides, logo_data, logo_mime_type, title = presentation
+        
+        if for_pdf:
+            # Calculate initial slide number display (for PDF we don't need it, but template expects it)
+            initial_slide_number = '1'
+            slide_number_format = '{current}/{total}'
+        else:
+            # Calculate initial slide number display
+            slide_number_format = self.config.get_slide_number_format()
+            initial_slide_number = slide_number_format.replace('{current}', '1').replace('{total}', str(len(slides)))
+            if '{percent}' in initial_slide_number:
+                initial_percent = round((1 / len(slides)) * 100)
+                initial_slide_number = initial_slide_number.replace('{percent}', str(initial_percent))
         
         # Generate HTML
-        title = Path(markdown_file).stem
-        html_content = self.template.render(
+        return self.template.render(
             title=title,
             slides=slides,
             css=self.css,
             font_family=self.font_family,
+            font_family_url=self._font_family_url,
             font_css=self.font_css,
             logo_data=logo_data,
             logo_mime_type=logo_mime_type,
             logo_position=self.logo_position,
-            enable_navigation=False,
-            show_arrows=False,
-            show_dots=False,
-            show_slide_numbers=True,
-            slide_number_format='{current}/{total}',
+            enable_navigation=not for_pdf and self.config.get('navigation.enabled', True),
+            show_arrows=not for_pdf and self.config.get('navigation.show_arrows', True),
+            show_dots=not for_pdf and self.config.get('navigation.show_dots', True),
+            show_slide_numbers=for_pdf or self.config.get('slide_number.enabled', True),
+            slide_number_format=slide_number_format,
             initial_slide_number=initial_slide_number,
             config=self.config,
+            has_math=self.config.get('math.enabled', True) and _slides_have_math(slides),
             use_local_mathjax=_test_mode,
             mock_mathjax_js=self.mock_mathjax_js,
             local_mathjax_js=self.local_mathjax_js
         )
+    
+    def _build_pdf_html(self, markdown_file, _test_mode=False, slides=None):
+        """Render the print (non-navigable) HTML used for PDF output; returns (html, title)"""
+        presentation = self._load_presentation(markdown_file, slides)
+        return self._render_presentation_html(presentation, for_pdf=True, _test_mode=_test_mode), presentation[3]
+    
+    def convert_to_pdf(self, markdown_file, output_file=None, _test_mode=False, browser=None, slides=None):
+        """Convert markdown file to PDF presentation (slides: output of parse_markdown_slides to skip re-parsing)"""
+        if not os.path.exists(markdown_file):
+            raise FileNotFoundError(f"Markdown file not found: {markdown_file}")
+        
+        # Check if LaTeX mode is enabled and available
+        pdf_engine = self.config.get('pdf.engine', 'playwright')
+        if pdf_engine == 'latex' and self.latex_available:
+            return self._convert_to_pdf_latex(markdown_file, output_file)
+        elif pdf_engine == 'latex' and not self.latex_available:
+            print("Warning: LaTeX mode requested but LaTeX not available, falling back to Playwright")
+        
+        html_content, title = self._build_pdf_html(markdown_file, _test_mode, slides)
         
         # Generate PDF
         if output_file is None:
             output_file = f"{title}.pdf"
         
+        self._write_pdf_from_html(html_content, output_file, _test_mode, browser)
+        
+        return output_file
+    
+    def convert_string_to_pdf(self, md_content, output_file, base_dir=None, title='presentation',
+                              _test_mode=False, browser=None, slides=None):
+        """Convert markdown text already in memory to PDF, without a temporary markdown file"""
+        pdf_engine = self.config.get('pdf.engine', 'playwright')
+        if pdf_engine == 'latex' and self.latex_available:
+            return self._convert_to_pdf_latex(title, output_file, md_content=md_content)
+        elif pdf_engine == 'latex' and not self.latex_available:
+            print("Warning: LaTeX mode requested but LaTeX not available, falling back to Playwright")
+        
+        if slides is None:
+            slides = self.parse_markdown_slides(md_content, base_dir)
+        
+        presentation = self._load_presentation(title, slides)
+        html_content = self._render_presentation_html(presentation, for_pdf=True, _test_mode=_test_mode)
+        self._write_pdf_from_html(html_content, output_file, _test_mode, browser)
+        
+        return output_file
+    
+    def _write_pdf_from_html(self, html_content, output_file, _test_mode=False, browser=None):
+        """Write rendered print HTML to a PDF with the selected PDF backend"""
         # Determine PDF backend to use
         current_pdf_backend = os.environ.get('BODH_PDF_BACKEND', 'playwright') # Default to playwright
 
         if current_pdf_backend == 'playwright':
             # Use Playwright (Chrome) for best PDF quality - identical to HTML preview
-            with sync_playwright() as p:
-                # Launch browser with CI-friendly options
-                browser_options = {
-                    'headless': True,
-                    'args': [
-                        '--no-sandbox',
-                        '--disable-setuid-sandbox',
-                        '--disable-dev-shm-usage',
-                        '--disable-gpu',
-                        '--no-first-run',
-                        '--no-default-browser-check',
-                        '--disable-default-apps',
-                        '--disable-translate',
-                        '--disable-extensions',
-                        '--disable-background-timer-throttling',
-                        '--disable-backgrounding-occluded-windows',
-                        '--disable-renderer-backgrounding',
-                        '--disable-features=TranslateUI',
-                        '--disable-ipc-flooding-protection'
-                    ]
-                }
-                browser = p.chromium.launch(**browser_options)
-                page = browser.new_page()
-                
-                # Set viewport to match A4 landscape dimensions for consistent rendering
-                page.set_viewport_size({"width": 1123, "height": 794})  # A4 landscape at 96 DPI
-                
-                # Load content - since fonts are embedded, we can load much faster
-                page.set_content(html_content, wait_until='domcontentloaded')
-                
-                # Much shorter wait since fonts are embedded and don't need network loading
-                page.wait_for_timeout(1000)  # Reduced timeout since fonts are embedded
-                
-                # Wait for MathJax if enabled, with configurable timeout and fallback handling
-                if self.config.get('math.enabled', True) and not _test_mode:
-                    math_mode = self.config.get('math.mode', 'cdn')
-                    math_timeout = self.config.get('math.timeout', 8000)
-                    
-                    if math_mode in ['local', 'fast']:
-                        # Local/fast mode - minimal wait
-                        page.wait_for_timeout(500)
-                        print(f"Using {math_mode} MathJax mode - fast rendering")
-                    else:
-                        # CDN mode - wait for full loading
-                        try:
-                            print(f"Waiting for MathJax CDN (timeout: {math_timeout}ms)...")
-                            page.wait_for_function("""
-                                () => {
-                                    return window.MathJax && window.MathJax.startup && window.MathJax.startup.document.state() >= 6;
-                                }
-                            """, timeout=math_timeout)
-                            print("MathJax loaded successfully")
-                        except Exception as e:
-                            fallback = self.config.get('math.fallback', 'local')
-                            print(f"Warning: MathJax CDN timeout ({e})")
-                            if fallback != 'disabled':
-                                print(f"Continuing with {fallback} fallback...")
-                            else:
-                                print("No fallback enabled, continuing without math rendering")
-                
-                # PDF options for presentation format - let CSS handle margins
-                page.pdf(
-                    path=output_file,
-                    format='A4',
-                    landscape=True,
-                    margin={'top': '0', 'bottom': '0', 'left': '0', 'right': '0'},
-                    print_background=True,
-                    prefer_css_page_size=True,
-                    display_header_footer=False,
-                    width='11.7in',  # A4 landscape width
-                    height='8.3in'   # A4 landscape height
-                )
-                browser.close()
+            if browser is not None:
+                # Reuse the caller's browser - no Chromium startup cost
+                self._render_pdf_with_browser(html_content, output_file, browser, _test_mode)
+            else:
+                from playwright.sync_api import sync_playwright
+                with sync_playwright() as p:
+                    browser = p.chromium.launch(**BROWSER_LAUNCH_OPTIONS)
+                    self._render_pdf_with_browser(html_content, output_file, browser, _test_mode)
+                    browser.close()
         elif current_pdf_backend == 'weasyprint':
             # Use WeasyPrint for better CSS support and quality
             try:
@@ -894,163 +1250,195 @@ class MarkdownToPDF:
                     raise Exception("PDF generation failed")
             except ImportError as e:
                 raise Exception(f"xhtml2pdf backend selected but not available: {e}")
+    
+    def _render_pdf_with_browser(self, html_content, output_file, browser, _test_mode=False):
+        """Render HTML to PDF in a fresh context of an already-running browser"""
+        context = browser.new_context()
+        try:
+            context.route(MATHJAX_CDN_URL_PATTERN, _serve_cdn_from_cache)
+            page = context.new_page()
+            
+            # Set viewport to match A4 landscape dimensions for consistent rendering
+            page.set_viewport_size(PDF_VIEWPORT)
+            
+            # Load content - since fonts are embedded, we can load much faster
+            page.set_content(html_content, wait_until='domcontentloaded')
+            
+            # Much shorter wait since fonts are embedded and don't need network loading
+            page.wait_for_timeout(1000)  # Reduced timeout since fonts are embedded
+            
+            # Wait for MathJax if the page loads it, with configurable timeout and fallback handling
+            if self.config.get('math.enabled', True) and not _test_mode and MATHJAX_CONFIG_MARKER in html_content:
+                math_mode = self.config.get('math.mode', 'cdn')
+                math_timeout = self.config.get('math.timeout', 8000)
+                
+                if math_mode in ['local', 'fast']:
+                    # Local/fast mode - minimal wait
+                    page.wait_for_timeout(500)
+                    print(f"Using {math_mode} MathJax mode - fast rendering")
+                else:
+                    # CDN mode - wait for full loading
+                    try:
+                        print(f"Waiting for MathJax CDN (timeout: {math_timeout}ms)...")
+                        page.wait_for_function(MATHJAX_READY_JS, timeout=math_timeout)
+                        print("MathJax loaded successfully")
+                    except Exception as e:
+                        fallback = self.config.get('math.fallback', 'local')
+                        print(f"Warning: MathJax CDN timeout ({e})")
+                        if fallback != 'disabled':
+                            print(f"Continuing with {fallback} fallback...")
+                        else:
+                            print("No fallback enabled, continuing without math rendering")
+            
+            # PDF options for presentation format - let CSS handle margins
+            page.pdf(path=output_file, **PDF_PAGE_OPTIONS)
+        finally:
+            context.close()
+    
+    async def convert_to_pdf_async(self, markdown_file, output_file, browser, _test_mode=False):
+        """Convert markdown file to PDF with an async Playwright browser, so many renders can overlap"""
+        if not os.path.exists(markdown_file):
+            raise FileNotFoundError(f"Markdown file not found: {markdown_file}")
+        
+        html_content, title = self._build_pdf_html(markdown_file, _test_mode)
+        if output_file is None:
+            output_file = f"{title}.pdf"
         
+        await self._render_pdf_with_browser_async(html_content, output_file, browser, _test_mode)
         return output_file
     
-    def _convert_to_pdf_latex(self, markdown_file, output_file=None):
-        """Convert markdown to PDF using LaTeX backend"""
-        # Read markdown content with error handling
-        try:
-            with open(markdown_file, 'r', encoding='utf-8') as f:
-                md_content = f.read()
-        except UnicodeDecodeError:
-            # Fallback to reading with error handling
-            with open(markdown_file, 'r', encoding='utf-8', errors='replace') as f:
-                md_content = f.read()
+    async def _render_pdf_with_browser_async(self, html_content, output_file, browser, _test_mode=False):
+        """Render HTML to PDF in a fresh context of an already-running async browser"""
+        await render_html_to_pdf_async(html_content, output_file, browser, self.config, _test_mode)
+    
+    def _convert_to_pdf_latex(self, markdown_file, output_file=None, md_content=None):
+        """Convert markdown to PDF using LaTeX backend (md_content skips reading markdown_file)"""
+        if md_content is None:
+            # Read markdown content with error handling
+            try:
+                md_content = read_markdown(markdown_file)
+            except UnicodeDecodeError:
+                # Fallback to reading with error handling
+                md_content = read_markdown(markdown_file, errors='replace')
         
         # Convert markdown to LaTeX
         latex_content = self._markdown_to_latex(md_content)
         
-        # Compile with LaTeX
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            tex_file = temp_path / "presentation.tex"
-            
-            # Write LaTeX file with error handling
-            try:
-                with open(tex_file, 'w', encoding='utf-8') as f:
-                    f.write(latex_content)
-            except UnicodeEncodeError:
-                # Fallback with error handling
-                with open(tex_file, 'w', encoding='utf-8', errors='replace') as f:
-                    f.write(latex_content)
+        # Compile with LaTeX in a work directory reused across conversions; the job name
+        # keeps files of different documents (and processes) apart
+        work_dir = _get_latex_work_dir(self.config.get('pdf.latex_work_dir'))
+        stem = Path(markdown_file).stem
+        jobname = f"{stem}-{os.getpid()}-{next(_latex_job_ids)}"
+        tex_file = os.path.join(work_dir, jobname + ".tex")
+        log_file = tex_file[:-4] + ".log"
+        
+        # Write LaTeX file with error handling
+        try:
+            with open(tex_file, 'w', encoding='utf-8') as f:
+                f.write(latex_content)
+        except UnicodeEncodeError:
+            # Fallback with error handling
+            with open(tex_file, 'w', encoding='utf-8', errors='replace') as f:
+                f.write(latex_content)
+        
+        try:
+            # Run the LaTeX engine
+            latex_engine = self.config.get('pdf.latex_engine', 'pdflatex')
+            passes = self.config.get('pdf.latex_passes', 2)
             
-            try:
-                # Run pdflatex
-                latex_engine = self.config.get('pdf.latex_engine', 'pdflatex')
-                passes = self.config.get('pdf.latex_passes', 2)
+            if latex_engine == 'tectonic':
+                # tectonic is one self-contained binary with fast startup that reruns itself as needed
+                result = subprocess.run([
+                    'tectonic',
+                    '--keep-logs',
+                    '--outdir', str(work_dir),
+                    tex_file
+                ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=60)
+                
+                print(f"tectonic returncode: {result.returncode}")
                 
+                if result.returncode != 0:
+                    log_text = read_latex_log(log_file)
+                    print("LaTeX compilation failed with tectonic")
+                    print("LOG:", log_text[-500:])
+                    return False
+            else:
+                # Later passes only resolve references, so rerun only when LaTeX asks for it
                 for pass_num in range(passes):
                     result = subprocess.run([
                         latex_engine,
-                        '-interaction=nonstopmode',
-                        '-output-directory', str(temp_path),
-                        str(tex_file)
-                    ], capture_output=True, text=True, timeout=30, encoding='utf-8', errors='replace')
+                        '-interaction=batchmode',
+                        '-no-shell-escape',
+                        '-file-line-error',
+                        '-output-directory', str(work_dir),
+                        tex_file
+                    ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30)
+                    
+                    # Terminal output is discarded; the log has the details
+                    log_text = read_latex_log(log_file)
                     
                     print(f"LaTeX pass {pass_num + 1} returncode: {result.returncode}")
                     
                     # Check if LaTeX actually failed (no PDF output) vs just warnings
                     if result.returncode != 0:
                         # LaTeX can return non-zero but still generate PDF with warnings
-                        # Check if "Output written" appears in stdout indicating successful PDF generation
-                        if "Output written" not in result.stdout:
+                        # Check if "Output written" appears in the log indicating successful PDF generation
+                        if "Output written" not in log_text:
                             print(f"LaTeX compilation failed on pass {pass_num + 1}")
-                            print("STDOUT:", result.stdout[-500:])
-                            print("STDERR:", result.stderr[-500:])
+                            print("LOG:", log_text[-500:])
                             return False
                         else:
                             print(f"LaTeX pass {pass_num + 1} completed with warnings (return code {result.returncode})")
                     else:
                         print(f"LaTeX pass {pass_num + 1} completed successfully")
-                
-                # Copy output PDF
-                generated_pdf = temp_path / "presentation.pdf"
-                if generated_pdf.exists():
-                    if output_file is None:
-                        output_file = Path(markdown_file).stem + ".pdf"
                     
+                    if not LATEX_RERUN_NEEDED.search(log_text):
+                        break
+            
+            # Copy output PDF
+            generated_pdf = tex_file[:-4] + ".pdf"
+            if os.path.isfile(generated_pdf):
+                if output_file is None:
+                    output_file = stem + ".pdf"
+                
+                try:
+                    # Metadata-only rename when the work directory shares the output's filesystem
+                    os.replace(generated_pdf, output_file)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
                     shutil.copy2(generated_pdf, output_file)
-                    print(f"Generated: {output_file} (using {latex_engine})")
-                    return True
-                else:
-                    print("LaTeX compilation succeeded but no PDF generated")
-                    return False
-                    
-            except subprocess.TimeoutExpired:
-                print("LaTeX compilation timed out")
-                return False
-            except Exception as e:
-                print(f"LaTeX compilation error: {e}")
-                import traceback
-                traceback.print_exc()
+                print(f"Generated: {output_file} (using {latex_engine})")
+                return True
+            else:
+                print("LaTeX compilation succeeded but no PDF generated")
                 return False
-    
+                
+        except subprocess.TimeoutExpired:
+            print("LaTeX compilation timed out")
+            return False
+        except Exception as e:
+            print(f"LaTeX compilation error: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+        finally:
+            # Remove this job's files (.tex/.aux/.log/.pdf); the directory itself is reused
+            for job_file in work_dir.glob(f"{jobname}.*"):
+                job_file.unlink(missing_ok=True)
+
     def _markdown_to_latex(self, md_content: str) -> str:
         """Convert markdown content to LaTeX document"""
         # Get theme colors
-        theme = self.theme_data
-        colors = theme.get('colors', {})
-        
-        # Convert hex colors to LaTeX RGB (integer values 0-255)
-        def hex_to_rgb(hex_color):
-            hex_color = hex_color.lstrip('#')
-            if len(hex_color) != 6:
-                return "0,0,0"
-            try:
-                r = int(hex_color[0:2], 16)
-                g = int(hex_color[2:4], 16)
-                b = int(hex_color[4:6], 16)
-                return f"{r},{g},{b}"
-            except ValueError:
-                return "0,0,0"
-        
-        bg_color = hex_to_rgb(colors.get('background', '#ffffff'))
-        text_color = hex_to_rgb(colors.get('text', '#000000'))
-        accent_color = hex_to_rgb(colors.get('accent', '#2563eb'))
-        
-        # Split into slides - but only on standalone slide separators, not table separators
-        import re
-        # Split on '---' that are on their own line (slide separators)
-        # but not on '---' inside table rows like |---------|
-        slides = re.split(r'\n---\n', md_content)
-        slides = [slide.strip() for slide in slides if slide.strip()]
+        colors = self.theme_data.get('colors', {})
+        
+        # Split into slides - only on '---' lines, not table rows like |---------| or code blocks
+        slides = list(self._iter_latex_slides(md_content))
         
         # Generate LaTeX document
-        latex_doc = f"""\\documentclass[11pt]{{article}}
-
-% Packages
-\\usepackage[landscape,margin=0.5in]{{geometry}}
-\\usepackage[utf8]{{inputenc}}
-\\usepackage[T1]{{fontenc}}
-\\usepackage{{xcolor}}
-\\usepackage{{amsmath}}
-\\usepackage{{amsfonts}}
-\\usepackage{{amssymb}}
-\\usepackage{{enumitem}}
-\\usepackage{{listings}}
-\\usepackage{{graphicx}}
-\\usepackage{{fancyhdr}}
-\\usepackage{{multicol}}
-
-% Colors
-\\definecolor{{bgcolor}}{{RGB}}{{{bg_color}}}
-\\definecolor{{textcolor}}{{RGB}}{{{text_color}}}
-\\definecolor{{accentcolor}}{{RGB}}{{{accent_color}}}
-
-% Page setup
-\\pagecolor{{bgcolor}}
-\\color{{textcolor}}
-\\pagestyle{{empty}}
-
-% Commands
-\\newcommand{{\\slidetitle}}[1]{{%
-  \\begin{{center}}
-  \\textcolor{{accentcolor}}{{\\huge\\textbf{{#1}}}}
-  \\end{{center}}
-  \\vspace{{0.5cm}}
-}}
-
-% Math setup
-\\everymath{{\\displaystyle}}
-
-% List styling
-\\setlist[itemize]{{leftmargin=1cm,itemsep=0.3cm}}
-\\renewcommand{{\\labelitemi}}{{\\textcolor{{accentcolor}}{{\\textbullet}}}}
-
-\\begin{{document}}
-
-"""
+        parts = [_latex_preamble(colors.get('background', '#ffffff'),
+                                 colors.get('text', '#000000'),
+                                 colors.get('accent', '#2563eb'))]
         
         for i, slide in enumerate(slides):
             # Extract title and content
@@ -1066,44 +1454,57 @@ class MarkdownToPDF:
             
             # Add slide
             if title:
-                latex_doc += f"\\slidetitle{{{title}}}\n\n"
+                parts.append(f"\\slidetitle{{{title}}}\n\n")
             
             # Process content
             content = '\n'.join(content_lines)
             content = self._convert_markdown_content_to_latex(content)
-            latex_doc += content + "\n\n"
+            parts.append(content)
+            parts.append("\n\n")
             
             # Add slide number
-            latex_doc += f"\\vfill\n\\begin{{flushright}}\n\\textcolor{{gray}}{{\\small {i+1}/{len(slides)}}}\n\\end{{flushright}}\n\n"
+            parts.append(f"\\vfill\n\\begin{{flushright}}\n\\textcolor{{gray}}{{\\small {i+1}/{len(slides)}}}\n\\end{{flushright}}\n\n")
             
             # Page break (except for last slide)
             if i < len(slides) - 1:
-                latex_doc += "\\newpage\n\n"
+                parts.append("\\newpage\n\n")
         
-        latex_doc += "\\end{document}"
-        return latex_doc
+        parts.append(LATEX_POSTAMBLE)
+        return ''.join(parts)
+    
+    @staticmethod
+    def _iter_latex_slides(md_content: str):
+        """Yield stripped, non-empty slides, scanning separators lazily and skipping fenced code"""
+        start = 0
+        for match in _LATEX_SLIDE_SEPARATOR.finditer(md_content):
+            if match.group('sep') is None:
+                continue  # '---' inside a fenced code block
+            slide = md_content[start:match.start()].strip()
+            if slide:
+                yield slide
+            start = match.end()
+        
+        slide = md_content[start:].strip()
+        if slide:
+            yield slide
     
     def _convert_columns_to_latex(self, content: str) -> str:
         """Convert multi-column layout syntax to LaTeX"""
-        import re
-        
         # Handle the multi-column container
-        content = re.sub(r':::: columns\s*\n', r'\\begin{multicols}{2}\n', content)
-        content = re.sub(r'\n::::\s*\n', r'\n\\end{multicols}\n', content)
-        content = re.sub(r'\n::::\s*$', r'\n\\end{multicols}', content)
+        content = _LATEX_COLUMNS_OPEN.sub(r'\\begin{multicols}{2}\n', content)
+        content = _LATEX_COLUMNS_CLOSE.sub(r'\n\\end{multicols}\n', content)
+        content = _LATEX_COLUMNS_CLOSE_END.sub(r'\n\\end{multicols}', content)
         
         # Handle column divisions
-        content = re.sub(r'::: left\s*\n', r'', content)  # Remove left marker
-        content = re.sub(r'\n:::\s*\n', r'\n\\columnbreak\n', content)  # Column break
-        content = re.sub(r'::: right\s*\n', r'', content)  # Remove right marker
-        content = re.sub(r'\n:::\s*$', r'', content)  # Remove final column marker
+        content = _LATEX_COLUMN_LEFT.sub(r'', content)  # Remove left marker
+        content = _LATEX_COLUMN_BREAK.sub(r'\n\\columnbreak\n', content)  # Column break
+        content = _LATEX_COLUMN_RIGHT.sub(r'', content)  # Remove right marker
+        content = _LATEX_COLUMN_END.sub(r'', content)  # Remove final column marker
         
         return content
     
     def _convert_markdown_content_to_latex(self, content: str) -> str:
         """Convert markdown content to LaTeX"""
-        import re
-        
         # Handle Unicode characters first
         content = self._handle_unicode_for_latex(content)
         
@@ -1111,61 +1512,38 @@ class MarkdownToPDF:
         content = self._convert_columns_to_latex(content)
         
         # Handle math (already in LaTeX format, just fix display math)
-        content = re.sub(r'\$\$(.+?)\$\$', r'\\\\[\\1\\\\]', content, flags=re.DOTALL)
+        content = _LATEX_DISPLAY_MATH.sub(r'\\\\[\\1\\\\]', content)
         
         # Headers
-        content = re.sub(r'^### (.+)$', r'\\textbf{\\Large \1}\\\\[0.3cm]', content, flags=re.MULTILINE)
-        content = re.sub(r'^## (.+)$', r'\\textbf{\\huge \1}\\\\[0.5cm]', content, flags=re.MULTILINE)
+        content = _H3.sub(r'\\textbf{\\Large \1}\\\\[0.3cm]', content)
+        content = _H2.sub(r'\\textbf{\\huge \1}\\\\[0.5cm]', content)
         
         # Bold and italic - fix escaping
-        content = re.sub(r'\*\*(.+?)\*\*', r'\\textbf{\1}', content)
-        content = re.sub(r'\*([^*]+?)\*', r'\\textit{\1}', content)
+        content = _BOLD.sub(r'\\textbf{\1}', content)
+        content = _ITAL.sub(r'\\textit{\1}', content)
         
         # Tables BEFORE list processing to avoid interference
         content = self._convert_tables_to_latex(content)
         
         # Lists
-        content = re.sub(r'^- (.+)$', r'\\item \1', content, flags=re.MULTILINE)
+        content = _LIST_ITEM.sub(r'\\item \1', content)
         
         # Wrap lists in itemize environment
-        lines = content.split('\n')
-        in_list = False
-        result_lines = []
-        
-        for line in lines:
-            if line.strip().startswith('\\item'):
-                if not in_list:
-                    result_lines.append('\\begin{itemize}')
-                    in_list = True
-                result_lines.append(line)
-            else:
-                if in_list:
-                    result_lines.append('\\end{itemize}')
-                    in_list = False
-                result_lines.append(line)
-        
-        if in_list:
-            result_lines.append('\\end{itemize}')
-        
-        content = '\n'.join(result_lines)
+        content = _LIST_ITEM_RUN.sub(_wrap_itemize, content)
         
         # Code blocks
-        content = re.sub(r'```(\w+)?\n(.+?)\n```', 
-                        r'\\begin{lstlisting}\n\\2\n\\end{lstlisting}', 
-                        content, flags=re.DOTALL)
+        content = _CODE_BLOCK.sub(r'\\begin{lstlisting}\n\\2\n\\end{lstlisting}', content)
         
         # Inline code
-        content = re.sub(r'`(.+?)`', r'\\texttt{\\1}', content)
+        content = _INLINE_CODE.sub(r'\\texttt{\\1}', content)
         
         # Paragraphs
-        content = re.sub(r'\n\n', r'\\\\\n', content)
+        content = _PARAGRAPH_BREAK.sub(r'\\\\\n', content)
         
         return content
     
     def _convert_tables_to_latex(self, content: str) -> str:
         """Convert markdown tables to LaTeX tables"""
-        import re
-        
         lines = content.split('\n')
         result_lines = []
         i = 0
@@ -1300,67 +1678,50 @@ class MarkdownToPDF:
         if not os.path.exists(markdown_file):
             raise FileNotFoundError(f"Markdown file not found: {markdown_file}")
         
-        # Read markdown content
-        with open(markdown_file, 'r', encoding='utf-8') as f:
-            md_content = f.read()
-        
-        # CRITICAL FIX: Get base directory for image resolution
-        base_dir = os.path.dirname(os.path.abspath(markdown_file))
-        
-        # Parse slides
-        slides = self.parse_markdown_slides(md_content, base_dir)
-        
-        if not slides:
-            raise ValueError("No slides found in markdown file")
-        
-        # Encode logo if provided
-        logo_data = None
-        logo_mime_type = 'image/png'  # Default
-        if self.logo_path and os.path.exists(self.logo_path):
-            logo_result = self._encode_image(self.logo_path)
-            if logo_result:
-                logo_data = logo_result['data']
-                logo_mime_type = logo_result['mime_type']
-        
-        # Calculate initial slide number display
-        slide_format = self.config.get_slide_number_format()
-        initial_slide_number = slide_format.replace('{current}', '1').replace('{total}', str(len(slides)))
-        if '{percent}' in initial_slide_number:
-            initial_percent = round((1 / len(slides)) * 100)
-            initial_slide_number = initial_slide_number.replace('{percent}', str(initial_percent))
-        
-        # Generate HTML
-        title = Path(markdown_file).stem
-        html_content = self.template.render(
-            title=title,
-            slides=slides,
-            css=self.css,
-            font_family=self.font_family,
-            font_css=self.font_css,
-            logo_data=logo_data,
-            logo_mime_type=logo_mime_type,
-            logo_position=self.logo_position,
-            enable_navigation=self.config.get('navigation.enabled', True),
-            show_arrows=self.config.get('navigation.show_arrows', True),
-            show_dots=self.config.get('navigation.show_dots', True),
-            show_slide_numbers=self.config.get('slide_number.enabled', True),
-            slide_number_format=self.config.get_slide_number_format(),
-            initial_slide_number=initial_slide_number,
-            config=self.config,
-            use_local_mathjax=_test_mode,
-            mock_mathjax_js=self.mock_mathjax_js,
-            local_mathjax_js=self.local_mathjax_js
-        )
+        return self._write_html(markdown_file, self._load_presentation(markdown_file), output_file, _test_mode)
+    
+    def _write_html(self, markdown_file, presentation, output_file=None, _test_mode=False):
+        """Render a loaded presentation as navigable HTML and save it"""
+        html_content = self._render_presentation_html(presentation, _test_mode=_test_mode)
         
         # Save HTML
         if output_file is None:
-            output_file = f"{title}.html"
+            output_file = f"{presentation[3]}.html"
         
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write(html_content)
         
         print(f"Converted {markdown_file} to {output_file}")
         return output_file
+    
+    def convert_both(self, markdown_file, html_output, pdf_output, _test_mode=False, browser=None):
+        """Convert markdown file to both HTML and PDF, reading and parsing the slides only once"""
+        if not os.path.exists(markdown_file):
+            raise FileNotFoundError(f"Markdown file not found: {markdown_file}")
+        
+        presentation = self._load_presentation(markdown_file)
+        self._write_html(markdown_file, presentation, html_output, _test_mode)
+        
+        if self.config.get('pdf.engine', 'playwright') == 'latex' and self.latex_available:
+            self._convert_to_pdf_latex(markdown_file, pdf_output)
+        else:
+            html_content = self._render_presentation_html(presentation, for_pdf=True, _test_mode=_test_mode)
+            self._write_pdf_from_html(html_content, pdf_output, _test_mode, browser)
+        
+        return html_output, pdf_output
+    
+    async def convert_both_async(self, markdown_file, html_output, pdf_output, browser, _test_mode=False):
+        """Async convert_both: parse once, write HTML, then render the PDF with an async browser"""
+        if not os.path.exists(markdown_file):
+            raise FileNotFoundError(f"Markdown file not found: {markdown_file}")
+        
+        presentation = self._load_presentation(markdown_file)
+        self._write_html(markdown_file, presentation, html_output, _test_mode)
+        
+        html_content = self._render_presentation_html(presentation, for_pdf=True, _test_mode=_test_mode)
+        await self._render_pdf_with_browser_async(html_content, pdf_output, browser, _test_mode)
+        
+        return html_output, pdf_output
 
 
 def main():
@@ -1373,17 +1734,19 @@ Examples:
   %(prog)s slides.md -c config.yml           # Using configuration file
   %(prog)s demo.md --html                    # Generate HTML instead of PDF
   %(prog)s slides.md --preview               # Generate and open in browser
+  %(prog)s a.md b.md c.md -j 4               # Convert several files in parallel
   %(prog)s --create-config                   # Create sample config
   %(prog)s --list-themes                     # Show available themes
         """
     )
     
-    parser.add_argument('input', nargs='?', help='Input markdown file')
+    parser.add_argument('input', nargs='*', help='Input markdown file(s)')
     parser.add_argument('-c', '--config', help='Configuration file (YAML)')
     parser.add_argument('-o', '--output', help='Output PDF file (optional)')
     parser.add_argument('--html', action='store_true', help='Generate HTML instead of PDF')
     parser.add_argument('--preview', action='store_true', help='Open preview in browser')
     parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output')
+    parser.add_argument('-j', '--jobs', type=int, help='Parallel conversions for multiple inputs (default: CPU count)')
     parser.add_argument('--list-themes', action='store_true', help='List available themes')
     parser.add_argument('--create-config', action='store_true', help='Create sample configuration file')
     
@@ -1406,49 +1769,30 @@ Examples:
     
     if not args.input:
         parser.error("Input markdown file is required (unless using --list-themes or --create-config)")
+    if args.output and len(args.input) > 1:
+        parser.error("-o/--output can only be used with a single input file")
     
     try:
-        # Load configuration
-        config = None
-        
-        # Check for default config files
-        default_configs = [
-            'bodh.yml',
-            'bodh.yaml',
-            '.bodh.yml',
-            '.bodh.yaml'
-        ]
-        
-        config_file = args.config
-        if not config_file:
-            # Look for default config files
-            for default_file in default_configs:
-                if os.path.exists(default_file):
-                    config_file = default_file
-                    break
-        
-        if config_file:
-            config = load_config(config_file)
-            converter = MarkdownToPDF(config=config)
-        else:
-            # Use default configuration
-            converter = MarkdownToPDF()
-        
-        if args.html or args.preview:
-            # Generate HTML
-            output_file = converter.convert_to_html(args.input, args.output)
-            if args.preview:
-                import webbrowser
-                webbrowser.open(f'file://{os.path.abspath(output_file)}')
-        else:
-            # Generate PDF
+        config_file = _find_config_file(args.config)
+        if not (args.html or args.preview) and 'BODH_PDF_BACKEND' not in os.environ:
             # Set PDF_BACKEND for the CLI tool based on environment variable or default
-            if 'BODH_PDF_BACKEND' not in os.environ:
-                os.environ['BODH_PDF_BACKEND'] = 'playwright' # Default to playwright for CLI
-            output_file = converter.convert_to_pdf(args.input, args.output)
+            os.environ['BODH_PDF_BACKEND'] = 'playwright' # Default to playwright for CLI
+        
+        if len(args.input) > 1:
+            _convert_files(args.input, config_file, args.html or args.preview, args.preview, args.jobs)
+            return
+        
+        # Load configuration
+        config = load_config(config_file) if config_file else None
+        converter = MarkdownToPDF(config=config) if config else MarkdownToPDF()
+        input_file = args.input[0]
+        output_file = _convert_file_with(converter, input_file, args.output, args.html or args.preview)
+        if args.preview:
+            import webbrowser
+            webbrowser.open(f'file://{os.path.abspath(output_file)}')
         
         if args.verbose:
-            print(f"Successfully converted {args.input} to {output_file}")
+            print(f"Successfully converted {input_file} to {output_file}")
             print(f"PDF Backend: {os.environ.get('BODH_PDF_BACKEND')}")
             print(f"Theme: {converter.theme_name} ({converter.theme_data['name']})")
             print(f"Font: {converter.font_family} ({converter.font_size}px)")
@@ -1467,5 +1811,59 @@ Examples:
         sys.exit(1)
 
 
+def _find_config_file(config_file=None):
+    """Return the configuration file to use: the given one, else the first default config present"""
+    if config_file:
+        return config_file
+    
+    # Check for default config files
+    default_configs = [
+        'bodh.yml',
+        'bodh.yaml',
+        '.bodh.yml',
+        '.bodh.yaml'
+    ]
+    for default_file in default_configs:
+        if os.path.exists(default_file):
+            return default_file
+    return None
+
+
+def _convert_file_with(converter, input_file, output_file=None, html=False):
+    """Convert one markdown file to HTML or PDF; returns the output path"""
+    if html:
+        return converter.convert_to_html(input_file, output_file)
+    return converter.convert_to_pdf(input_file, output_file)
+
+
+def _convert_file(input_file, config_file=None, html=False):
+    """Batch worker: convert one file with a fresh converter; returns (output_file, error)"""
+    try:
+        converter = MarkdownToPDF(config=load_config(config_file)) if config_file else MarkdownToPDF()
+        return _convert_file_with(converter, input_file, html=html), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _convert_files(input_files, config_file=None, html=False, preview=False, jobs=None):
+    """Convert several markdown files in parallel, one converter per worker process"""
+    worker = functools.partial(_convert_file, config_file=config_file, html=html)
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as executor:
+        results = list(executor.map(worker, input_files))
+    
+    failures = 0
+    for input_file, (output_file, error) in zip(input_files, results):
+        if error:
+            failures += 1
+            print(f"Error: {input_file}: {error}", file=sys.stderr)
+        else:
+            print(f"Generated: {output_file}")
+            if preview:
+                import webbrowser
+                webbrowser.open(f'file://{os.path.abspath(output_file)}')
+    if failures:
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -96,8 +96,9 @@ class PresentationConfig:
             },
             'pdf': {
                 'engine': 'playwright',  # playwright, latex
-                'latex_engine': 'pdflatex',  # pdflatex, xelatex, lualatex
-                'latex_passes': 2,  # number of LaTeX compilation passes
+                'latex_engine': 'pdflatex',  # pdflatex, xelatex, lualatex, tectonic
+                'latex_passes': 2,  # maximum LaTeX passes (reruns only for unresolved references)
+                'latex_work_dir': None,  # LaTeX scratch directory (default: per-process temp dir)
                 'prefer_latex_for_math': True  # use LaTeX when math is detected
             }
         }
@@ -7,15 +7,27 @@ import os
 import requests
 import base64
 import hashlib
+import json
 import re
 from pathlib import Path
 from urllib.parse import urlparse
 
+# Embedded CSS generated ahead of time by tools/bake_fonts.py (optional); it is used as-is,
+# so re-run the bake step to refresh it after font changes
+try:
+    from baked_fonts import FONTS as BAKED_FONTS
+except ImportError:
+    BAKED_FONTS = {}
+
 
 class FontManager:
+    # Font families whose cached CSS has already been revalidated in this process
+    _revalidated_fonts = set()
+    
     def __init__(self, cache_dir=".bodh_cache"):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
+        self.session = requests.Session()
         
         # Google Fonts API for font families
         self.google_fonts = {
@@ -34,6 +46,14 @@ class FontManager:
         """Generate cache key for font family"""
         return hashlib.md5(font_family.encode()).hexdigest()
     
+    def _read_cache_meta(self, meta_file):
+        """Read the stored HTTP validators (ETag / Last-Modified) for a cached CSS file"""
+        try:
+            with open(meta_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
     def download_font_css(self, font_family):
         """Download and parse Google Fonts CSS"""
         if font_family not in self.google_fonts:
@@ -42,16 +62,35 @@ class FontManager:
             
         cache_key = self.get_font_cache_key(font_family)
         css_cache_file = self.cache_dir / f"{cache_key}.css"
+        meta_file = self.cache_dir / f"{cache_key}.css.meta"
         
         # Check if cached
+        cached_css = None
+        headers = {}
         if css_cache_file.exists():
             with open(css_cache_file, 'r') as f:
-                return f.read()
+                cached_css = f.read()
+            
+            # Revalidate at most once per process, and only when we have validators to send
+            meta = self._read_cache_meta(meta_file)
+            if font_family in self._revalidated_fonts or not meta:
+                return cached_css
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
         
         try:
-            # Download CSS
-            print(f"Downloading font CSS for {font_family}...")
-            response = requests.get(self.google_fonts[font_family], timeout=10)
+            # Download CSS (conditional GET when revalidating a cached copy)
+            if cached_css is None:
+                print(f"Downloading font CSS for {font_family}...")
+            response = self.session.get(self.google_fonts[font_family], headers=headers, timeout=10)
+            
+            if response.status_code == 304:
+                # Not modified - keep using the cached CSS, no body was transferred
+                self._revalidated_fonts.add(font_family)
+                return cached_css
+            
             response.raise_for_status()
             
             css_content = response.text
@@ -60,8 +99,21 @@ class FontManager:
             with open(css_cache_file, 'w') as f:
                 f.write(css_content)
             
+            # Cache validators for the next conditional GET
+            meta = {}
+            if response.headers.get('ETag'):
+                meta['etag'] = response.headers['ETag']
+            if response.headers.get('Last-Modified'):
+                meta['last_modified'] = response.headers['Last-Modified']
+            with open(meta_file, 'w') as f:
+                json.dump(meta, f)
+            
+            self._revalidated_fonts.add(font_family)
             return css_content
         except Exception as e:
+            if cached_css is not None:
+                # Revalidation failed (e.g. offline) - a stale cache is still usable
+                return cached_css
             print(f"Warning: Failed to download font CSS for {font_family}: {e}")
             return None
     
@@ -157,6 +209,10 @@ body, h1, h2, h3, h4, h5, h6 {{
 
     def get_optimized_font_css(self, font_family, use_embedded=True):
         """Get optimized font CSS (embedded or fallback)"""
+        if use_embedded and font_family in BAKED_FONTS:
+            # Pre-baked CSS needs no network access or base64 work
+            return BAKED_FONTS[font_family]
+        
         if use_embedded:
             embedded_css = self.generate_embedded_css(font_family)
             if embedded_css:
@@ -5,27 +5,177 @@ Generate all examples in all three modes: HTML+MathJax, Local MathJax, and LaTeX
 Provides performance comparison and quality assessment
 """
 
+import asyncio
 import os
 import time
 import shutil
 from pathlib import Path
 import subprocess
 import tempfile
-from typing import Dict, List, Tuple, Any
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Tuple, Any, Optional
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add parent directory to path for imports
 import sys
 sys.path.insert(0, str(Path(__file__).parent))
 
-from bodh import MarkdownToPDF
+from jinja2 import Environment, FileSystemLoader
+
+from bodh import MarkdownToPDF, BROWSER_LAUNCH_OPTIONS
+
+# Maximum number of Playwright pages rendering at the same time
+PLAYWRIGHT_CONCURRENCY = 8
+
+
+def _speed_class(seconds: float) -> str:
+    """Performance badge class for a generation time"""
+    return 'fast' if seconds < 2 else 'medium' if seconds < 5 else 'slow'
+
+
+# Index page template, compiled once at import
+_INDEX_ENV = Environment(loader=FileSystemLoader(str(Path(__file__).parent / "templates")),
+                         autoescape=True, trim_blocks=True, lstrip_blocks=True)
+_INDEX_ENV.filters['speed_class'] = _speed_class
+_INDEX_TEMPLATE = _INDEX_ENV.get_template("index.html.j2")
+
+
+def _create_converter(mode_info: Dict[str, Any]) -> MarkdownToPDF:
+    """Create a converter with the mode-specific configuration applied"""
+    converter = MarkdownToPDF()
+    for key, value in mode_info['config_override'].items():
+        converter.config.set(key, value)
+    return converter
+
+
+def _size_or_zero(path: Path) -> int:
+    """Size of a generated file in bytes, or 0 if it was not written (one stat call)"""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _example_result(md_file: Path, mode: str, html_output: Path, pdf_output: Path,
+                    success: bool, duration: float) -> Dict[str, Any]:
+    """Build the result record for one generated example"""
+    # Get file sizes
+    html_size = _size_or_zero(html_output)
+    pdf_size = _size_or_zero(pdf_output)
+    pdf_generated = pdf_size > 0
+    
+    return {
+        'success': success and pdf_generated,
+        'duration': duration,
+        'html_generated': html_size > 0,
+        'pdf_generated': pdf_generated,
+        'html_size': html_size,
+        'pdf_size': pdf_size,
+        'mode': mode,
+        'file': md_file.name
+    }
+
+
+def _failed_result(md_file: Path, mode: str, error: Exception, duration: float) -> Dict[str, Any]:
+    """Build the result record for a failed generation"""
+    return {
+        'success': False,
+        'duration': duration,
+        'error': str(error),
+        'mode': mode,
+        'file': md_file.name
+    }
+
+
+def _generate_example_job(md_file: Path, mode: str, mode_info: Dict[str, Any],
+                          output_dir: Path, latex_available: bool) -> Dict[str, Any]:
+    """Generate a single example in specified mode (picklable worker for the process pool)"""
+    start_time = time.perf_counter()
+    
+    try:
+        converter = _create_converter(mode_info)
+        
+        # Generate output paths
+        stem = md_file.stem
+        html_output = output_dir / mode / f"{stem}.html"
+        pdf_output = output_dir / mode / f"{stem}.pdf"
+        
+        # Generate based on mode
+        if mode == 'latex_direct' and latex_available:
+            # Use LaTeX backend through the main bodh.py converter
+            success = converter.convert_to_pdf(str(md_file), str(pdf_output))
+        else:
+            # Use standard Playwright approach
+            converter.convert_both(str(md_file), str(html_output), str(pdf_output))
+            success = True
+        
+        duration = time.perf_counter() - start_time
+        return _example_result(md_file, mode, html_output, pdf_output, success, duration)
+        
+    except Exception as e:
+        return _failed_result(md_file, mode, e, time.perf_counter() - start_time)
+
+
+async def _generate_example_async(md_file: Path, mode: str, mode_info: Dict[str, Any],
+                                  output_dir: Path, browser) -> Dict[str, Any]:
+    """Generate a single Playwright-mode example in its own context of a shared async browser"""
+    start_time = time.perf_counter()
+    
+    try:
+        converter = _create_converter(mode_info)
+        
+        stem = md_file.stem
+        html_output = output_dir / mode / f"{stem}.html"
+        pdf_output = output_dir / mode / f"{stem}.pdf"
+        
+        await converter.convert_both_async(str(md_file), str(html_output), str(pdf_output), browser)
+        
+        duration = time.perf_counter() - start_time
+        return _example_result(md_file, mode, html_output, pdf_output, True, duration)
+        
+    except Exception as e:
+        return _failed_result(md_file, mode, e, time.perf_counter() - start_time)
+
+
+async def _generate_playwright_jobs(jobs: List[Tuple[Path, str]], modes: Dict[str, Any],
+                                    output_dir: Path) -> List[Dict[str, Any]]:
+    """Render all Playwright-mode jobs concurrently on one browser, one context per job"""
+    from playwright.async_api import async_playwright
+    
+    semaphore = asyncio.Semaphore(PLAYWRIGHT_CONCURRENCY)
+    
+    async def _bounded(md_file: Path, mode: str, browser) -> Dict[str, Any]:
+        async with semaphore:
+            return await _generate_example_async(md_file, mode, modes[mode], output_dir, browser)
+    
+    async with async_playwright() as p:
+        start_time = time.perf_counter()
+        try:
+            browser = await p.chromium.launch(**BROWSER_LAUNCH_OPTIONS)
+        except Exception as e:
+            # No browser means every Playwright job fails the same way
+            duration = time.perf_counter() - start_time
+            return [_failed_result(md_file, mode, e, duration) for md_file, mode in jobs]
+        
+        try:
+            return await asyncio.gather(*[_bounded(md_file, mode, browser) for md_file, mode in jobs])
+        finally:
+            await browser.close()
 
 
 class ComprehensiveGenerator:
     """Generate presentations in all available modes with performance tracking"""
     
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None):
         self.results = {}
+        self.max_workers = max_workers or os.cpu_count()
+        self._stems = {}  # example filename -> stem, filled by get_example_files()
+        self._deps = None  # cached check_dependencies() result, see _get_deps()
         self.output_dir = Path("generated_examples")
         self.examples_dir = Path("examples")
         
@@ -62,6 +212,8 @@ class ComprehensiveGenerator:
                 'config_override': {
                     'pdf.engine': 'latex',
                     'pdf.latex_engine': 'pdflatex',
+                    # Compile next to the outputs so finished PDFs are renamed, not copied
+                    'pdf.latex_work_dir': str(self.output_dir / '.latex_tmp'),
                     'math.engine': 'latex'
                 }
             }
@@ -79,6 +231,12 @@ class ComprehensiveGenerator:
         except:
             deps['latex'] = False
         
+        # Prefer tectonic when installed: one fast-starting binary instead of a pdflatex run per pass
+        deps['tectonic'] = shutil.which('tectonic') is not None
+        if deps['tectonic']:
+            deps['latex'] = True
+            self.modes['latex_direct']['config_override']['pdf.latex_engine'] = 'tectonic'
+        
         # Check Playwright (should always be available)
         deps['playwright'] = True
         
@@ -87,82 +245,35 @@ class ComprehensiveGenerator:
         
         return deps
     
+    def _get_deps(self) -> Dict[str, bool]:
+        """Return dependency availability, probing the system only once per generator"""
+        if self._deps is None:
+            self._deps = self.check_dependencies()
+        return self._deps
+    
     def get_example_files(self) -> List[Path]:
         """Get all markdown example files"""
         if not self.examples_dir.exists():
             print(f"❌ Examples directory not found: {self.examples_dir}")
             return []
         
-        md_files = list(self.examples_dir.glob("*.md"))
+        # scandir gives names and file types directly; only build Paths for matches
+        with os.scandir(self.examples_dir) as entries:
+            md_files = [Path(entry.path) for entry in entries
+                        if entry.name.endswith('.md') and entry.is_file()]
+        self._stems = {md_file.name: md_file.stem for md_file in md_files}
         print(f"📁 Found {len(md_files)} example files")
         
         return md_files
     
     def generate_single_example(self, md_file: Path, mode: str) -> Dict[str, Any]:
         """Generate a single example in specified mode"""
-        mode_info = self.modes[mode]
-        start_time = time.time()
-        
-        try:
-            # Create converter
-            converter = MarkdownToPDF()
-            
-            # Apply mode-specific configuration
-            for key, value in mode_info['config_override'].items():
-                converter.config.set(key, value)
-            
-            # Generate output paths
-            stem = md_file.stem
-            html_output = self.output_dir / mode / f"{stem}.html"
-            pdf_output = self.output_dir / mode / f"{stem}.pdf"
-            
-            # Generate based on mode
-            if mode == 'latex_direct' and self.check_dependencies()['latex']:
-                # Use LaTeX backend through the main bodh.py converter
-                success = converter.convert_to_pdf(str(md_file), str(pdf_output))
-                html_generated = False
-            else:
-                # Use standard Playwright approach
-                # Generate HTML
-                converter.convert_to_html(str(md_file), str(html_output))
-                html_generated = html_output.exists()
-                
-                # Generate PDF
-                converter.convert_to_pdf(str(md_file), str(pdf_output))
-                success = pdf_output.exists()
-            
-            duration = time.time() - start_time
-            
-            # Get file sizes
-            html_size = html_output.stat().st_size if html_output.exists() else 0
-            pdf_size = pdf_output.stat().st_size if pdf_output.exists() else 0
-            
-            return {
-                'success': success,
-                'duration': duration,
-                'html_generated': html_output.exists(),
-                'pdf_generated': pdf_output.exists(),
-                'html_size': html_size,
-                'pdf_size': pdf_size,
-                'mode': mode,
-                'file': md_file.name
-            }
-            
-        except Exception as e:
-            duration = time.time() - start_time
-            return {
-                'success': False,
-                'duration': duration,
-                'error': str(e),
-                'mode': mode,
-                'file': md_file.name
-            }
-    
-    
+        return _generate_example_job(md_file, mode, self.modes[mode], self.output_dir,
+                                     self._get_deps()['latex'])
     
     def generate_all_examples(self) -> None:
         """Generate all examples in all available modes"""
-        deps = self.check_dependencies()
+        deps = self._get_deps()
         example_files = self.get_example_files()
         
         if not example_files:
@@ -174,33 +285,64 @@ class ComprehensiveGenerator:
         print(f"📁 Processing {len(example_files)} examples in {len(self.modes)} modes")
         print("=" * 60)
         
-        total_generations = len(example_files) * len(self.modes)
-        current = 0
-        
+        # Collect every (file, mode) job up front; they are fully independent
+        jobs = []
         for md_file in example_files:
-            print(f"\n📄 Processing: {md_file.name}")
-            print("-" * 40)
-            
             self.results[md_file.name] = {}
             
             for mode_key, mode_info in self.modes.items():
-                current += 1
-                
                 # Skip LaTeX mode if not available
                 if mode_key == 'latex_direct' and not deps['latex']:
-                    print(f"  ⏭️  [{current}/{total_generations}] Skipping {mode_info['name']} (LaTeX not available)")
+                    print(f"  ⏭️  Skipping {mode_info['name']} for {md_file.name} (LaTeX not available)")
                     continue
-                
-                print(f"  🔄 [{current}/{total_generations}] Generating with {mode_info['name']}...")
-                
-                result = self.generate_single_example(md_file, mode_key)
-                self.results[md_file.name][mode_key] = result
-                
-                if result['success']:
-                    print(f"     ✅ Success in {result['duration']:.2f}s (PDF: {result['pdf_size']} bytes)")
-                else:
-                    error = result.get('error', 'Unknown error')
-                    print(f"     ❌ Failed in {result['duration']:.2f}s: {error}")
+                jobs.append((md_file, mode_key))
+        
+        # LaTeX jobs fork pdflatex, so they go to a process pool; Playwright jobs are
+        # I/O-bound and overlap on one async browser in this process meanwhile
+        latex_jobs = [(md_file, mode_key) for md_file, mode_key in jobs if mode_key == 'latex_direct']
+        playwright_jobs = [(md_file, mode_key) for md_file, mode_key in jobs if mode_key != 'latex_direct']
+        
+        print(f"🔄 Running {len(playwright_jobs)} Playwright generations (up to {PLAYWRIGHT_CONCURRENCY} at once) "
+              f"and {len(latex_jobs)} LaTeX generations on {self.max_workers} worker processes...")
+        
+        completed = 0
+        
+        def record(md_file: Path, mode_key: str, result: Dict[str, Any]) -> None:
+            nonlocal completed
+            completed += 1
+            self.results[md_file.name][mode_key] = result
+            mode_name = self.modes[mode_key]['name']
+            
+            if result['success']:
+                print(f"  ✅ [{completed}/{len(jobs)}] {md_file.name} - {mode_name}: {result['duration']:.2f}s (PDF: {result['pdf_size']} bytes)")
+            else:
+                error = result.get('error', 'Unknown error')
+                print(f"  ❌ [{completed}/{len(jobs)}] {md_file.name} - {mode_name}: failed in {result['duration']:.2f}s: {error}")
+        
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(_generate_example_job, md_file, mode_key, self.modes[mode_key],
+                                self.output_dir, deps['latex']): (md_file, mode_key)
+                for md_file, mode_key in latex_jobs
+            }
+            
+            if playwright_jobs:
+                playwright_results = asyncio.run(
+                    _generate_playwright_jobs(playwright_jobs, self.modes, self.output_dir))
+                for (md_file, mode_key), result in zip(playwright_jobs, playwright_results):
+                    record(md_file, mode_key, result)
+            
+            for future in as_completed(futures):
+                md_file, mode_key = futures[future]
+                record(md_file, mode_key, future.result())
+        
+        # Jobs remove their own LaTeX files; drop the now-empty scratch directory
+        shutil.rmtree(self.output_dir / '.latex_tmp', ignore_errors=True)
+        
+        # Jobs finish in any order; keep per-file results in mode order for the report
+        for filename, file_results in self.results.items():
+            self.results[filename] = {mode_key: file_results[mode_key]
+                                      for mode_key in self.modes if mode_key in file_results}
     
     def generate_performance_report(self) -> None:
         """Generate comprehensive performance and quality report"""
@@ -212,24 +354,35 @@ class ComprehensiveGenerator:
         mode_stats = {}
         
         for mode_key, mode_info in self.modes.items():
-            results = []
-            for file_results in self.results.values():
-                if mode_key in file_results and file_results[mode_key]['success']:
-                    results.append(file_results[mode_key])
+            # Single pass with running totals - no per-mode lists
+            count = 0
+            total_duration = 0.0
+            min_duration = float('inf')
+            max_duration = 0.0
+            total_pdf_size = 0
             
-            if results:
-                durations = [r['duration'] for r in results]
-                pdf_sizes = [r['pdf_size'] for r in results]
+            for file_results in self.results.values():
+                result = file_results.get(mode_key)
+                if result is None or not result['success']:
+                    continue
                 
+                duration = result['duration']
+                count += 1
+                total_duration += duration
+                min_duration = min(min_duration, duration)
+                max_duration = max(max_duration, duration)
+                total_pdf_size += result['pdf_size']
+            
+            if count:
                 mode_stats[mode_key] = {
                     'name': mode_info['name'],
                     'description': mode_info['description'],
-                    'successful': len(results),
-                    'avg_duration': sum(durations) / len(durations),
-                    'min_duration': min(durations),
-                    'max_duration': max(durations),
-                    'avg_pdf_size': sum(pdf_sizes) / len(pdf_sizes),
-                    'total_duration': sum(durations)
+                    'successful': count,
+                    'avg_duration': total_duration / count,
+                    'min_duration': min_duration,
+                    'max_duration': max_duration,
+                    'avg_pdf_size': total_pdf_size / count,
+                    'total_duration': total_duration
                 }
         
         # Display performance comparison
@@ -278,212 +431,40 @@ class ComprehensiveGenerator:
         
         # Save detailed report
         report_file = self.output_dir / "performance_reports" / "comprehensive_report.json"
-        with open(report_file, 'w') as f:
-            json.dump({
-                'mode_stats': mode_stats,
-                'detailed_results': self.results,
-                'generation_timestamp': time.time()
-            }, f, indent=2)
+        report = {
+            'mode_stats': mode_stats,
+            'detailed_results': self.results,
+            'generation_timestamp': time.time()
+        }
+        if orjson is not None:
+            report_file.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(report_file, 'w') as f:
+                json.dump(report, f, indent=2)
         
         print(f"\n💾 Detailed report saved: {report_file}")
     
     def generate_index_html(self) -> None:
         """Generate an HTML index page showing all generated examples"""
-        
-        index_content = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Bodh - Multi-Mode Generation Comparison</title>
-    <style>
-        body { font-family: Inter, sans-serif; margin: 2rem; line-height: 1.6; }
-        .container { max-width: 1200px; margin: 0 auto; }
-        .header { text-align: center; margin-bottom: 3rem; }
-        .performance-summary { background: #f8f9fa; padding: 1.5rem; border-radius: 8px; margin: 2rem 0; }
-        .examples-section { margin: 2rem 0; }
-        .example-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(350px, 1fr)); gap: 1.5rem; }
-        .example-card { 
-            padding: 1.5rem; 
-            border: 1px solid #ddd; 
-            border-radius: 8px; 
-            background: white;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        .example-title { 
-            font-weight: 600; 
-            font-size: 1.1em; 
-            margin-bottom: 1rem; 
-            color: #2563eb;
-            border-bottom: 1px solid #e5e7eb;
-            padding-bottom: 0.5rem;
-        }
-        .mode-versions { margin-bottom: 1rem; }
-        .mode-version { 
-            margin: 0.5rem 0; 
-            padding: 0.5rem 0; 
-            border-bottom: 1px dotted #e5e7eb;
-        }
-        .mode-version:last-child { border-bottom: none; }
-        .mode-name { 
-            font-weight: 500; 
-            color: #374151; 
-            margin-bottom: 0.3rem;
-        }
-        .version-links { margin-bottom: 0.3rem; }
-        .version-links a { 
-            margin-right: 0.8rem; 
-            text-decoration: none; 
-            padding: 0.3rem 0.6rem; 
-            border-radius: 4px; 
-            font-size: 0.9em;
-        }
-        .html-link { background: #e7f3ff; color: #0066cc; }
-        .pdf-link { background: #ffe7e7; color: #cc0000; }
-        .unavailable { color: #999; font-style: italic; }
-        .performance-info { 
-            font-size: 0.85em; 
-            color: #6b7280; 
-        }
-        .performance-badge { 
-            font-size: 0.8em; 
-            padding: 0.2rem 0.4rem; 
-            border-radius: 3px; 
-            margin-left: 0.5rem; 
-        }
-        .fast { background: #e7ffe7; color: #006600; }
-        .medium { background: #fff3cd; color: #856404; }
-        .slow { background: #ffe7e7; color: #cc0000; }
-        .mode-legend { margin: 1rem 0; font-size: 0.9em; color: #6b7280; }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🚀 Bodh Multi-Mode Generation</h1>
-            <p>Each example generated with all available modes for performance comparison</p>
-        </div>
-        
-        <div class="performance-summary">
-            <h2>📊 Performance Summary</h2>
-            <div class="mode-comparison">
-"""
-        
-        # Add performance data
+        # Collect successful durations per mode
         mode_perf = {}
-        for filename, file_results in self.results.items():
+        for file_results in self.results.values():
             for mode_key, result in file_results.items():
                 if result['success']:
-                    if mode_key not in mode_perf:
-                        mode_perf[mode_key] = []
-                    mode_perf[mode_key].append(result['duration'])
-        
-        # Show performance comparison
-        for mode_key, mode_info in self.modes.items():
-            if mode_key in mode_perf:
-                avg_time = sum(mode_perf[mode_key]) / len(mode_perf[mode_key])
-                badge_class = 'fast' if avg_time < 2 else 'medium' if avg_time < 5 else 'slow'
-                
-                index_content += f"""
-                <p><strong>{mode_info['name']}:</strong> {avg_time:.2f}s average 
-                <span class="performance-badge {badge_class}">{len(mode_perf[mode_key])} files</span></p>
-                """
+                    mode_perf.setdefault(mode_key, []).append(result['duration'])
         
-        # Add speedup analysis
+        # Speedup analysis
+        speedup = None
         if 'latex_direct' in mode_perf and 'html_mathjax' in mode_perf:
             latex_avg = sum(mode_perf['latex_direct']) / len(mode_perf['latex_direct'])
             mathjax_avg = sum(mode_perf['html_mathjax']) / len(mode_perf['html_mathjax'])
             speedup = mathjax_avg / latex_avg
-            index_content += f"""
-            <p><strong>⚡ LaTeX is {speedup:.1f}x faster than MathJax CDN</strong></p>
-            """
-        
-        index_content += """
-            </div>
-            <div class="mode-legend">
-                🟢 Fast (&lt;2s) | 🟡 Medium (2-5s) | 🔴 Slow (&gt;5s)
-            </div>
-        </div>
-        
-        <div class="examples-section">
-            <h2>📄 Examples with All Modes</h2>
-            <div class="example-grid">
-"""
         
-        # Generate example cards - one per example with all modes
-        all_files = set()
-        for filename in self.results.keys():
-            all_files.add(filename)
+        # One card per example with all modes
+        examples = [(self._stems[filename], self.results[filename]) for filename in sorted(self.results)]
         
-        for filename in sorted(all_files):
-            stem = Path(filename).stem
-            file_results = self.results.get(filename, {})
-            
-            index_content += f"""
-                <div class="example-card">
-                    <div class="example-title">{stem}</div>
-                    <div class="mode-versions">
-"""
-            
-            # Show each mode for this example
-            for mode_key, mode_info in self.modes.items():
-                if mode_key in file_results:
-                    result = file_results[mode_key]
-                    
-                    index_content += f"""
-                        <div class="mode-version">
-                            <div class="mode-name">{mode_info['name']}</div>
-                            <div class="version-links">
-"""
-                    
-                    if result['success']:
-                        if result.get('html_generated'):
-                            index_content += f'<a href="{mode_key}/{stem}.html" class="html-link">HTML</a>'
-                        
-                        if result.get('pdf_generated'):
-                            index_content += f'<a href="{mode_key}/{stem}.pdf" class="pdf-link">PDF</a>'
-                        
-                        perf_class = 'fast' if result['duration'] < 2 else 'medium' if result['duration'] < 5 else 'slow'
-                        
-                        index_content += f"""
-                            </div>
-                            <div class="performance-info">
-                                Generated in {result['duration']:.2f}s
-                                <span class="performance-badge {perf_class}">
-                                    {result['pdf_size']:,} bytes
-                                </span>
-                            </div>
-"""
-                    else:
-                        index_content += """
-                                <span class="unavailable">Failed to generate</span>
-                            </div>
-                            <div class="performance-info">
-                                <span class="unavailable">Generation failed</span>
-                            </div>
-"""
-                    
-                    index_content += """
-                        </div>
-"""
-            
-            index_content += """
-                    </div>
-                </div>
-"""
-        
-        index_content += """
-            </div>
-        </div>
-        
-        <div style="margin-top: 3rem; text-align: center; color: #666;">
-            <p>Generated with Bodh - Beautiful Markdown Presentations</p>
-            <p><small>Each example shows all available generation modes for direct comparison</small></p>
-        </div>
-    </div>
-</body>
-</html>
-"""
+        index_content = _INDEX_TEMPLATE.render(modes=self.modes, mode_perf=mode_perf,
+                                               speedup=speedup, examples=examples)
         
         # Save index file
         index_file = self.output_dir / "index.html"
@@ -503,7 +484,7 @@ class ComprehensiveGenerator:
         print()
         
         # Check system
-        deps = self.check_dependencies()
+        deps = self._get_deps()
         if not deps['latex']:
             print("⚠️  LaTeX not detected - install with:")
             print("   curl -sL https://yihui.org/tinytex/install-bin-unix.sh | sh")
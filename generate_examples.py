@@ -3,49 +3,416 @@
 Generate HTML and PDF examples for GitHub Pages
 """
 
+import argparse
+import asyncio
+import functools
+import gzip
+import hashlib
+import logging
 import os
+import re
+import shutil
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from bodh import MarkdownToPDF
+import bodh
+from bodh import MarkdownToPDF, BROWSER_LAUNCH_OPTIONS, render_html_to_pdf_async, _slides_have_math
+from config import load_config
+
+# Directory that images referenced from the showcase markdown are resolved against
+SHOWCASE_DIR = os.path.abspath('examples')
+
+# Basic theme examples and their (HTML, PDF) output paths, built once
+THEMES = ['modern', 'minimal', 'gradient', 'dark', 'default', 'sky', 'solarized', 'moon']
+THEME_PATHS = {
+    theme: (Path('docs/examples') / f'showcase-{theme}.html', Path('docs/pdfs') / f'showcase-{theme}.pdf')
+    for theme in THEMES
+}
+
+# Configuration examples that render their own markdown instead of the showcase
+CONFIG_CONTENT_FILES = {
+    'feature-showcase': 'examples/feature-showcase.md',
+    'advanced-features': 'examples/advanced-features.md',
+    'math-demo': 'examples/math-demo.md',
+    'multi-column-demo': 'examples/multi-column-demo.md'
+}
+
+# Per-theme stamps of input mtimes; a theme whose stamp matches is not regenerated
+STAMP_DIR = Path('docs/.stamps')
+
+# Markdown image references, matched the same way bodh finds the images it embeds
+_IMAGE_REF_RE = re.compile(r'!\[[^\]]*\]\(([^)]+)\)')
+
+# Rendered showcase HTML keyed by its inputs, reused across runs when BODH_CACHE=1
+HTML_CACHE_DIR = Path('docs/.cache')
+
+# Progress goes to sys.stdout, the stream bodh prints to, flushed after every record so the two
+# stay in order and nothing is lost if the run crashes
+logger = logging.getLogger('bodh.examples')
+
+def _setup_logging():
+    """Attach the stdout handler once (level from BODH_LOG_LEVEL, e.g. WARNING in CI)"""
+    if logger.handlers:
+        return
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(os.environ.get('BODH_LOG_LEVEL', 'INFO').upper())
+    logger.propagate = False
+
+def _flush_logs():
+    """Write out anything still buffered in stdout (e.g. bodh's own prints)"""
+    for handler in logger.handlers:
+        handler.flush()
+
+# Maximum PDF renders in flight at once, each in its own context of the shared browser
+PDF_CONCURRENCY = 8
+
+# Template arguments shared by every theme showcase
+BASE_RENDER_KWARGS = {
+    'font_family': 'Inter',
+    'logo_data': None,
+    'logo_position': 'top-right',
+    'enable_navigation': True,
+    'show_arrows': True,
+    'show_dots': True,
+    'show_slide_numbers': True,
+    'slide_number_format': '{current}/{total}',
+    'initial_slide_number': '1'
+}
+
+# Config slide number format -> template format
+_FORMAT_MAP = {
+    'current': '{current}',
+    'current/total': '{current}/{total}',
+    'total': '{total}',
+    'percent': '{percent}%'
+}
 
 def _get_slide_number_format(format_type):
     """Convert config format to template format"""
-    format_map = {
-        'current': '{current}',
-        'current/total': '{current}/{total}',
-        'total': '{total}',
-        'percent': '{percent}%'
-    }
-    return format_map.get(format_type, '{current}/{total}')
-
-def generate_examples():
-    """Generate HTML and PDF examples for all themes"""
+    return _FORMAT_MAP.get(format_type, '{current}/{total}')
+
+@functools.lru_cache(maxsize=None)
+def _bodh_fingerprint():
+    """Digest of the bodh module source, so cached HTML is dropped when templates change"""
+    return hashlib.blake2b(Path(bodh.__file__).read_bytes(), digest_size=16).digest()
+
+def _html_cache_path(*parts):
+    """Cache file for HTML rendered from the given inputs, or None when caching is off"""
+    if os.environ.get('BODH_CACHE') != '1':
+        return None
+    digest = hashlib.blake2b(_bodh_fingerprint(), digest_size=16)
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return HTML_CACHE_DIR / f'{digest.hexdigest()}.html'
+
+def _link_or_copy(src, dst):
+    """Hardlink src to dst (replacing dst), copying where links are not supported"""
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+def _write_html(html_path, html_bytes):
+    """Write HTML only if it differs from the file on disk, plus a .gz copy when BODH_GZIP=1"""
+    html_path = Path(html_path)
+    try:
+        unchanged = html_path.read_bytes() == html_bytes
+    except FileNotFoundError:
+        unchanged = False
+    if not unchanged:
+        # Replace rather than overwrite in place: html_path may be hardlinked to a cache entry
+        tmp_path = html_path.with_name(html_path.name + '.tmp')
+        tmp_path.write_bytes(html_bytes)
+        os.replace(tmp_path, html_path)
+    _write_gz(html_path, unchanged, html_bytes)
+
+def _write_cached_html(cache_path, html_path):
+    """Point html_path at a cache entry unless it already matches, plus a .gz copy when BODH_GZIP=1"""
+    html_path = Path(html_path)
+    try:
+        unchanged = os.path.samefile(cache_path, html_path) or html_path.read_bytes() == cache_path.read_bytes()
+    except FileNotFoundError:
+        unchanged = False
+    if not unchanged:
+        _link_or_copy(cache_path, html_path)
+    _write_gz(html_path, unchanged)
+
+def _write_gz(html_path, unchanged, html_bytes=None):
+    """Write html_path's .gz copy when BODH_GZIP=1 and html_path changed or the copy is missing"""
+    if os.environ.get('BODH_GZIP') != '1':
+        return
+    gz_path = html_path.with_name(html_path.name + '.gz')
+    if not unchanged or not gz_path.exists():
+        if html_bytes is None:
+            html_bytes = html_path.read_bytes()
+        gz_path.write_bytes(gzip.compress(html_bytes, compresslevel=9, mtime=0))
+
+def _showcase_images(content):
+    """Local image files the showcase references, resolved against SHOWCASE_DIR like bodh does"""
+    return sorted({os.path.join(SHOWCASE_DIR, image_path) for image_path in _IMAGE_REF_RE.findall(content)
+                   if not image_path.startswith(('data:', 'http://', 'https://'))})
+
+def _theme_stamp_key(theme, images=()):
+    """Modification times of everything a theme showcase is generated from, embedded images included"""
+    inputs = ['examples/showcase.md', f'themes/{theme}.json', 'templates/base.css', bodh.__file__]
+    key = [str(os.stat(path).st_mtime_ns) for path in inputs]
+    for image_path in images:
+        # A missing image is recorded too, so adding it later regenerates the theme
+        try:
+            key.append(str(os.stat(image_path).st_mtime_ns))
+        except OSError:
+            key.append('-')
+    return ':'.join(key)
+
+def _needs_regen(theme, images=()):
+    """Whether a theme's inputs changed (or its outputs are missing) since it was last generated"""
+    try:
+        if (STAMP_DIR / f'{theme}.stamp').read_text() != _theme_stamp_key(theme, images):
+            return True
+    except OSError:
+        return True
+    return not all(os.path.exists(path) for path in THEME_PATHS[theme])
+
+def _write_stamp(theme, images=()):
+    """Record a theme's input mtimes after it was fully generated"""
+    STAMP_DIR.mkdir(parents=True, exist_ok=True)
+    (STAMP_DIR / f'{theme}.stamp').write_text(_theme_stamp_key(theme, images))
+
+def _prepare_pdf(converter, md_content, pdf_path, title, slides):
+    """Build the print HTML for one PDF; returns (pdf_path, html, config) for the shared browser, html None if already written"""
+    try:
+        pdf_engine = converter.config.get('pdf.engine', 'playwright')
+        pdf_backend = os.environ.get('BODH_PDF_BACKEND', 'playwright')
+        if (pdf_engine == 'latex' and converter.latex_available) or pdf_backend != 'playwright':
+            # Backends without a browser write the PDF right here in the worker
+            logger.info(f"  📄 Generating PDF: {pdf_path}...")
+            converter.convert_string_to_pdf(md_content, pdf_path, base_dir=SHOWCASE_DIR, title=title, slides=slides)
+            logger.info(f"  ✅ PDF generated: {pdf_path}")
+            return pdf_path, None, None
+        html_content, _ = converter._build_pdf_html(title, slides=slides)
+        return pdf_path, html_content, converter.config
+    except Exception as pdf_error:
+        logger.warning(f"  ⚠️  Warning: Could not prepare PDF {pdf_path}: {pdf_error}")
+        return None
+
+async def _render_pdf(pdf_job, browser, semaphore):
+    """Render one prepared PDF in its own browser context; returns the PDF path, or None on failure"""
+    pdf_path, html_content, config = pdf_job
+    if html_content is None:
+        return pdf_path
+    async with semaphore:
+        try:
+            await render_html_to_pdf_async(html_content, pdf_path, browser, config)
+            logger.info(f"  ✅ PDF generated: {pdf_path}")
+            return pdf_path
+        except Exception as pdf_error:
+            logger.warning(f"  ⚠️  Warning: Could not generate PDF {pdf_path}: {pdf_error}")
+            return None
+
+async def _render_pdfs(pdf_jobs):
+    """Render all prepared PDFs concurrently on one browser; returns PDF paths (None for failures)"""
+    from playwright.async_api import async_playwright
+    
+    semaphore = asyncio.Semaphore(PDF_CONCURRENCY)
+    if all(html_content is None for _, html_content, _ in pdf_jobs):
+        return [pdf_path for pdf_path, _, _ in pdf_jobs]
+    
+    async with async_playwright() as p:
+        try:
+            browser = await p.chromium.launch(**BROWSER_LAUNCH_OPTIONS)
+        except Exception as e:
+            logger.warning(f"⚠️  Warning: Could not launch browser for PDFs: {e}")
+            return [pdf_path if html_content is None else None for pdf_path, html_content, _ in pdf_jobs]
+        
+        try:
+            return await asyncio.gather(*[_render_pdf(job, browser, semaphore) for job in pdf_jobs])
+        finally:
+            await browser.close()
+
+def _render_theme(theme, content, slides=None, slides_key=None):
+    """Generate the showcase HTML and prepare the PDF for one theme; returns (html_path, pdf_job), None where not produced"""
+    logger.info(f"\n🎨 Generating examples for theme: {theme}")
+    html_saved = pdf_job = None
+    
+    try:
+        logger.info(f"  🔧 Creating MarkdownToPDF converter for {theme}...")
+        # Create converter
+        converter = MarkdownToPDF(theme=theme, font_family='Inter', font_size=20)
+        logger.info(f"  ✅ Converter created successfully")
+        
+        # Reuse the slides parsed up front unless this theme parses differently
+        if slides is None or converter.slide_parse_key() != slides_key:
+            logger.info(f"  📝 Parsing slides from markdown...")
+            slides = converter.parse_markdown_slides(content, SHOWCASE_DIR)
+            logger.info(f"  ✅ Found {len(slides)} slides")
+        
+        html_path, pdf_path = THEME_PATHS[theme]
+        # Key on the parsed slides: they embed the referenced images, which the markdown alone does not capture
+        cache_path = _html_cache_path(theme, converter.css, *slides)
+        if cache_path is not None and cache_path.exists():
+            _write_cached_html(cache_path, html_path)
+            logger.info(f"  ♻️  Reused cached HTML: {html_path}")
+        else:
+            logger.info(f"  🌐 Generating HTML content...")
+            # Generate HTML with navigation
+            html_content = converter.template.render(
+                title=f'Bodh Showcase - {theme.title()} Theme',
+                slides=slides,
+                css=converter.css,
+                config=converter.config,
+                has_math=converter.config.get('math.enabled', True) and _slides_have_math(slides),
+                **BASE_RENDER_KWARGS
+            )
+            logger.info(f"  ✅ Generated {len(html_content)} characters of HTML")
+            
+            # Write HTML file
+            logger.info(f"  💾 Writing HTML to {html_path}...")
+            # Encode up front so the whole page goes out in one write instead of 8 KiB text chunks
+            if cache_path is None:
+                _write_html(html_path, html_content.encode('utf-8'))
+            else:
+                # Write the cache entry first; html_path may still be a link to an older entry
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                cache_path.write_bytes(html_content.encode('utf-8'))
+                _write_cached_html(cache_path, html_path)
+            logger.info(f"  ✅ HTML saved: {html_path}")
+        html_saved = html_path
+        
+        # Prepare the PDF for all themes; the browser renders run concurrently afterwards
+        pdf_job = _prepare_pdf(converter, content, pdf_path, 'showcase', slides)
+            
+    except Exception as e:
+        logger.error(f"  ❌ Error generating {theme}: {e}")
+        logger.error(f"  📋 Full error trace: {traceback.format_exc()}")
+    
+    _flush_logs()
+    return html_saved, pdf_job
+
+def _render_config(example_name, config_path, content):
+    """Generate the HTML and prepare the PDF for one configuration example; returns (html_path, pdf_job), None where not produced"""
+    logger.info(f"\n🔧 Generating {example_name} with {config_path}")
+    html_saved = pdf_job = None
     
-    print("🚀 Starting Bodh example generation...")
-    print(f"📁 Current working directory: {os.getcwd()}")
+    try:
+        logger.info(f"  📖 Loading configuration from {config_path}")
+        config = load_config(config_path)
+        logger.info(f"  ✅ Configuration loaded successfully")
+        
+        # Create converter with configuration
+        logger.info(f"  🔧 Creating converter with configuration...")
+        converter = MarkdownToPDF(config=config)
+        logger.info(f"  ✅ Converter created successfully")
+        
+        # Parse slides once for both HTML and PDF
+        logger.info(f"  📝 Parsing slides...")
+        slides = converter.parse_markdown_slides(content, SHOWCASE_DIR)
+        logger.info(f"  ✅ Found {len(slides)} slides")
+        
+        # Generate HTML
+        logger.info(f"  🌐 Generating HTML...")
+        
+        # Calculate initial slide number display
+        slide_format = _get_slide_number_format(config.get('slide_number.format', 'current/total'))
+        initial_slide_number = slide_format.replace('{current}', '1').replace('{total}', str(len(slides)))
+        if '{percent}' in initial_slide_number:
+            initial_percent = round((1 / len(slides)) * 100)
+            initial_slide_number = initial_slide_number.replace('{percent}', str(initial_percent))
+        
+        html_content = converter.template.render(
+            title=f'Bodh {example_name.replace("-", " ").title()} Demo',
+            slides=slides,
+            css=converter.css,
+            font_family=config.get('font.family', 'Inter'),
+            logo_data=None,  # Logo will be handled by config
+            logo_position=config.get('logo.location', 'top-right'),
+            enable_navigation=config.get('navigation.enabled', True),
+            show_arrows=config.get('navigation.show_arrows', True),
+            show_dots=config.get('navigation.show_dots', True),
+            show_slide_numbers=config.get('slide_number.enabled', True),
+            config=config,
+            has_math=config.get('math.enabled', True) and _slides_have_math(slides),
+            slide_number_format=slide_format,
+            initial_slide_number=initial_slide_number
+        )
+        
+        # Write HTML file
+        html_path = f'docs/examples/{example_name}.html'
+        logger.info(f"  💾 Writing HTML to {html_path}...")
+        # Encode up front so the whole page goes out in one write instead of 8 KiB text chunks
+        _write_html(html_path, html_content.encode('utf-8'))
+        logger.info(f"  ✅ HTML saved: {html_path}")
+        html_saved = html_path
+        
+        # Prepare the PDF for configuration examples from the in-memory content - no temporary markdown file
+        pdf_job = _prepare_pdf(converter, content, f'docs/pdfs/{example_name}.pdf', example_name, slides)
+            
+    except Exception as e:
+        logger.error(f"  ❌ Error generating {example_name}: {e}")
+        logger.error(f"  📋 Full error trace: {traceback.format_exc()}")
+    
+    _flush_logs()
+    return html_saved, pdf_job
+
+def _tree_lines(path, level=0):
+    """List a directory tree with file sizes, using scandir's cached stat results"""
+    files, dirs = [], []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                dirs.append(entry.path)
+            else:
+                files.append(f"{'  ' * (level + 1)}{entry.name} ({entry.stat().st_size} bytes)")
+    lines = [f"{'  ' * level}{os.path.basename(path)}/"] + files
+    for dir_path in dirs:
+        lines.extend(_tree_lines(dir_path, level + 1))
+    return lines
+
+def generate_examples(force=False):
+    """Generate HTML and PDF examples for all themes (force: ignore up-to-date stamps)"""
+    
+    _setup_logging()
+    logger.info("🚀 Starting Bodh example generation...")
+    logger.info(f"📁 Current working directory: {os.getcwd()}")
     
     # Create output directories
-    print("📂 Creating output directories...")
+    logger.info("📂 Creating output directories...")
     os.makedirs('docs/examples', exist_ok=True)
     os.makedirs('docs/pdfs', exist_ok=True)
-    print("✅ Output directories created: docs/examples/ and docs/pdfs/")
+    logger.info("✅ Output directories created: docs/examples/ and docs/pdfs/")
     
     # Check if showcase file exists
     if not os.path.exists('examples/showcase.md'):
-        print("❌ Error: examples/showcase.md not found")
-        print("📁 Current directory contents:")
+        logger.error("❌ Error: examples/showcase.md not found")
+        logger.info("📁 Current directory contents:")
         for item in os.listdir('.'):
-            print(f"  - {item}")
+            logger.info(f"  - {item}")
         return
     
     # Read showcase content
-    print("📖 Reading showcase.md content...")
+    logger.info("📖 Reading showcase.md content...")
     with open('examples/showcase.md', 'r') as f:
         content = f.read()
-    print(f"✅ Read {len(content)} characters from showcase.md")
+    logger.info(f"✅ Read {len(content)} characters from showcase.md")
     
     # Basic theme examples
-    themes = ['modern', 'minimal', 'gradient', 'dark', 'default', 'sky', 'solarized', 'moon']
-    print(f"🎨 Will generate examples for {len(themes)} themes: {', '.join(themes)}")
+    themes = THEMES
+    logger.info(f"🎨 Will generate examples for {len(themes)} themes: {', '.join(themes)}")
+    
+    # Skip themes whose inputs are unchanged since their last complete generation
+    images = _showcase_images(content)
+    stale_themes = themes if force else [theme for theme in themes if _needs_regen(theme, images)]
+    for theme in themes:
+        if theme not in stale_themes:
+            logger.info(f"⏭️  Skipping {theme}: inputs unchanged (use --force to regenerate)")
     
     # Configuration-based examples
     config_examples = [
@@ -59,203 +426,81 @@ def generate_examples():
         ('math-demo', 'configs/math-demo.yml'),
         ('hrule-demo', 'configs/hrule-demo.yml')
     ]
-    print(f"⚙️ Will generate {len(config_examples)} configuration examples")
+    logger.info(f"⚙️ Will generate {len(config_examples)} configuration examples")
     
-    html_generated = 0
-    pdf_generated = 0
+    # Check configuration inputs once up front, so the workers do no existence checks
+    missing = [config_path for _, config_path in config_examples if not os.path.exists(config_path)]
+    if missing:
+        logger.error(f"❌ Config files not found, skipping: {', '.join(missing)}")
+        config_examples = [example for example in config_examples if example[1] not in missing]
+    config_contents = []
+    for example_name, _ in config_examples:
+        content_file = CONFIG_CONTENT_FILES.get(example_name)
+        if content_file and os.path.exists(content_file):
+            with open(content_file, 'r') as f:
+                config_contents.append(f.read())
+            logger.info(f"📖 Using {os.path.basename(content_file)} content for {example_name}")
+        else:
+            config_contents.append(content)
     
-    for i, theme in enumerate(themes, 1):
-        print(f"\n🎨 [{i}/{len(themes)}] Generating examples for theme: {theme}")
-        
-        try:
-            print(f"  🔧 Creating MarkdownToPDF converter for {theme}...")
-            # Create converter
-            converter = MarkdownToPDF(theme=theme, font_family='Inter', font_size=20)
-            print(f"  ✅ Converter created successfully")
-            
-            print(f"  📝 Parsing slides from markdown...")
-            # Parse slides
-            slides = converter.parse_markdown_slides(content)
-            print(f"  ✅ Found {len(slides)} slides")
-            
-            print(f"  🌐 Generating HTML content...")
-            # Generate HTML with navigation
-            html_content = converter.template.render(
-                title=f'Bodh Showcase - {theme.title()} Theme',
-                slides=slides,
-                css=converter.css,
-                font_family='Inter',
-                logo_data=None,
-                logo_position='top-right',
-                enable_navigation=True,
-                show_arrows=True,
-                config=converter.config,
-                show_dots=True,
-                show_slide_numbers=True,
-                slide_number_format='{current}/{total}',
-                initial_slide_number='1'
-            )
-            print(f"  ✅ Generated {len(html_content)} characters of HTML")
-            
-            # Write HTML file
-            html_path = f'docs/examples/showcase-{theme}.html'
-            print(f"  💾 Writing HTML to {html_path}...")
-            with open(html_path, 'w') as f:
-                f.write(html_content)
-            print(f"  ✅ HTML saved: {html_path}")
-            html_generated += 1
-            
-            # Generate PDF for all themes
-            try:
-                pdf_path = f'docs/pdfs/showcase-{theme}.pdf'
-                print(f"  📄 Generating PDF: {pdf_path}...")
-                converter.convert_to_pdf('examples/showcase.md', pdf_path)
-                print(f"  ✅ PDF generated: {pdf_path}")
-                pdf_generated += 1
-            except Exception as pdf_error:
-                print(f"  ⚠️  Warning: Could not generate PDF for {theme}: {pdf_error}")
-                import traceback
-                print(f"  📋 PDF error trace: {traceback.format_exc()}")
-                # Continue without PDF generation
-                
-        except Exception as e:
-            print(f"  ❌ Error generating {theme}: {e}")
-            import traceback
-            print(f"  📋 Full error trace: {traceback.format_exc()}")
-            continue
+    # Parse the showcase once; themes that parse the same way reuse these slides
+    logger.info("📝 Parsing showcase slides...")
+    parser = MarkdownToPDF(theme=themes[0], font_family='Inter', font_size=20)
+    slides = parser.parse_markdown_slides(content, SHOWCASE_DIR)
+    logger.info(f"✅ Found {len(slides)} slides")
     
-    # Generate configuration-based examples
-    print(f"\n⚙️ Generating configuration-based examples...")
-    for i, (example_name, config_path) in enumerate(config_examples, 1):
-        print(f"\n🔧 [{i}/{len(config_examples)}] Generating {example_name} with {config_path}")
+    # Themes and configuration examples are independent - render them in parallel
+    # Flush before forking workers so they don't inherit (and repeat) buffered output
+    _flush_logs()
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_setup_logging) as executor:
+        theme_results = list(executor.map(
+            partial(_render_theme, content=content, slides=slides, slides_key=parser.slide_parse_key()),
+            stale_themes))
         
-        try:
-            # Check if config file exists
-            if not os.path.exists(config_path):
-                print(f"  ❌ Config file not found: {config_path}")
-                continue
-                
-            print(f"  📖 Loading configuration from {config_path}")
-            from config import load_config
-            config = load_config(config_path)
-            print(f"  ✅ Configuration loaded successfully")
-            
-            # Create converter with configuration
-            print(f"  🔧 Creating converter with configuration...")
-            converter = MarkdownToPDF(config=config)
-            print(f"  ✅ Converter created successfully")
-            
-            # Use appropriate content for config examples
-            showcase_content = content
-            if example_name == 'feature-showcase' and os.path.exists('examples/feature-showcase.md'):
-                with open('examples/feature-showcase.md', 'r') as f:
-                    showcase_content = f.read()
-                print(f"  📖 Using feature-showcase.md content")
-            elif example_name == 'advanced-features' and os.path.exists('examples/advanced-features.md'):
-                with open('examples/advanced-features.md', 'r') as f:
-                    showcase_content = f.read()
-                print(f"  📖 Using advanced-features.md content")
-            elif example_name == 'math-demo' and os.path.exists('examples/math-demo.md'):
-                with open('examples/math-demo.md', 'r') as f:
-                    showcase_content = f.read()
-                print(f"  📖 Using math-demo.md content")
-            elif example_name == 'multi-column-demo' and os.path.exists('examples/multi-column-demo.md'):
-                with open('examples/multi-column-demo.md', 'r') as f:
-                    showcase_content = f.read()
-                print(f"  📖 Using multi-column-demo.md content")
-            
-            # Parse slides
-            print(f"  📝 Parsing slides...")
-            slides = converter.parse_markdown_slides(showcase_content)
-            print(f"  ✅ Found {len(slides)} slides")
-            
-            # Generate HTML
-            print(f"  🌐 Generating HTML...")
-            
-            # Calculate initial slide number display
-            slide_format = _get_slide_number_format(config.get('slide_number.format', 'current/total'))
-            initial_slide_number = slide_format.replace('{current}', '1').replace('{total}', str(len(slides)))
-            if '{percent}' in initial_slide_number:
-                initial_percent = round((1 / len(slides)) * 100)
-                initial_slide_number = initial_slide_number.replace('{percent}', str(initial_percent))
-            
-            html_content = converter.template.render(
-                title=f'Bodh {example_name.replace("-", " ").title()} Demo',
-                slides=slides,
-                css=converter.css,
-                font_family=config.get('font.family', 'Inter'),
-                logo_data=None,  # Logo will be handled by config
-                logo_position=config.get('logo.location', 'top-right'),
-                enable_navigation=config.get('navigation.enabled', True),
-                show_arrows=config.get('navigation.show_arrows', True),
-                show_dots=config.get('navigation.show_dots', True),
-                show_slide_numbers=config.get('slide_number.enabled', True),
-                config=config,
-                slide_number_format=slide_format,
-                initial_slide_number=initial_slide_number
-            )
-            
-            # Write HTML file
-            html_path = f'docs/examples/{example_name}.html'
-            print(f"  💾 Writing HTML to {html_path}...")
-            with open(html_path, 'w') as f:
-                f.write(html_content)
-            print(f"  ✅ HTML saved: {html_path}")
-            html_generated += 1
-            
-            # Generate PDF for configuration examples
-            try:
-                pdf_path = f'docs/pdfs/{example_name}.pdf'
-                print(f"  📄 Generating PDF: {pdf_path}...")
-                
-                # Use showcase content for PDF generation
-                temp_md_file = f'temp_{example_name}.md'
-                with open(temp_md_file, 'w') as f:
-                    f.write(showcase_content)
-                
-                converter.convert_to_pdf(temp_md_file, pdf_path)
-                os.remove(temp_md_file)  # Clean up temp file
-                
-                print(f"  ✅ PDF generated: {pdf_path}")
-                pdf_generated += 1
-            except Exception as pdf_error:
-                print(f"  ⚠️  Warning: Could not generate PDF for {example_name}: {pdf_error}")
-                
-        except Exception as e:
-            print(f"  ❌ Error generating {example_name}: {e}")
-            import traceback
-            print(f"  📋 Full error trace: {traceback.format_exc()}")
-            continue
+        logger.info(f"\n⚙️ Generating configuration-based examples...")
+        _flush_logs()
+        config_results = list(executor.map(
+            _render_config,
+            [example_name for example_name, _ in config_examples],
+            [config_path for _, config_path in config_examples],
+            config_contents))
+    
+    results = theme_results + config_results
+    html_generated = sum(1 for html_path, _ in results if html_path)
+    
+    # PDFs render concurrently, one browser context each, overlapping their load/MathJax/print phases
+    pdf_jobs = [pdf_job for _, pdf_job in results if pdf_job]
+    logger.info(f"\n📄 Rendering {len(pdf_jobs)} PDFs concurrently...")
+    _flush_logs()
+    pdf_paths = set(asyncio.run(_render_pdfs(pdf_jobs))) - {None}
+    pdf_generated = len(pdf_paths)
+    
+    # Stamp the themes that produced both outputs, so unchanged reruns skip them
+    for theme, (html_path, _) in zip(stale_themes, theme_results):
+        if html_path and THEME_PATHS[theme][1] in pdf_paths:
+            _write_stamp(theme, images)
     
-    print(f"\n🎉 Example generation completed!")
-    print(f"📊 Summary: {html_generated} HTML files, {pdf_generated} PDF files generated")
+    logger.info(f"\n🎉 Example generation completed!")
+    logger.info(f"📊 Summary: {html_generated} HTML files, {pdf_generated} PDF files generated, "
+                f"{len(themes) - len(stale_themes)} themes unchanged")
     
     # Ensure index.html exists
     if not os.path.exists('docs/index.html'):
-        print("🔧 Creating fallback index.html...")
+        logger.info("🔧 Creating fallback index.html...")
         create_fallback_index()
-        print("✅ Fallback index.html created")
+        logger.info("✅ Fallback index.html created")
     else:
-        print("✅ Index.html already exists")
+        logger.info("✅ Index.html already exists")
     
     # Final verification
-    print(f"\n📁 Final verification of docs/ directory:")
+    logger.info(f"\n📁 Final verification of docs/ directory:")
     if os.path.exists('docs'):
-        for root, dirs, files in os.walk('docs'):
-            level = root.replace('docs', '').count(os.sep)
-            indent = ' ' * 2 * level
-            print(f"{indent}{os.path.basename(root)}/")
-            subindent = ' ' * 2 * (level + 1)
-            for file in files:
-                file_path = os.path.join(root, file)
-                size = os.path.getsize(file_path)
-                print(f"{subindent}{file} ({size} bytes)")
+        logger.info('\n'.join(_tree_lines('docs')))
     else:
-        print("❌ No docs directory found!")
+        logger.error("❌ No docs directory found!")
 
-def create_fallback_index():
-    """Create a fallback index.html if it doesn't exist"""
-    index_content = """<!DOCTYPE html>
+# Fallback landing page, encoded once so it is written with a single bytes write
+_INDEX_HTML_BYTES = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -299,11 +544,14 @@ def create_fallback_index():
     
     <p><a href="https://github.com/nipunbatra/Bodh">View on GitHub</a></p>
 </body>
-</html>"""
-    
-    with open('docs/index.html', 'w') as f:
-        f.write(index_content)
-    print("Created fallback index.html")
+</html>""".encode('utf-8')
+
+def create_fallback_index():
+    """Create a fallback index.html if it doesn't exist"""
+    Path('docs/index.html').write_bytes(_INDEX_HTML_BYTES)
+    logger.info("Created fallback index.html")
 
 if __name__ == "__main__":
-    generate_examples()
\ No newline at end of file
+    arg_parser = argparse.ArgumentParser(description='Generate HTML and PDF examples for GitHub Pages')
+    arg_parser.add_argument('--force', action='store_true', help='Regenerate every theme, even if its inputs are unchanged')
+    generate_examples(force=arg_parser.parse_args().force)
\ No newline at end of file
@@ -4,15 +4,234 @@ LaTeX-based PDF Generation Engine
 Alternative to MathJax/browser-based PDF generation using native LaTeX
 """
 
+import atexit
+import functools
+import glob
+import hashlib
+import itertools
 import os
 import re
 import tempfile
 import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, TextIO
 import markdown
 from markdown.extensions import codehilite, tables, toc
+from utils import LATEX_RERUN_NEEDED, read_latex_log, read_markdown, user_cache_dir
+
+
+# Slide separator, the same "\n---\n" that bodh.py and mkpred.py split on
+SLIDE_SEPARATOR = "\n---\n"
+
+# Slide separator lines and a leading "# Title" line
+_SLIDE_SEPARATOR_RE = re.compile(r'^---\s*$', re.MULTILINE)
+_SLIDE_TITLE_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+
+# Blocks whose contents must not be touched: fenced code (```lang ... ```), $$display math$$ and $inline math$
+_MD_LATEX_BLOCK_RE = re.compile(
+    r'```(?:\w+)?\n(?P<code>.*?)\n```|\$\$(?P<math>.+?)\$\$|\$(?P<imath>[^$\n]+?)\$',
+    re.DOTALL
+)
+
+# Every other markdown construct, matched in one pass and dispatched on the named group
+_MD_LATEX_RE = re.compile(
+    r'^###[ \t]+(?P<h3>.+)$'
+    r'|^##[ \t]+(?P<h2>.+)$'
+    r'|^-[ \t]+(?P<item>.+)$'
+    r'|\*\*(?P<bold>.+?)\*\*'
+    r'|\*(?P<ital>[^*\n]+?)\*'
+    r'|`(?P<code>[^`\n]+?)`'
+    r'|(?P<para>\n\n)',
+    re.MULTILINE
+)
+
+
+def _md_latex_inline(text: str) -> str:
+    """Convert the inline markdown inside a header or list item"""
+    return _MD_LATEX_RE.sub(_md_latex_dispatch, text)
+
+
+def _md_latex_dispatch(match: re.Match) -> str:
+    """Return the LaTeX for one _MD_LATEX_RE match"""
+    kind = match.lastgroup
+    text = match.group(kind)
+    if kind == 'h3':
+        return f"\\textbf{{\\Large {_md_latex_inline(text)}}}\\\\[0.3cm]"
+    if kind == 'h2':
+        return f"\\textbf{{\\huge {_md_latex_inline(text)}}}\\\\[0.5cm]"
+    if kind == 'item':
+        return f"\\item {_md_latex_inline(text)}"
+    if kind == 'bold':
+        return f"\\textbf{{{_md_latex_inline(text)}}}"
+    if kind == 'ital':
+        return f"\\textit{{{text}}}"
+    if kind == 'code':
+        return f"\\texttt{{{text}}}"
+    return "\\\\[0.3cm]\n"
+
+
+# A run of consecutive \item lines (the last may end the text without a newline)
+_LATEX_ITEM_RUN_RE = re.compile(r'(?:^[^\S\n]*\\item[^\n]*(?:\n|\Z))+', re.MULTILINE)
+
+
+def _wrap_latex_lists(text: str) -> str:
+    """Wrap each run of \\item lines in an itemize environment with a single regex pass"""
+    def wrap(match):
+        items = match.group()
+        if match.end() < len(text):
+            return '\\begin{itemize}\n' + items + '\\end{itemize}\n'
+        if not items.endswith('\n'):
+            items += '\n'
+        return '\\begin{itemize}\n' + items + '\\end{itemize}'
+    
+    return _LATEX_ITEM_RUN_RE.sub(wrap, text)
+
+
+# Commands whose output is only right after an extra pass over the .aux file
+_LATEX_CROSS_REFERENCES = re.compile(r'\\(?:ref|pageref|eqref|cite|tableofcontents|listoffigures|listoftables)\b')
+
+# Upper bound on engine runs per document, including the final PDF-writing pass
+MAX_LATEX_PASSES = 3
+
+# Preamble formats precompiled with mylatexformat, shared by this user's compiles; a loaded
+# format runs its own TeX code, so it only comes from a private per-user cache directory
+LATEX_FORMAT_CACHE_SUBDIR = ('mkpred', 'latex-formats')
+
+# PDFs of documents generated from markdown, keyed by engine and .tex source hash, so an
+# unchanged deck skips TeX entirely (the generated LaTeX references no external files);
+# kept in a per-user cache directory since hits are copied to the output unchecked
+LATEX_PDF_CACHE_SUBDIR = ('mkpred', 'latex')
+
+# Engines whose format dumps can hold a whole preamble (LuaTeX cannot dump its Lua state)
+_FORMAT_ENGINES = ('pdflatex', 'xelatex')
+
+# Format names that failed to build or to compile with in this process
+_failed_formats = set()
+
+# Scratch directory reused by every compile in this process; job names keep documents apart
+_work_dir = None
+_job_ids = itertools.count()
+
+
+def _get_work_dir() -> str:
+    """Return this process's LaTeX scratch directory, creating it on first use"""
+    global _work_dir
+    if _work_dir is None:
+        _work_dir = tempfile.mkdtemp(prefix='latex_engine_')
+        atexit.register(shutil.rmtree, _work_dir, ignore_errors=True)
+    return _work_dir
+
+
+def _remove_job_files(tex_file: str) -> None:
+    """Remove a job's .tex/.aux/.log/.pdf files from the shared scratch directory"""
+    for job_file in glob.glob(glob.escape(tex_file[:-4]) + '.*'):
+        try:
+            os.remove(job_file)
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=None)
+def _format_cache_dir() -> Optional[Path]:
+    """The preamble format cache directory, or None when no private cache directory is available"""
+    return user_cache_dir(*LATEX_FORMAT_CACHE_SUBDIR)
+
+
+def _preamble_format(latex_cmd: str, preamble: str) -> Optional[str]:
+    """Format file (path without .fmt) with preamble precompiled for latex_cmd, or None"""
+    if latex_cmd not in _FORMAT_ENGINES:
+        return None
+    name = f"{latex_cmd}-{hashlib.sha1(preamble.encode('utf-8')).hexdigest()[:16]}"
+    cache_dir = _format_cache_dir()
+    if cache_dir is None or name in _failed_formats:
+        return None
+    fmt_base = os.path.join(cache_dir, name)
+    if os.path.isfile(fmt_base + '.fmt'):
+        return fmt_base
+    
+    # Dump the preamble once; the format then skips the document's own preamble when loaded
+    try:
+        build_dir = tempfile.mkdtemp(dir=cache_dir)
+        try:
+            with open(os.path.join(build_dir, name + '.tex'), 'w', encoding='utf-8') as f:
+                f.write(preamble)
+                f.write("\\begin{document}\n\\end{document}\n")
+            result = subprocess.run([latex_cmd, '-ini', '-interaction=nonstopmode', f'-jobname={name}',
+                                     f'&{latex_cmd}', 'mylatexformat.ltx', name + '.tex'],
+                                    cwd=build_dir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                    timeout=60)
+            built_fmt = os.path.join(build_dir, name + '.fmt')
+            if result.returncode == 0 and os.path.isfile(built_fmt):
+                os.replace(built_fmt, fmt_base + '.fmt')
+                return fmt_base
+        finally:
+            shutil.rmtree(build_dir, ignore_errors=True)
+    except (OSError, subprocess.TimeoutExpired):
+        pass
+    
+    _failed_formats.add(name)
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _pdf_cache_dir() -> Optional[Path]:
+    """The compiled PDF cache directory, or None when no private cache directory is available"""
+    return user_cache_dir(*LATEX_PDF_CACHE_SUBDIR)
+
+
+def _pdf_cache_path(latex_cmd: str, tex_file: str) -> Optional[str]:
+    """Cache location of the PDF latex_cmd produces for tex_file's exact source, or None without a cache"""
+    cache_dir = _pdf_cache_dir()
+    if cache_dir is None:
+        return None
+    digest = hashlib.blake2b(latex_cmd.encode('utf-8'), digest_size=16)
+    with open(tex_file, 'rb') as f:
+        for block in iter(partial(f.read, 1 << 16), b''):
+            digest.update(block)
+    return os.path.join(cache_dir, digest.hexdigest() + '.pdf')
+
+
+def _store_cached_pdf(cache_path: str, pdf_file: str) -> None:
+    """Atomically add a compiled PDF to the cache (best effort)"""
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix='.tmp')
+        os.close(fd)
+        shutil.copyfile(pdf_file, tmp_path)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def _discard_format(fmt_base: str) -> None:
+    """Stop using a format that broke a compile the plain engine handles (e.g. after a TeX upgrade)"""
+    _failed_formats.add(os.path.basename(fmt_base))
+    try:
+        os.remove(fmt_base + '.fmt')
+    except OSError:
+        pass
+
+
+_INV_255 = 1.0 / 255.0
+
+
+@functools.lru_cache(maxsize=64)
+def _hex_to_latex_color(hex_color: str) -> str:
+    """Convert hex color to LaTeX RGB format"""
+    hex_color = hex_color.lstrip('#')
+    if len(hex_color) != 6:
+        return "RGB{0,0,0}"  # Default to black
+    
+    try:
+        value = int(hex_color, 16)
+    except ValueError:
+        return "RGB{0,0,0}"
+    r = (value >> 16) & 0xff
+    g = (value >> 8) & 0xff
+    b = value & 0xff
+    return f"RGB{{{r * _INV_255:.3f},{g * _INV_255:.3f},{b * _INV_255:.3f}}}"
 
 
 class LaTeXPDFEngine:
@@ -50,17 +269,24 @@ class LaTeXPDFEngine:
         
         try:
             # Read markdown content
-            with open(markdown_file, 'r', encoding='utf-8') as f:
-                md_content = f.read()
-            
+            md_content = read_markdown(markdown_file)
+        except Exception as e:
+            print(f"LaTeX conversion failed: {e}")
+            return False
+        
+        return self.convert_markdown_text_to_pdf(md_content, output_file)
+    
+    def convert_markdown_text_to_pdf(self, md_content: str, output_file: str) -> bool:
+        """Convert markdown already in memory to PDF using LaTeX"""
+        if not self.latex_available:
+            raise RuntimeError("LaTeX not available on system. Install texlive or similar.")
+        
+        try:
             # Parse slides
             slides = self._parse_slides(md_content)
             
-            # Generate LaTeX
-            latex_content = self._generate_latex(slides)
-            
-            # Compile to PDF
-            return self._compile_latex_to_pdf(latex_content, output_file)
+            # Generate LaTeX straight into the .tex file and compile it to PDF
+            return self._compile_slides_to_pdf(slides, output_file)
             
         except Exception as e:
             print(f"LaTeX conversion failed: {e}")
@@ -68,8 +294,11 @@ class LaTeXPDFEngine:
     
     def _parse_slides(self, md_content: str) -> List[Dict[str, str]]:
         """Parse markdown content into slides"""
-        # Split by slide separators
-        slide_contents = re.split(r'^---\s*$', md_content, flags=re.MULTILINE)
+        # Split by slide separators: a plain "\n---\n" split covers well-formed decks, the
+        # regex handles loose separators (trailing whitespace, --- on the first line)
+        slide_contents = md_content.split(SLIDE_SEPARATOR)
+        if len(slide_contents) < 2:
+            slide_contents = _SLIDE_SEPARATOR_RE.split(md_content)
         
         slides = []
         for i, content in enumerate(slide_contents):
@@ -78,12 +307,12 @@ class LaTeXPDFEngine:
                 continue
                 
             # Extract title (first heading)
-            title_match = re.match(r'^#\s+(.+)$', content, re.MULTILINE)
+            title_match = _SLIDE_TITLE_RE.match(content)
             title = title_match.group(1) if title_match else f"Slide {i+1}"
             
             # Remove title from content for body
             if title_match:
-                body = re.sub(r'^#\s+.+$', '', content, count=1, flags=re.MULTILINE).strip()
+                body = content[title_match.end():].strip()
             else:
                 body = content
             
@@ -95,32 +324,27 @@ class LaTeXPDFEngine:
         
         return slides
     
-    def _generate_latex(self, slides: List[Dict[str, str]]) -> str:
-        """Generate LaTeX document from slides"""
-        
-        # Get theme colors and settings
-        theme = self.config.get('theme', {})
-        colors = theme.get('colors', {})
-        font_family = self.config.get('font', {}).get('family', 'sans')
-        
-        # LaTeX preamble
-        latex_content = self._get_latex_preamble()
-        
-        # Document start
-        latex_content += "\\begin{document}\n\n"
-        
-        # Generate slides
-        for slide in slides:
-            latex_content += self._generate_slide_latex(slide)
-            latex_content += "\n\\newpage\n\n"
-        
-        # Remove last newpage
-        latex_content = latex_content.rstrip("\\newpage\n\n")
+    def _stream_latex(self, slides: List[Dict[str, str]], fh: TextIO) -> bool:
+        """Write the LaTeX document for slides to fh one slide at a time; True if it has cross-references"""
+        
+        # Preamble and document start
+        preamble = self._get_latex_preamble()
+        fh.write(preamble)
+        fh.write("\\begin{document}\n\n")
+        cross_references = _LATEX_CROSS_REFERENCES.search(preamble) is not None
+        
+        # Generate slides, with a page break between consecutive slides
+        for i, slide in enumerate(slides):
+            if i:
+                fh.write("\n\\newpage\n\n")
+            slide_latex = self._generate_slide_latex(slide)
+            cross_references = cross_references or _LATEX_CROSS_REFERENCES.search(slide_latex) is not None
+            fh.write(slide_latex)
         
         # Document end
-        latex_content += "\n\\end{document}"
+        fh.write("\n\\end{document}")
         
-        return latex_content
+        return cross_references
     
     def _get_latex_preamble(self) -> str:
         """Generate LaTeX preamble with packages and settings"""
@@ -128,9 +352,9 @@ class LaTeXPDFEngine:
         colors = theme.get('colors', {})
         
         # Convert hex colors to LaTeX format
-        bg_color = self._hex_to_latex_color(colors.get('background', '#ffffff'))
-        text_color = self._hex_to_latex_color(colors.get('text', '#000000'))
-        accent_color = self._hex_to_latex_color(colors.get('accent', '#2563eb'))
+        bg_color = _hex_to_latex_color(colors.get('background', '#ffffff'))
+        text_color = _hex_to_latex_color(colors.get('text', '#000000'))
+        accent_color = _hex_to_latex_color(colors.get('accent', '#2563eb'))
         
         # Use simplified preamble that works with pdflatex
         preamble = f"""\\documentclass[11pt]{{article}}
@@ -188,20 +412,6 @@ class LaTeXPDFEngine:
 """
         return preamble
     
-    def _hex_to_latex_color(self, hex_color: str) -> str:
-        """Convert hex color to LaTeX RGB format"""
-        hex_color = hex_color.lstrip('#')
-        if len(hex_color) != 6:
-            return "RGB{0,0,0}"  # Default to black
-        
-        try:
-            r = int(hex_color[0:2], 16) / 255
-            g = int(hex_color[2:4], 16) / 255  
-            b = int(hex_color[4:6], 16) / 255
-            return f"RGB{{{r:.3f},{g:.3f},{b:.3f}}}"
-        except ValueError:
-            return "RGB{0,0,0}"
-    
     def _generate_slide_latex(self, slide: Dict[str, str]) -> str:
         """Generate LaTeX for a single slide"""
         title = slide['title']
@@ -225,100 +435,134 @@ class LaTeXPDFEngine:
     
     def _markdown_to_latex(self, md_content: str) -> str:
         """Convert markdown content to LaTeX"""
-        
-        # Handle math equations (already in LaTeX format)
-        # Inline math: $...$ stays as $...$
-        # Display math: $$...$$ becomes \\[...\\]
-        content = re.sub(r'\\$\\$(.+?)\\$\\$', r'\\\\[\\1\\\\]', md_content, flags=re.DOTALL)
-        
-        # Headers
-        content = re.sub(r'^### (.+)$', r'\\textbf{\\Large \\1}\\\\[0.3cm]', content, flags=re.MULTILINE)
-        content = re.sub(r'^## (.+)$', r'\\textbf{\\huge \\1}\\\\[0.5cm]', content, flags=re.MULTILINE)
-        
-        # Bold and italic
-        content = re.sub(r'\\*\\*(.+?)\\*\\*', r'\\textbf{\\1}', content)
-        content = re.sub(r'\\*(.+?)\\*', r'\\textit{\\1}', content)
-        
-        # Lists
-        content = re.sub(r'^- (.+)$', r'\\item \\1', content, flags=re.MULTILINE)
-        
-        # Wrap lists in itemize environment
-        lines = content.split('\\n')
-        in_list = False
-        result_lines = []
-        
-        for line in lines:
-            if line.strip().startswith('\\item'):
-                if not in_list:
-                    result_lines.append('\\begin{itemize}')
-                    in_list = True
-                result_lines.append(line)
+        parts = []
+        start = 0
+        
+        # Fenced code and math are copied verbatim; everything between them
+        # is converted in a single scan with the combined inline pattern
+        for match in _MD_LATEX_BLOCK_RE.finditer(md_content):
+            parts.append(_MD_LATEX_RE.sub(_md_latex_dispatch, md_content[start:match.start()]))
+            if match.group('math') is not None:
+                parts.append(f"\\[{match.group('math')}\\]")
+            elif match.group('imath') is not None:
+                parts.append(match.group())
             else:
-                if in_list:
-                    result_lines.append('\\end{itemize}')
-                    in_list = False
-                result_lines.append(line)
+                parts.append(f"\\begin{{lstlisting}}\n{match.group('code')}\n\\end{{lstlisting}}")
+            start = match.end()
+        parts.append(_MD_LATEX_RE.sub(_md_latex_dispatch, md_content[start:]))
         
-        if in_list:
-            result_lines.append('\\end{itemize}')
-        
-        content = '\\n'.join(result_lines)
-        
-        # Code blocks
-        content = re.sub(r'```(\\w+)?\\n(.+?)\\n```', 
-                        r'\\begin{lstlisting}\\n\\2\\n\\end{lstlisting}', 
-                        content, flags=re.DOTALL)
+        # Wrap runs of \item lines in itemize environments
+        return _wrap_latex_lists(''.join(parts))
+    
+    def _compile_slides_to_pdf(self, slides: List[Dict[str, str]], output_file: str) -> bool:
+        """Stream the LaTeX for slides into a .tex file and compile it to PDF"""
         
-        # Inline code
-        content = re.sub(r'`(.+?)`', r'\\texttt{\\1}', content)
+        work_dir = _get_work_dir()
+        tex_file = os.path.join(work_dir, f"presentation-{os.getpid()}-{next(_job_ids)}.tex")
+        try:
+            with open(tex_file, 'w', encoding='utf-8') as f:
+                cross_references = self._stream_latex(slides, f)
+            
+            # An identical document was compiled before: reuse its PDF
+            cache_path = _pdf_cache_path(getattr(self, 'latex_engine', 'pdflatex'), tex_file)
+            if cache_path is not None:
+                try:
+                    shutil.copyfile(cache_path, output_file)
+                    return True
+                except FileNotFoundError:
+                    pass
+            
+            if not self._run_latex(work_dir, tex_file, output_file, cross_references,
+                                   self._get_latex_preamble()):
+                return False
+            if cache_path is not None:
+                _store_cached_pdf(cache_path, output_file)
+            return True
+        finally:
+            _remove_job_files(tex_file)
+    
+    def compile_many(self, latex_documents: List[str], output_files: List[str]) -> List[Optional[str]]:
+        """Compile several LaTeX documents in one shared work directory, running the engines concurrently"""
+        if not self.latex_available:
+            raise RuntimeError("LaTeX not available on system. Install texlive or similar.")
         
-        # Paragraphs (double newlines)
-        content = re.sub(r'\\n\\n', r'\\\\[0.3cm]\\n', content)
+        compile_job = partial(self._compile_in_dir, _get_work_dir())
+        jobnames = [f"presentation-{os.getpid()}-{next(_job_ids)}" for _ in latex_documents]
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(compile_job, jobnames, latex_documents, output_files))
         
-        return content
+        return [output_file if ok else None for output_file, ok in zip(output_files, results)]
     
-    def _compile_latex_to_pdf(self, latex_content: str, output_file: str) -> bool:
-        """Compile LaTeX content to PDF"""
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_dir_path = Path(temp_dir)
-            
-            # Write LaTeX file
-            tex_file = temp_dir_path / "presentation.tex"
+    def _compile_in_dir(self, work_dir: str, jobname: str, latex_content: str, output_file: str) -> bool:
+        """Compile one LaTeX document as work_dir/<jobname>.tex and copy the PDF to output_file"""
+        # Write LaTeX file
+        tex_file = os.path.join(work_dir, jobname + ".tex")
+        try:
             with open(tex_file, 'w', encoding='utf-8') as f:
                 f.write(latex_content)
             
-            try:
-                # Run LaTeX with detected engine
-                latex_cmd = getattr(self, 'latex_engine', 'pdflatex')
-                result = subprocess.run([
-                    latex_cmd, 
-                    '-interaction=nonstopmode',
-                    '-output-directory', str(temp_dir_path),
-                    str(tex_file)
-                ], capture_output=True, text=True, timeout=30)
-                
-                if result.returncode != 0:
-                    print(f"LaTeX compilation failed:")
-                    print(result.stdout)
-                    print(result.stderr)
-                    return False
-                
-                # Copy output PDF
-                pdf_file = temp_dir_path / "presentation.pdf"
-                if pdf_file.exists():
-                    shutil.copy2(pdf_file, output_file)
-                    return True
-                else:
-                    print("LaTeX compilation succeeded but no PDF generated")
-                    return False
-                    
-            except subprocess.TimeoutExpired:
-                print("LaTeX compilation timed out")
+            preamble, begin, _ = latex_content.partition("\\begin{document}")
+            return self._run_latex(work_dir, tex_file, output_file,
+                                   _LATEX_CROSS_REFERENCES.search(latex_content) is not None,
+                                   preamble if begin else None)
+        finally:
+            _remove_job_files(tex_file)
+    
+    def _run_latex(self, work_dir: str, tex_file: str, output_file: str, cross_references: bool,
+                   preamble: Optional[str] = None) -> bool:
+        """Run the LaTeX engine on tex_file inside work_dir and copy the PDF to output_file"""
+        try:
+            # Run LaTeX with detected engine, loading the precompiled preamble when one is available
+            latex_cmd = getattr(self, 'latex_engine', 'pdflatex')
+            fmt = _preamble_format(latex_cmd, preamble) if preamble else None
+            command = [latex_cmd, '-interaction=nonstopmode', '-output-directory', work_dir]
+            if fmt:
+                command.append(f'-fmt={fmt}')
+            log_file = tex_file[:-4] + ".log"
+            
+            # Documents with cross-references get draft passes (no PDF written, so no image
+            # compression) until references settle, then a single final pass writes the PDF
+            if cross_references:
+                draft_flag = '-no-pdf' if latex_cmd == 'xelatex' else '-draftmode'
+                for _ in range(MAX_LATEX_PASSES - 1):
+                    result = subprocess.run(command + [draft_flag, tex_file], stdout=subprocess.DEVNULL,
+                                            stderr=subprocess.DEVNULL, timeout=30)
+                    if result.returncode != 0:
+                        break
+                    if not LATEX_RERUN_NEEDED.search(read_latex_log(log_file)):
+                        break
+            
+            # Terminal output is discarded rather than decoded; the log has the same details
+            result = subprocess.run(command + [tex_file], stdout=subprocess.DEVNULL,
+                                    stderr=subprocess.DEVNULL, timeout=30)
+            
+            if result.returncode != 0 and fmt:
+                # Retry with the plain engine; drop the format if it was what broke the build
+                compiled = self._run_latex(work_dir, tex_file, output_file, cross_references)
+                if compiled:
+                    _discard_format(fmt)
+                return compiled
+            
+            if result.returncode != 0:
+                print(f"LaTeX compilation failed:")
+                print(read_latex_log(log_file))
                 return False
-            except Exception as e:
-                print(f"LaTeX compilation error: {e}")
+            
+            # Copy output PDF
+            pdf_file = tex_file[:-4] + ".pdf"
+            if os.path.isfile(pdf_file):
+                shutil.copy2(pdf_file, output_file)
+                return True
+            else:
+                print("LaTeX compilation succeeded but no PDF generated")
                 return False
+                
+        except subprocess.TimeoutExpired:
+            print("LaTeX compilation timed out")
+            return False
+        except Exception as e:
+            print(f"LaTeX compilation error: {e}")
+            return False
 
 
 def test_latex_engine():
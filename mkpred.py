@@ -4,15 +4,53 @@ mkpred - Convert Markdown to beautiful PDF presentations
 """
 
 import argparse
+import functools
+import io
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import markdown
-from jinja2 import Template
-from xhtml2pdf import pisa
 import re
 import json
 import base64
+from utils import read_markdown
+
+# Decks with at least this many slides render markdown in a process pool
+PARALLEL_SLIDE_THRESHOLD = 64
+
+# HTML above this size (in bytes) renders straight into the output file instead of memory
+IN_MEMORY_PDF_LIMIT = 8 * 1024 * 1024
+
+
+# HTML template for the presentation, compiled once per process (and cached as bytecode across runs)
+HTML_TEMPLATE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>{{ title }}</title>
+    <style>
+        {{ css }}
+    </style>
+</head>
+<body>
+    {% for slide in slides %}
+    <div class="slide">
+        {{ slide | safe }}
+    </div>
+    {% if not loop.last %}<div class="page-break"></div>{% endif %}
+    {% endfor %}
+</body>
+</html>
+        """
+
+
+@functools.lru_cache(maxsize=None)
+def _template_environment():
+    """Jinja2 environment holding HTML_TEMPLATE, built on first use (jinja2 is imported lazily)"""
+    from jinja2 import DictLoader, Environment, FileSystemBytecodeCache
+    return Environment(loader=DictLoader({'presentation.html': HTML_TEMPLATE}),
+                       bytecode_cache=FileSystemBytecodeCache())
 
 
 class MarkdownToPDF:
@@ -23,44 +61,28 @@ class MarkdownToPDF:
         self.font_size = font_size
         self.logo_path = logo_path
         self.logo_position = logo_position
+        import markdown
+        self._md = markdown.Markdown()
         self.template = self._get_html_template()
         self.css = self._get_css_styles()
         self.themes = self._get_themes()
     
     def parse_markdown_slides(self, md_content):
         """Parse markdown content into individual slides"""
-        slides = []
         slide_parts = md_content.split(f"\n{self.slide_separator}\n")
+        slide_parts = [slide_content.strip() for slide_content in slide_parts if slide_content.strip()]
         
-        for slide_content in slide_parts:
-            if slide_content.strip():
-                html_content = markdown.markdown(slide_content.strip())
-                slides.append(html_content)
-        
-        return slides
+        # Slides render independently, so large decks are spread across CPU cores
+        if len(slide_parts) < PARALLEL_SLIDE_THRESHOLD or (os.cpu_count() or 1) < 2:
+            # One Markdown instance, reset between slides, instead of a new one per slide
+            return [self._md.reset().convert(slide_content) for slide_content in slide_parts]
+        import markdown
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(markdown.markdown, slide_parts, chunksize=4))
     
     def _get_html_template(self):
         """HTML template for the presentation"""
-        return Template("""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>{{ title }}</title>
-    <style>
-        {{ css }}
-    </style>
-</head>
-<body>
-    {% for slide in slides %}
-    <div class="slide">
-        {{ slide | safe }}
-    </div>
-    {% if not loop.last %}<div class="page-break"></div>{% endif %}
-    {% endfor %}
-</body>
-</html>
-        """)
+        return _template_environment().get_template('presentation.html')
     
     def _get_css_styles(self):
         """CSS styles for beautiful presentations"""
@@ -175,8 +197,7 @@ class MarkdownToPDF:
             raise FileNotFoundError(f"Markdown file not found: {markdown_file}")
         
         # Read markdown content
-        with open(markdown_file, 'r', encoding='utf-8') as f:
-            md_content = f.read()
+        md_content = read_markdown(markdown_file)
         
         # Parse slides
         slides = self.parse_markdown_slides(md_content)
@@ -184,20 +205,34 @@ class MarkdownToPDF:
         if not slides:
             raise ValueError("No slides found in markdown file")
         
-        # Generate HTML
+        # Generate HTML, encoding to UTF-8 as it renders so the document never exists as one str
         title = Path(markdown_file).stem
-        html_content = self.template.render(
+        html_buffer = io.BytesIO()
+        self.template.stream(
             title=title,
             slides=slides,
             css=self.css
-        )
+        ).dump(html_buffer, encoding='utf-8')
+        html_size = html_buffer.tell()
+        html_buffer.seek(0)
         
         # Generate PDF
         if output_file is None:
             output_file = f"{title}.pdf"
         
-        with open(output_file, 'wb') as pdf_file:
-            pisa_status = pisa.CreatePDF(html_content, dest=pdf_file)
+        from xhtml2pdf import pisa
+        
+        # Relative images resolve against the markdown file rather than the working directory
+        source_path = os.path.abspath(markdown_file)
+        if html_size > IN_MEMORY_PDF_LIMIT:
+            with open(output_file, 'wb') as pdf_file:
+                pisa_status = pisa.CreatePDF(html_buffer, dest=pdf_file, path=source_path, encoding='utf-8')
+        else:
+            # Render into memory and write the finished PDF in one go
+            pdf_buffer = io.BytesIO()
+            pisa_status = pisa.CreatePDF(html_buffer, dest=pdf_buffer, path=source_path, encoding='utf-8')
+            if not pisa_status.err:
+                Path(output_file).write_bytes(pdf_buffer.getbuffer())
             
         if pisa_status.err:
             raise Exception("PDF generation failed")
@@ -205,20 +240,49 @@ class MarkdownToPDF:
         return output_file
 
 
+def _convert_file(input_file):
+    """Convert one file with a fresh converter (xhtml2pdf is not thread-safe); returns (output_file, error)"""
+    try:
+        return MarkdownToPDF().convert_to_pdf(input_file), None
+    except Exception as e:
+        return None, str(e)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Convert Markdown to beautiful PDF presentations')
-    parser.add_argument('input', help='Input markdown file')
-    parser.add_argument('-o', '--output', help='Output PDF file (optional)')
+    parser.add_argument('input', nargs='+', help='Input markdown file(s)')
+    parser.add_argument('-o', '--output', help='Output PDF file (optional, single input only)')
     parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output')
+    parser.add_argument('-j', '--jobs', type=int, help='Parallel conversions for multiple inputs (default: CPU count)')
     
     args = parser.parse_args()
+    if args.output and len(args.input) > 1:
+        parser.error("-o/--output can only be used with a single input file")
+    
+    if len(args.input) > 1:
+        # Each file converts in its own process, so conversions scale with cores
+        with ProcessPoolExecutor(max_workers=args.jobs or os.cpu_count()) as executor:
+            results = list(executor.map(_convert_file, args.input))
+        
+        failed = False
+        for input_file, (output_file, error) in zip(args.input, results):
+            if error:
+                failed = True
+                print(f"Error: {input_file}: {error}", file=sys.stderr)
+            elif args.verbose:
+                print(f"Successfully converted {input_file} to {output_file}")
+            else:
+                print(f"Generated: {output_file}")
+        if failed:
+            sys.exit(1)
+        return
     
     try:
         converter = MarkdownToPDF()
-        output_file = converter.convert_to_pdf(args.input, args.output)
+        output_file = converter.convert_to_pdf(args.input[0], args.output)
         
         if args.verbose:
-            print(f"Successfully converted {args.input} to {output_file}")
+            print(f"Successfully converted {args.input[0]} to {output_file}")
         else:
             print(f"Generated: {output_file}")
             
@@ -5,70 +5,78 @@ Enhanced version with themes, fonts, logos, and images
 """
 
 import argparse
+import binascii
+import functools
+import io
+import mimetypes
 import os
+import string
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import markdown
-from jinja2 import Template
-from xhtml2pdf import pisa
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache
 import re
 import json
-import base64
+from utils import SlideCache, source_fingerprint
 
 
-class MarkdownToPDF:
-    def __init__(self, theme='default', font_family='Inter', font_size=20, logo_path=None, logo_position='top-right'):
-        self.slide_separator = "---"
-        self.theme = theme
-        self.font_family = font_family
-        self.font_size = font_size
-        self.logo_path = logo_path
-        self.logo_position = logo_position
-        self.template = self._get_html_template()
-        self.themes = self._get_themes()
-    
-    def _encode_image(self, image_path):
-        """Encode image to base64 for embedding"""
-        try:
-            with open(image_path, 'rb') as img_file:
-                return base64.b64encode(img_file.read()).decode('utf-8')
-        except Exception as e:
-            print(f"Warning: Could not load image {image_path}: {e}")
-            return None
-    
-    def parse_markdown_slides(self, md_content):
-        """Parse markdown content into individual slides"""
-        slides = []
-        slide_parts = md_content.split(f"\n{self.slide_separator}\n")
-        
-        for slide_content in slide_parts:
-            if slide_content.strip():
-                html_content = markdown.markdown(slide_content.strip(), extensions=['fenced_code'])
-                slides.append(html_content)
-        
-        return slides
-    
-    def _get_html_template(self):
-        """HTML template for the presentation"""
-        return Template("""
+# Markdown extensions (and their settings) used for slide content
+SLIDE_MARKDOWN_EXTENSIONS = ['fenced_code']
+SLIDE_MARKDOWN_EXTENSION_CONFIGS = {}
+
+# Rendered slide HTML is cached by content hash in a per-user directory, so unchanged slides skip markdown
+SLIDE_CACHE_SUBDIR = ('mkpred', 'slides')
+
+# Images are base64-encoded in chunks of this many bytes (a multiple of 3, so chunks join cleanly)
+BASE64_CHUNK_SIZE = 57 * 1024
+
+
+def _slide_cache():
+    """Slide cache for this renderer: this module's code, the markdown version and the extension setup"""
+    key = '|'.join([
+        source_fingerprint(__file__), markdown.__version__,
+        json.dumps([SLIDE_MARKDOWN_EXTENSIONS, SLIDE_MARKDOWN_EXTENSION_CONFIGS], sort_keys=True)
+    ])
+    return SlideCache(SLIDE_CACHE_SUBDIR, key)
+
+
+# Leading bytes of the image formats a logo is likely to be in
+_IMAGE_SIGNATURES = (
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+)
+
+
+def _sniff_image_mime(header):
+    """MIME type of an image from its leading bytes, or None when the format is not recognized"""
+    for signature, mime_type in _IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return mime_type
+    return None
+
+
+# HTML template for the presentation, compiled once per process (and cached as bytecode across runs)
+HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <title>{{ title }}</title>
-    <link href="https://fonts.googleapis.com/css2?family={{ font_family.replace(' ', '+') }}:wght@300;400;600;700&display=swap" rel="stylesheet">
     <style>
         {{ css }}
     </style>
 </head>
 <body>
+    {% if logo_src %}
+    <div id="logo" class="logo logo-{{ logo_position }}">
+        <img src="{{ logo_src | e }}" alt="Logo">
+    </div>
+    {% endif %}
     {% for slide in slides %}
     <div class="slide">
-        {% if logo_data %}
-        <div class="logo logo-{{ logo_position }}">
-            <img src="data:image/png;base64,{{ logo_data }}" alt="Logo">
-        </div>
-        {% endif %}
         <div class="slide-content">
             {{ slide | safe }}
         </div>
@@ -77,71 +85,76 @@ class MarkdownToPDF:
     {% endfor %}
 </body>
 </html>
-        """)
-    
-    def _get_themes(self):
-        """Available themes inspired by reveal.js"""
-        return {
-            'default': {
-                'bg_color': '#ffffff',
-                'text_color': '#333333',
-                'heading_color': '#2c3e50',
-                'accent_color': '#3498db',
-                'code_bg': '#f4f4f4',
-                'quote_bg': '#f8f9fa'
-            },
-            'dark': {
-                'bg_color': '#2c3e50',
-                'text_color': '#ecf0f1',
-                'heading_color': '#3498db',
-                'accent_color': '#e74c3c',
-                'code_bg': '#34495e',
-                'quote_bg': '#34495e'
-            },
-            'sky': {
-                'bg_color': '#f0f8ff',
-                'text_color': '#2c3e50',
-                'heading_color': '#1e3a8a',
-                'accent_color': '#3b82f6',
-                'code_bg': '#e0f2fe',
-                'quote_bg': '#dbeafe'
-            },
-            'solarized': {
-                'bg_color': '#fdf6e3',
-                'text_color': '#657b83',
-                'heading_color': '#b58900',
-                'accent_color': '#d33682',
-                'code_bg': '#eee8d5',
-                'quote_bg': '#eee8d5'
-            },
-            'moon': {
-                'bg_color': '#1a202c',
-                'text_color': '#e2e8f0',
-                'heading_color': '#63b3ed',
-                'accent_color': '#ed8936',
-                'code_bg': '#2d3748',
-                'quote_bg': '#2d3748'
-            }
-        }
-    
-    def _get_css_styles(self):
-        """CSS styles for beautiful presentations"""
-        theme_colors = self.themes.get(self.theme, self.themes['default'])
-        
-        return f"""
+        """
+
+
+@functools.lru_cache(maxsize=None)
+def _template_environment():
+    """Jinja2 environment holding HTML_TEMPLATE, built on first use"""
+    return Environment(loader=DictLoader({'presentation.html': HTML_TEMPLATE}),
+                       bytecode_cache=FileSystemBytecodeCache())
+
+
+# Available themes inspired by reveal.js
+THEMES = {
+    'default': {
+        'bg_color': '#ffffff',
+        'text_color': '#333333',
+        'heading_color': '#2c3e50',
+        'accent_color': '#3498db',
+        'code_bg': '#f4f4f4',
+        'quote_bg': '#f8f9fa'
+    },
+    'dark': {
+        'bg_color': '#2c3e50',
+        'text_color': '#ecf0f1',
+        'heading_color': '#3498db',
+        'accent_color': '#e74c3c',
+        'code_bg': '#34495e',
+        'quote_bg': '#34495e'
+    },
+    'sky': {
+        'bg_color': '#f0f8ff',
+        'text_color': '#2c3e50',
+        'heading_color': '#1e3a8a',
+        'accent_color': '#3b82f6',
+        'code_bg': '#e0f2fe',
+        'quote_bg': '#dbeafe'
+    },
+    'solarized': {
+        'bg_color': '#fdf6e3',
+        'text_color': '#657b83',
+        'heading_color': '#b58900',
+        'accent_color': '#d33682',
+        'code_bg': '#eee8d5',
+        'quote_bg': '#eee8d5'
+    },
+    'moon': {
+        'bg_color': '#1a202c',
+        'text_color': '#e2e8f0',
+        'heading_color': '#63b3ed',
+        'accent_color': '#ed8936',
+        'code_bg': '#2d3748',
+        'quote_bg': '#2d3748'
+    }
+}
+
+# Presentation CSS: theme colors are str.format fields, font family, size and extra @page frames
+# become ${font_family} / ${font_size} / ${page_frames} string.Template placeholders once the colors are filled in
+CSS_TEMPLATE = """
         @page {{
             size: A4 landscape;
-            margin: 1.5cm;
+            margin: 1.5cm;${{page_frames}}
         }}
         
         body {{
-            font-family: '{self.font_family}', 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            font-family: '${{font_family}}', 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             line-height: 1.6;
-            color: {theme_colors['text_color']};
-            background-color: {theme_colors['bg_color']};
+            color: {text_color};
+            background-color: {bg_color};
             margin: 0;
             padding: 0;
-            font-size: {self.font_size}px;
+            font-size: ${{font_size}}px;
         }}
         
         .slide {{
@@ -151,7 +164,7 @@ class MarkdownToPDF:
             justify-content: center;
             padding: 3rem;
             box-sizing: border-box;
-            background-color: {theme_colors['bg_color']};
+            background-color: {bg_color};
             position: relative;
         }}
         
@@ -163,7 +176,7 @@ class MarkdownToPDF:
         }}
         
         .logo {{
-            position: absolute;
+            position: fixed;
             z-index: 100;
         }}
         
@@ -198,34 +211,33 @@ class MarkdownToPDF:
         }}
         
         h1 {{
-            color: {theme_colors['heading_color']};
+            color: {heading_color};
             font-size: 2.8em;
             margin-bottom: 1.5rem;
             text-align: center;
             font-weight: 700;
-            text-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            border-bottom: 4px solid {theme_colors['accent_color']};
+            border-bottom: 4px solid {accent_color};
             padding-bottom: 0.8rem;
         }}
         
         h2 {{
-            color: {theme_colors['heading_color']};
+            color: {heading_color};
             font-size: 2.2em;
             margin-bottom: 1.2rem;
             font-weight: 600;
-            border-left: 6px solid {theme_colors['accent_color']};
+            border-left: 6px solid {accent_color};
             padding-left: 1.5rem;
         }}
         
         h3 {{
-            color: {theme_colors['heading_color']};
+            color: {heading_color};
             font-size: 1.8em;
             margin-bottom: 1rem;
             font-weight: 600;
         }}
         
         h4 {{
-            color: {theme_colors['heading_color']};
+            color: {heading_color};
             font-size: 1.4em;
             margin-bottom: 0.8rem;
             font-weight: 600;
@@ -250,19 +262,18 @@ class MarkdownToPDF:
         }}
         
         li::marker {{
-            color: {theme_colors['accent_color']};
+            color: {accent_color};
             font-weight: 600;
         }}
         
         blockquote {{
-            background: {theme_colors['quote_bg']};
-            border-left: 6px solid {theme_colors['accent_color']};
+            background: {quote_bg};
+            border-left: 6px solid {accent_color};
             margin: 2rem 0;
             padding: 2rem;
             font-style: italic;
             font-size: 1.3em;
             border-radius: 8px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
         }}
         
         blockquote p {{
@@ -271,39 +282,39 @@ class MarkdownToPDF:
         }}
         
         code {{
-            background: {theme_colors['code_bg']};
+            background: {code_bg};
             padding: 0.3rem 0.6rem;
             border-radius: 4px;
             font-family: 'Fira Code', 'Courier New', monospace;
             font-size: 0.9em;
-            color: {theme_colors['accent_color']};
+            color: {accent_color};
             font-weight: 600;
         }}
         
         pre {{
-            background: {theme_colors['code_bg']};
+            background: {code_bg};
             padding: 2rem;
             border-radius: 8px;
             overflow-x: auto;
             font-size: 0.9em;
-            border: 1px solid {theme_colors['accent_color']};
+            border: 1px solid {accent_color};
             margin: 1.5rem 0;
         }}
         
         pre code {{
             background: none;
             padding: 0;
-            color: {theme_colors['text_color']};
+            color: {text_color};
             font-weight: 400;
         }}
         
         strong {{
-            color: {theme_colors['accent_color']};
+            color: {accent_color};
             font-weight: 700;
         }}
         
         em {{
-            color: {theme_colors['accent_color']};
+            color: {accent_color};
             font-style: italic;
         }}
         
@@ -313,7 +324,6 @@ class MarkdownToPDF:
             display: block;
             margin: 2rem auto;
             border-radius: 8px;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.2);
         }}
         
         table {{
@@ -323,13 +333,13 @@ class MarkdownToPDF:
         }}
         
         th, td {{
-            border: 1px solid {theme_colors['accent_color']};
+            border: 1px solid {accent_color};
             padding: 1rem;
             text-align: left;
         }}
         
         th {{
-            background-color: {theme_colors['accent_color']};
+            background-color: {accent_color};
             color: white;
             font-weight: 600;
         }}
@@ -343,21 +353,291 @@ class MarkdownToPDF:
         }}
         
         .highlight {{
-            background-color: {theme_colors['accent_color']};
+            background-color: {accent_color};
             color: white;
             padding: 0.2rem 0.5rem;
             border-radius: 4px;
         }}
         """
+
+# Drop shadows, opt-in: pisa rasterizes them slowly and they barely show in print
+SHADOW_CSS = """
+        h1 { text-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        blockquote { box-shadow: 0 2px 8px rgba(0,0,0,0.1); }
+        img { box-shadow: 0 4px 12px rgba(0,0,0,0.2); }
+        """
+
+# Static xhtml2pdf frame per logo position: pisa draws the single logo element on every page
+# (browsers repeat it through the position: fixed of .logo)
+LOGO_FRAMES = {
+    'top-left': 'top: 1cm; left: 2cm;',
+    'top-right': 'top: 1cm; right: 2cm;',
+    'bottom-left': 'bottom: 1cm; left: 2cm;',
+    'bottom-right': 'bottom: 1cm; right: 2cm;',
+}
+LOGO_FRAME_CSS = "\n            @frame logo_frame {{ -pdf-frame-content: logo; {position} width: 75pt; height: 45pt; }}"
+
+# CSS per theme with the colors already filled in, so a conversion only splices in the font
+_THEME_CSS_CACHE = {name: string.Template(CSS_TEMPLATE.format_map(colors)) for name, colors in THEMES.items()}
+
+
+class PisaBackend:
+    """Render HTML to PDF with xhtml2pdf (pure Python, no browser needed)"""
+    # pisa loads local image files itself, so images can be referenced by path
+    reads_local_files = True
+    renders_markdown = False
+    
+    def render(self, html_chunks, output_file):
+        from xhtml2pdf import pisa
+        
+        # Encode the template's chunks as they are generated, so the document never also
+        # exists as one big str
+        html_buffer = io.BytesIO()
+        for chunk in html_chunks:
+            html_buffer.write(chunk.encode('utf-8'))
+        html_buffer.seek(0)
+        
+        with open(output_file, 'wb') as pdf_file:
+            pisa_status = pisa.CreatePDF(html_buffer, dest=pdf_file, encoding='utf-8')
+        
+        if pisa_status.err:
+            raise Exception("PDF generation failed")
+    
+    def close(self):
+        pass
+
+
+class PlaywrightBackend:
+    """Render HTML to PDF with headless Chromium, launched once and reused for every document"""
+    # Pages are loaded from a string (about:blank), which may not read local files
+    reads_local_files = False
+    renders_markdown = False
+    
+    def __init__(self):
+        self._playwright = None
+        self._browser = None
+    
+    def render(self, html_chunks, output_file):
+        if self._browser is None:
+            from playwright.sync_api import sync_playwright
+            self._playwright = sync_playwright().start()
+            self._browser = self._playwright.chromium.launch(headless=True)
+        
+        page = self._browser.new_page()
+        try:
+            page.set_content(''.join(html_chunks), wait_until='networkidle')
+            # The CSS @page rule sets A4 landscape and the margins
+            page.pdf(path=output_file, print_background=True, prefer_css_page_size=True)
+        finally:
+            page.close()
+    
+    def close(self):
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+
+
+class LatexBackend:
+    """Typeset the markdown with native LaTeX (latex_engine.py): real math typesetting, no HTML step"""
+    reads_local_files = True
+    renders_markdown = True
+    
+    def __init__(self):
+        # One engine per theme color set; each checks for a LaTeX installation once
+        self._engines = {}
+    
+    def render_markdown(self, md_content, output_file, theme_colors):
+        from latex_engine import LaTeXPDFEngine
+        
+        colors = (theme_colors['bg_color'], theme_colors['text_color'], theme_colors['accent_color'])
+        engine = self._engines.get(colors)
+        if engine is None:
+            background, text, accent = colors
+            engine = self._engines[colors] = LaTeXPDFEngine(
+                {'theme': {'colors': {'background': background, 'text': text, 'accent': accent}}}
+            )
+        
+        if not engine.convert_markdown_text_to_pdf(md_content, output_file):
+            raise Exception("PDF generation failed")
+    
+    def close(self):
+        pass
+
+
+PDF_BACKENDS = {
+    'pisa': PisaBackend,
+    'playwright': PlaywrightBackend,
+    'latex': LatexBackend,
+}
+
+
+class MarkdownToPDF:
+    # Either a fenced code block (skipped whole) or a slide separator: a line holding only "---",
+    # with surrounding spaces/tabs and a CRLF ending allowed
+    _SLIDE_SEPARATOR_RE = re.compile(r'^[ \t]*```.*?^[ \t]*```[^\n]*$|^[ \t]*(?P<sep>---)[ \t]*\r?$',
+                                     re.MULTILINE | re.DOTALL)
+    
+    def __init__(self, theme='default', font_family='Inter', font_size=20, logo_path=None, logo_position='top-right',
+                 slide_cache=True, font_file=None, backend='pisa', fancy_shadows=False):
+        self.theme = theme
+        self.font_family = font_family
+        self.font_size = font_size
+        self.font_file = font_file
+        self.fancy_shadows = fancy_shadows
+        self.logo_path = logo_path
+        self.logo_position = logo_position
+        self._md = markdown.Markdown(extensions=SLIDE_MARKDOWN_EXTENSIONS,
+                                     extension_configs=SLIDE_MARKDOWN_EXTENSION_CONFIGS)
+        self.slide_cache = slide_cache
+        self._encoded_images = {}
+        self.template = self._get_html_template()
+        self.themes = self._get_themes()
+        self.backend = PDF_BACKENDS[backend]()
+    
+    def close(self):
+        """Release the PDF backend (e.g. the shared browser)"""
+        self.backend.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _encode_image(self, image_path):
+        """Encode image (or font) file to base64 for embedding, chunk by chunk into one preallocated buffer"""
+        try:
+            # Keyed on mtime and size too, so an image edited while the converter is alive is re-read
+            st = os.stat(image_path)
+            cache_key = (image_path, st.st_mtime_ns, st.st_size)
+            if cache_key in self._encoded_images:
+                return self._encoded_images[cache_key]
+            encoded = bytearray((st.st_size + 2) // 3 * 4)
+            offset = 0
+            with open(image_path, 'rb') as img_file:
+                while chunk := img_file.read(BASE64_CHUNK_SIZE):
+                    encoded_chunk = binascii.b2a_base64(chunk, newline=False)
+                    encoded[offset:offset + len(encoded_chunk)] = encoded_chunk
+                    offset += len(encoded_chunk)
+            del encoded[offset:]
+            self._encoded_images[cache_key] = encoded.decode('ascii')
+            return self._encoded_images[cache_key]
+        except Exception as e:
+            print(f"Warning: Could not load image {image_path}: {e}")
+            return None
+    
+    def _logo_source(self, image_path):
+        """Logo src: its file path, or a data URI with the sniffed MIME type if the extension is misleading"""
+        try:
+            with open(image_path, 'rb') as img_file:
+                mime_type = _sniff_image_mime(img_file.read(8))
+        except OSError as e:
+            print(f"Warning: Could not load image {image_path}: {e}")
+            return None
+        
+        if mime_type is None or mimetypes.guess_type(image_path)[0] == mime_type:
+            return os.path.abspath(image_path)
+        return self._logo_data_uri(image_path)
+    
+    def _font_source(self, font_path):
+        """Font src for @font-face: its file path, or a data URI when the backend cannot read local files"""
+        if self.backend.reads_local_files:
+            return os.path.abspath(font_path)
+        font_data = self._encode_image(font_path)
+        if not font_data:
+            return None
+        mime_type = mimetypes.guess_type(font_path)[0] or 'font/ttf'
+        return f"data:{mime_type};base64,{font_data}"
+    
+    def _logo_data_uri(self, image_path):
+        """Logo embedded as a data URI, typed by its magic bytes (falling back to the extension)"""
+        logo_data = self._encode_image(image_path)
+        if not logo_data:
+            return None
+        mime_type = (_sniff_image_mime(binascii.a2b_base64(logo_data[:12]))
+                     or mimetypes.guess_type(image_path)[0] or 'image/png')
+        return f"data:{mime_type};base64,{logo_data}"
+    
+    def parse_markdown_slides(self, md_content):
+        """Parse markdown content into individual slides"""
+        cache = _slide_cache() if self.slide_cache else None
+        slides = [self._render_slide(slide_content, cache) for slide_content in self._iter_slides(md_content)]
+        if cache is not None:
+            cache.prune()
+        return slides
+    
+    def _iter_slides(self, md_content):
+        """Yield stripped, non-empty slide sources, skipping '---' lines inside fenced code"""
+        start = 0
+        for match in self._SLIDE_SEPARATOR_RE.finditer(md_content):
+            if match.group('sep') is None:
+                continue  # '---' inside a fenced code block
+            slide = md_content[start:match.start()].strip()
+            if slide:
+                yield slide
+            start = match.end()
+        
+        slide = md_content[start:].strip()
+        if slide:
+            yield slide
+    
+    def _render_slide(self, slide_content, cache=None):
+        """Render one slide, reusing its cached HTML when the same source was rendered before"""
+        html_content = cache.get(slide_content) if cache is not None else None
+        if html_content is None:
+            # One Markdown instance, reset between slides, instead of a new one per slide
+            html_content = self._md.reset().convert(slide_content)
+            if cache is not None:
+                cache.put(slide_content, html_content)
+        return html_content
+    
+    def _get_html_template(self):
+        """HTML template for the presentation, compiled once and shared by all converters"""
+        return _template_environment().get_template('presentation.html')
+    
+    def _get_themes(self):
+        """Available themes inspired by reveal.js"""
+        return THEMES
+    
+    def _get_css_styles(self, with_logo=False):
+        """CSS styles for beautiful presentations (with_logo adds the page frame the logo is drawn in)"""
+        css_template = _THEME_CSS_CACHE.get(self.theme, _THEME_CSS_CACHE['default'])
+        page_frames = ''
+        if with_logo:
+            position = LOGO_FRAMES.get(self.logo_position, LOGO_FRAMES['top-right'])
+            page_frames = LOGO_FRAME_CSS.format(position=position)
+        css = css_template.substitute(font_family=self.font_family, font_size=self.font_size,
+                                      page_frames=page_frames)
+        
+        # Neither engine fetches web fonts, so a local font file is embedded through @font-face:
+        # pisa reads it by path, browsers (on about:blank) get it as a data URI
+        if self.font_file:
+            font_src = self._font_source(self.font_file)
+            if font_src:
+                css = f"@font-face {{ font-family: '{self.font_family}'; src: url('{font_src}'); }}" + css
+        if self.fancy_shadows:
+            css += SHADOW_CSS
+        return css
     
     def convert_to_pdf(self, markdown_file, output_file=None):
         """Convert markdown file to PDF presentation"""
-        if not os.path.exists(markdown_file):
-            raise FileNotFoundError(f"Markdown file not found: {markdown_file}")
-        
         # Read markdown content
-        with open(markdown_file, 'r', encoding='utf-8') as f:
-            md_content = f.read()
+        try:
+            with open(markdown_file, 'r', encoding='utf-8') as f:
+                md_content = f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Markdown file not found: {markdown_file}") from None
+        
+        # The LaTeX backend typesets the markdown itself, skipping the HTML pipeline
+        if self.backend.renders_markdown:
+            if output_file is None:
+                output_file = f"{Path(markdown_file).stem}.pdf"
+            self.backend.render_markdown(md_content, output_file,
+                                         self.themes.get(self.theme, self.themes['default']))
+            return output_file
         
         # Parse slides
         slides = self.parse_markdown_slides(md_content)
@@ -365,19 +645,22 @@ class MarkdownToPDF:
         if not slides:
             raise ValueError("No slides found in markdown file")
         
-        # Encode logo if provided
-        logo_data = None
-        if self.logo_path and os.path.exists(self.logo_path):
-            logo_data = self._encode_image(self.logo_path)
+        # The logo is emitted once and repeated on every page by the PDF engine; pisa reads
+        # the file itself, so it is referenced by path, while browsers get a data URI
+        logo_src = None
+        if self.logo_path:
+            if self.backend.reads_local_files:
+                logo_src = self._logo_source(self.logo_path)
+            else:
+                logo_src = self._logo_data_uri(self.logo_path)
         
         # Generate HTML
         title = Path(markdown_file).stem
-        html_content = self.template.render(
+        html_chunks = self.template.generate(
             title=title,
             slides=slides,
-            css=self._get_css_styles(),
-            font_family=self.font_family,
-            logo_data=logo_data,
+            css=self._get_css_styles(with_logo=logo_src is not None),
+            logo_src=logo_src,
             logo_position=self.logo_position
         )
         
@@ -385,28 +668,51 @@ class MarkdownToPDF:
         if output_file is None:
             output_file = f"{title}.pdf"
         
-        with open(output_file, 'wb') as pdf_file:
-            pisa_status = pisa.CreatePDF(html_content, dest=pdf_file)
-            
-        if pisa_status.err:
-            raise Exception("PDF generation failed")
+        self.backend.render(html_chunks, output_file)
         
         return output_file
 
 
+# Converter reused for every file a pool worker converts (keeps e.g. a browser warm)
+_worker_converter = None
+
+
+def _init_worker(converter_options):
+    """Build this worker process's converter once"""
+    global _worker_converter
+    _worker_converter = MarkdownToPDF(**converter_options)
+
+
+def _convert_file(input_file):
+    """Convert one file with this worker's converter; returns (output_file, error)"""
+    try:
+        return _worker_converter.convert_to_pdf(input_file), None
+    except Exception as e:
+        return None, str(e)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Convert Markdown to beautiful PDF presentations')
-    parser.add_argument('input', nargs='?', help='Input markdown file')
-    parser.add_argument('-o', '--output', help='Output PDF file (optional)')
+    parser.add_argument('input', nargs='*', help='Input markdown file(s)')
+    parser.add_argument('-o', '--output', help='Output PDF file (optional, single input only)')
     parser.add_argument('-t', '--theme', choices=['default', 'dark', 'sky', 'solarized', 'moon'], 
                        default='default', help='Theme for the presentation')
     parser.add_argument('-f', '--font', default='Inter', help='Font family (default: Inter)')
+    parser.add_argument('--font-file', help='TrueType font file to embed for the font family (system fonts otherwise)')
     parser.add_argument('-s', '--size', type=int, default=20, help='Base font size (default: 20)')
     parser.add_argument('-l', '--logo', help='Path to logo image')
     parser.add_argument('-p', '--position', choices=['top-left', 'top-right', 'bottom-left', 'bottom-right'],
                        default='top-right', help='Logo position (default: top-right)')
+    parser.add_argument('-b', '--backend', choices=sorted(PDF_BACKENDS), default='pisa',
+                       help='PDF renderer: pisa (xhtml2pdf), playwright (headless Chromium) or latex '
+                            '(native LaTeX, best for math) (default: pisa)')
+    parser.add_argument('--fancy-shadows', action='store_true',
+                       help='Add drop shadows to headings, images and quotes (slower with pisa)')
     parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output')
     parser.add_argument('--list-themes', action='store_true', help='List available themes')
+    parser.add_argument('--cache', action=argparse.BooleanOptionalAction, default=True,
+                       help='Reuse rendered HTML of unchanged slides between runs (default: on)')
+    parser.add_argument('-j', '--jobs', type=int, help='Parallel conversions for multiple inputs (default: CPU count)')
     
     args = parser.parse_args()
     
@@ -419,20 +725,48 @@ def main():
     
     if not args.input:
         parser.error("Input markdown file is required (unless using --list-themes)")
+    if args.output and len(args.input) > 1:
+        parser.error("-o/--output can only be used with a single input file")
+    if args.font_file and PDF_BACKENDS[args.backend].renders_markdown:
+        parser.error(f"--font-file is not supported by the {args.backend} backend")
+    
+    converter_options = {
+        'theme': args.theme,
+        'font_family': args.font,
+        'font_size': args.size,
+        'logo_path': args.logo,
+        'logo_position': args.position,
+        'slide_cache': args.cache,
+        'font_file': args.font_file,
+        'backend': args.backend,
+        'fancy_shadows': args.fancy_shadows,
+    }
+    
+    if len(args.input) > 1:
+        # Each worker process converts its share of the files with one converter
+        with ProcessPoolExecutor(max_workers=args.jobs or os.cpu_count(), initializer=_init_worker,
+                                 initargs=(converter_options,)) as executor:
+            results = list(executor.map(_convert_file, args.input))
+        
+        failed = False
+        for input_file, (output_file, error) in zip(args.input, results):
+            if error:
+                failed = True
+                print(f"Error: {input_file}: {error}", file=sys.stderr)
+            elif args.verbose:
+                print(f"Successfully converted {input_file} to {output_file}")
+            else:
+                print(f"Generated: {output_file}")
+        if failed:
+            sys.exit(1)
+        return
     
     try:
-        converter = MarkdownToPDF(
-            theme=args.theme,
-            font_family=args.font,
-            font_size=args.size,
-            logo_path=args.logo,
-            logo_position=args.position
-        )
-        
-        output_file = converter.convert_to_pdf(args.input, args.output)
+        with MarkdownToPDF(**converter_options) as converter:
+            output_file = converter.convert_to_pdf(args.input[0], args.output)
         
         if args.verbose:
-            print(f"Successfully converted {args.input} to {output_file}")
+            print(f"Successfully converted {args.input[0]} to {output_file}")
             print(f"Theme: {args.theme}")
             print(f"Font: {args.font} ({args.size}px)")
             if args.logo:
@@ -46,20 +46,16 @@ $$\\nabla \\times \\mathbf{B} = \\mu_0\\mathbf{J} + \\mu_0\\epsilon_0\\frac{\\pa
     for case_name, content in test_cases.items():
         print(f"\n🧪 Testing {case_name} math content...")
         
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
-            f.write(content)
-            temp_file = f.name
+        output_file = os.path.join(tempfile.gettempdir(), f"quick_mathjax_{case_name}.pdf")
         
         try:
             # Test with default settings
             start_time = time.time()
             
             converter = MarkdownToPDF()
-            output_file = temp_file.replace('.md', '.pdf')
             
-            # Generate PDF
-            converter.convert_to_pdf(temp_file, output_file)
+            # Generate PDF straight from the in-memory markdown
+            converter.convert_string_to_pdf(content, output_file, title=case_name)
             
             duration = time.time() - start_time
             success = os.path.exists(output_file)
@@ -85,9 +81,6 @@ $$\\nabla \\times \\mathbf{B} = \\mu_0\\mathbf{J} + \\mu_0\\epsilon_0\\frac{\\pa
                 'file_size': 0,
                 'error': str(e)
             }
-        
-        finally:
-            os.unlink(temp_file)
     
     # Summary and recommendations
     print(f"\n📊 SUMMARY")
@@ -164,9 +157,7 @@ Just plain markdown with lists and formatting.
 **Bold text** and *italic text*.
 """
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
-        f.write(content)
-        temp_file = f.name
+    output_file = os.path.join(tempfile.gettempdir(), "quick_mathjax_baseline.pdf")
     
     try:
         start_time = time.time()
@@ -175,8 +166,7 @@ Just plain markdown with lists and formatting.
         # Disable math for baseline
         converter.config.config['math']['enabled'] = False
         
-        output_file = temp_file.replace('.md', '.pdf')
-        converter.convert_to_pdf(temp_file, output_file)
+        converter.convert_string_to_pdf(content, output_file, title='baseline')
         
         duration = time.time() - start_time
         success = os.path.exists(output_file)
@@ -192,9 +182,6 @@ Just plain markdown with lists and formatting.
     except Exception as e:
         print(f"  ❌ Baseline error: {e}")
         return None
-    
-    finally:
-        os.unlink(temp_file)
 
 
 def main():
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures for the Bodh test suite
+
+PDF tests dominate the run time and are independent, so the suite parallelizes with pytest-xdist:
+    pytest -n auto --dist=loadfile tests
+Tests are marked fast (parsing/HTML only) or slow (renders a PDF), e.g. `pytest -m fast`.
+"""
+
+import functools
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bodh import MarkdownToPDF, BROWSER_LAUNCH_OPTIONS
+from config import PresentationConfig
+
+
+def pytest_configure(config):
+    """Register the speed markers used to shard the suite"""
+    config.addinivalue_line("markers", "fast: parsing/HTML-only test, no PDF rendering")
+    config.addinivalue_line("markers", "slow: renders a PDF (browser or other PDF engine)")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_cache_home(tmp_path_factory):
+    """Point the per-user caches (slides, LaTeX formats and PDFs) at a fresh directory instead of ~/.cache"""
+    cache_home = tmp_path_factory.mktemp("cache_home")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('XDG_CACHE_HOME', str(cache_home))
+        yield cache_home
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_converter(theme, overrides):
+    """Build one converter per (theme, config overrides) combination for the whole session"""
+    if not overrides:
+        return MarkdownToPDF(theme=theme or 'default')
+    
+    # Overrides go through a PresentationConfig, whose own default theme applies unless one is given
+    config = PresentationConfig()
+    if theme is not None:
+        config.set('theme', theme)
+    for key, value in overrides:
+        config.set(key, value)
+    return MarkdownToPDF(config=config)
+
+
+@pytest.fixture(scope="session")
+def make_converter():
+    """Factory returning a shared converter for a theme and/or a dict of config overrides (treat as read-only)"""
+    def make(theme=None, overrides=None):
+        return _cached_converter(theme, frozenset((overrides or {}).items()))
+    return make
+
+
+@pytest.fixture(scope="session")
+def default_converter(make_converter):
+    """Shared converter with the default theme and settings"""
+    return make_converter()
+
+
+@pytest.fixture(scope="session")
+def pdf_backend():
+    """Name of the PDF backend the converter will use; skips PDF tests when it isn't installed"""
+    backend = os.environ.get('BODH_PDF_BACKEND', 'playwright')
+    if backend != 'playwright':
+        pytest.importorskip(backend)
+        return backend
+    
+    # Playwright imports fine without its browsers, so check that Chromium actually launches
+    sync_api = pytest.importorskip('playwright.sync_api')
+    try:
+        with sync_api.sync_playwright() as p:
+            p.chromium.launch(**BROWSER_LAUNCH_OPTIONS).close()
+    except sync_api.Error:
+        pytest.skip("Playwright's Chromium is not installed (run: playwright install chromium)")
+    return backend
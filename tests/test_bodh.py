@@ -5,9 +5,6 @@ Tests all major functionality to prevent regressions
 """
 
 import os
-import tempfile
-import shutil
-import subprocess
 import sys
 from pathlib import Path
 import pytest
@@ -15,21 +12,20 @@ import pytest
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from bodh import MarkdownToPDF
 from config import PresentationConfig
 
+# Every bundled theme, each tested on its own
+THEMES = ['default', 'modern', 'minimal', 'gradient', 'dark', 'sky', 'solarized', 'moon', 'metropolis']
+
 
 class TestBodhCore:
     """Test core functionality"""
     
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_md = os.path.join(self.temp_dir, "test.md")
-        
-        # Create a simple test markdown file
-        with open(self.test_md, 'w') as f:
-            f.write("""# Test Presentation
+    @pytest.fixture
+    def test_md(self, tmp_path):
+        """Create a simple test markdown file"""
+        test_md = tmp_path / "test.md"
+        test_md.write_text("""# Test Presentation
 
 ## Slide 1
 This is a test slide.
@@ -46,30 +42,27 @@ This is another slide with:
 
 # Thank You
 """)
+        return str(test_md)
     
-    def teardown_method(self):
-        """Clean up test fixtures"""
-        shutil.rmtree(self.temp_dir)
-    
-    def test_basic_markdown_parsing(self):
+    @pytest.mark.fast
+    def test_basic_markdown_parsing(self, test_md, default_converter):
         """Test basic markdown to slides parsing"""
-        converter = MarkdownToPDF()
-        with open(self.test_md, 'r') as f:
+        with open(test_md, 'r') as f:
             content = f.read()
         
-        slides = converter.parse_markdown_slides(content)
+        slides = default_converter.parse_markdown_slides(content)
         assert len(slides) == 3, f"Expected 3 slides, got {len(slides)}"
         assert "Test Presentation" in slides[0]
         assert "Slide 1" in slides[0]
         assert "Slide 2" in slides[1]
         assert "Thank You" in slides[2]
     
-    def test_html_generation(self):
+    @pytest.mark.fast
+    def test_html_generation(self, test_md, tmp_path, default_converter):
         """Test HTML output generation"""
-        converter = MarkdownToPDF()
-        output_file = os.path.join(self.temp_dir, "test.html")
+        output_file = str(tmp_path / "test.html")
         
-        converter.convert_to_html(self.test_md, output_file, _test_mode=True)
+        default_converter.convert_to_html(test_md, output_file, _test_mode=True)
         
         assert os.path.exists(output_file), "HTML file should be created"
         
@@ -82,17 +75,18 @@ This is another slide with:
         assert "slide-content" in html_content
         assert "justify-content: flex-start" in html_content  # Fixed layout
     
-    def test_pdf_generation(self):
+    @pytest.mark.slow
+    def test_pdf_generation(self, test_md, tmp_path, default_converter, pdf_backend):
         """Test PDF output generation"""
-        converter = MarkdownToPDF()
-        output_file = os.path.join(self.temp_dir, "test.pdf")
+        output_file = str(tmp_path / "test.pdf")
         
-        converter.convert_to_pdf(self.test_md, output_file, _test_mode=True)
+        default_converter.convert_to_pdf(test_md, output_file, _test_mode=True)
         
         assert os.path.exists(output_file), "PDF file should be created"
         assert os.path.getsize(output_file) > 1000, "PDF should have content"
 
 
+@pytest.mark.fast
 class TestConfiguration:
     """Test configuration system"""
     
@@ -138,23 +132,13 @@ class TestConfiguration:
         assert format_str == '{current}'
 
 
+@pytest.mark.fast
 class TestAdvancedFeatures:
     """Test advanced features like columns, overlays, etc."""
     
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
-    
-    def teardown_method(self):
-        """Clean up test fixtures"""
-        shutil.rmtree(self.temp_dir)
-    
-    def test_multi_column_processing(self):
+    def test_multi_column_processing(self, make_converter):
         """Test multi-column layout processing"""
-        config = PresentationConfig()
-        config.set('layout.columns', 2)
-        
-        converter = MarkdownToPDF(config=config)
+        converter = make_converter(overrides={'layout.columns': 2})
         
         # Test new ::: {.column} format
         content = """# Multi-Column Test
@@ -176,13 +160,9 @@ Content for right side
         assert 'Left Column' in processed
         assert 'Right Column' in processed
     
-    def test_hrule_processing(self):
+    def test_hrule_processing(self, make_converter):
         """Test horizontal rule processing"""
-        config = PresentationConfig()
-        config.set('style.hrule.enabled', True)
-        config.set('style.hrule.width', '80%')
-        
-        converter = MarkdownToPDF(config=config)
+        converter = make_converter(overrides={'style.hrule.enabled': True, 'style.hrule.width': '80%'})
         
         content = """# Main Title
 
@@ -194,12 +174,9 @@ Some content here."""
         assert '<hr class="title-hrule"' in processed
         assert 'width: 80%' in processed
     
-    def test_overlay_processing(self):
+    def test_overlay_processing(self, make_converter):
         """Test overlay/pause processing"""
-        config = PresentationConfig()
-        config.set('overlays.enabled', True)
-        
-        converter = MarkdownToPDF(config=config)
+        converter = make_converter(overrides={'overlays.enabled': True})
         
         content = """# Overlay Demo
 
@@ -219,6 +196,7 @@ Third content
         assert 'data-overlay=' in processed
 
 
+@pytest.mark.fast
 class TestSlideNumberCalculation:
     """Test slide number calculation and display"""
     
@@ -228,7 +206,6 @@ class TestSlideNumberCalculation:
         
         # Test percent format
         config.set('slide_number.format', 'percent')
-        converter = MarkdownToPDF(config=config)
         
         slides = ['slide1', 'slide2', 'slide3', 'slide4', 'slide5']  # 5 slides
         
@@ -248,89 +225,103 @@ class TestSlideNumberCalculation:
         assert initial_slide_number == '1/5', f"Expected '1/5', got '{initial_slide_number}'"
 
 
+@pytest.mark.fast
 class TestThemes:
     """Test different themes"""
     
-    def test_all_themes_loadable(self):
+    @pytest.mark.parametrize("theme", THEMES)
+    def test_all_themes_loadable(self, theme, make_converter):
         """Test that all themes can be loaded without errors"""
-        themes = ['default', 'modern', 'minimal', 'gradient', 'dark', 'sky', 'solarized', 'moon', 'metropolis']
+        # The converter (and its CSS) is built once per theme for the whole session
+        css = make_converter(theme).css
         
-        for theme in themes:
-            converter = MarkdownToPDF(theme=theme)
-            # Check that CSS was generated (theme was loaded successfully)
-            assert converter.css is not None
-            assert len(converter.css) > 100  # Should have substantial CSS content
-            assert f"Theme: {theme}" not in converter.css or theme in ['modern', 'default']  # Basic smoke test
+        # Check that CSS was generated (theme was loaded successfully)
+        assert css is not None
+        assert len(css) > 100  # Should have substantial CSS content
+        assert f"Theme: {theme}" not in css or theme in ['modern', 'default']  # Basic smoke test
 
 
+@pytest.mark.fast
 class TestCSSGeneration:
     """Test CSS generation and template rendering"""
     
-    def test_css_contains_fixed_layout(self):
+    def test_css_contains_fixed_layout(self, default_converter):
         """Test that generated CSS has fixed layout (not centered)"""
-        converter = MarkdownToPDF()
-        css = converter.css
+        css = default_converter.css
     
         # Should have flex-start for fixed positioning
         assert 'justify-content: flex-start' in css
         # Should have proper slide structure
         assert '.slide {' in css
     
-    def test_mathjax_overflow_handling(self):
+    def test_mathjax_overflow_handling(self, make_converter):
         """Test that MathJax-enabled configs have proper overflow handling"""
-        config = PresentationConfig()
-        config.set('math.enabled', True)
-        
-        converter = MarkdownToPDF(config=config)
+        converter = make_converter(overrides={'math.enabled': True})
         css = converter.css
         
         # Should have overflow: visible for MathJax
         assert 'overflow: visible' in css
 
 
+@pytest.mark.fast
+class TestMathJaxInclusion:
+    """Test that MathJax is emitted for decks containing math"""
+    
+    def test_mathjax_in_math_deck(self, default_converter):
+        """Test that a deck with $$ math gets the MathJax scripts"""
+        slides = default_converter.parse_markdown_slides("# Math\n\n$$E = mc^2$$\n")
+        html_content = default_converter._render_presentation_html(default_converter._load_presentation('deck', slides))
+        
+        assert 'MathJax-script' in html_content
+        assert 'window.MathJax = {' in html_content
+    
+    def test_mathjax_without_has_math(self, default_converter):
+        """Test that direct template renders (as generate_examples does) fall back to math.enabled"""
+        slides = default_converter.parse_markdown_slides("# Math\n\n$$E = mc^2$$\n")
+        html_content = default_converter.template.render(
+            title='Math',
+            slides=slides,
+            css=default_converter.css,
+            font_family='Inter',
+            config=default_converter.config
+        )
+        
+        assert 'window.MathJax = {' in html_content
+
+
+@pytest.mark.fast
 class TestErrorHandling:
     """Test error handling and edge cases"""
     
-    def test_missing_markdown_file(self):
+    def test_missing_markdown_file(self, default_converter):
         """Test handling of missing markdown files"""
-        converter = MarkdownToPDF()
-        
         with pytest.raises(FileNotFoundError):
-            converter.convert_to_html("nonexistent.md", "output.html")
+            default_converter.convert_to_html("nonexistent.md", "output.html")
     
-    def test_empty_markdown_content(self):
+    def test_empty_markdown_content(self, tmp_path, default_converter):
         """Test handling of empty markdown"""
-        temp_dir = tempfile.mkdtemp()
-        try:
-            empty_md = os.path.join(temp_dir, "empty.md")
-            with open(empty_md, 'w') as f:
-                f.write("")
-            
-            converter = MarkdownToPDF()
-            
-            with pytest.raises(ValueError, match="No slides found"):
-                converter.convert_to_html(empty_md, "output.html")
-        finally:
-            shutil.rmtree(temp_dir)
+        empty_md = tmp_path / "empty.md"
+        empty_md.write_text("")
+        
+        with pytest.raises(ValueError, match="No slides found"):
+            default_converter.convert_to_html(str(empty_md), "output.html")
 
 
+@pytest.mark.fast
 class TestSyntaxHighlighting:
     """Test syntax highlighting functionality"""
     
-    def test_syntax_highlighting_css(self):
+    def test_syntax_highlighting_css(self, default_converter):
         """Test that syntax highlighting CSS is included"""
-        converter = MarkdownToPDF()
-        css = converter.css
+        css = default_converter.css
         
         # Should have codehilite styles
         assert '.codehilite' in css
         assert 'color: #008000' in css  # Keyword colors
         assert 'color: #BA2121' in css  # String colors
     
-    def test_code_block_processing(self):
+    def test_code_block_processing(self, default_converter):
         """Test that code blocks are processed with syntax highlighting"""
-        converter = MarkdownToPDF()
-        
         content = """# Code Test
 
 ```python
@@ -339,29 +330,28 @@ def hello():
 ```
 """
         
-        slides = converter.parse_markdown_slides(content)
+        slides = default_converter.parse_markdown_slides(content)
         assert len(slides) == 1
         assert 'codehilite' in slides[0]
         assert 'def' in slides[0]  # Python keyword should be present
 
 
+@pytest.mark.fast
 class TestLayoutFixes:
     """Test layout and positioning fixes"""
     
-    def test_slide_navigation_positioning(self):
+    def test_slide_navigation_positioning(self, default_converter):
         """Test that slide navigation is positioned on the right"""
-        converter = MarkdownToPDF()
-        css = converter.css
+        css = default_converter.css
         
         # Should have right positioning for slide nav
         assert 'bottom: 2rem' in css
         assert 'right: 2rem' in css
         assert 'left: 50%' not in css  # Should not be centered
     
-    def test_fixed_slide_layout(self):
+    def test_fixed_slide_layout(self, default_converter):
         """Test that slides have fixed top positioning"""
-        converter = MarkdownToPDF()
-        css = converter.css
+        css = default_converter.css
         
         # Should have flex-start for fixed positioning
         assert 'justify-content: flex-start' in css
@@ -369,6 +359,7 @@ class TestLayoutFixes:
         assert 'min-height: 100vh' in css
 
 
+@pytest.mark.fast
 class TestImageHandling:
     """Test image handling and logos"""
     
@@ -380,12 +371,11 @@ class TestImageHandling:
         assert sample_png.exists(), "Sample PNG image should exist"
         assert sample_jpg.exists(), "Sample JPG image should exist"
     
-    def test_logo_encoding(self):
+    def test_logo_encoding(self, default_converter):
         """Test logo image encoding"""
         logo_path = 'examples/sample-logo.svg'
         if os.path.exists(logo_path):
-            converter = MarkdownToPDF()
-            encoded_logo = converter._encode_image(logo_path)
+            encoded_logo = default_converter._encode_image(logo_path)
             
             assert encoded_logo is not None
             assert isinstance(encoded_logo, dict)
@@ -398,22 +388,11 @@ class TestImageHandling:
 
 def run_comprehensive_test():
     """Run all tests and return results"""
-    import subprocess
-    import sys
-    
     print("🧪 Running Bodh Test Suite...")
     print("=" * 50)
     
-    # Run pytest
-    result = subprocess.run([
-        sys.executable, "-m", "pytest", __file__, "-v", "--tb=short"
-    ], capture_output=True, text=True)
-    
-    print(result.stdout)
-    if result.stderr:
-        print("STDERR:", result.stderr)
-    
-    if result.returncode == 0:
+    # Run pytest in this interpreter, streaming its output
+    if pytest.main([__file__, "-v", "--tb=short"]) == 0:
         print("✅ All tests passed!")
         return True
     else:
@@ -4,30 +4,11 @@ Column functionality bug testing
 """
 
 import os
-import tempfile
-import shutil
-import subprocess
-import sys
 from pathlib import Path
 import pytest
-from bodh import MarkdownToPDF
-from config import PresentationConfig
 
-
-class TestColumnBugs:
-    """Test column functionality edge cases"""
-    
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir)
-    
-    def test_column_markdown_processing(self):
-        """Test that column content is properly processed as markdown"""
-        column_md = os.path.join(self.temp_dir, "column_test.md")
-        with open(column_md, 'w') as f:
-            f.write("""# Column Markdown Test
+# Two-column deck exercising every markdown element inside columns
+COLUMN_MARKDOWN = """# Column Markdown Test
 
 ::: {.column}
 ### Left Column
@@ -54,102 +35,10 @@ This is a [link](http://example.com).
 
 > This is a blockquote
 :::
-""")
-        
-        converter = MarkdownToPDF()
-        html_file = os.path.join(self.temp_dir, "column_test.html")
-        pdf_file = os.path.join(self.temp_dir, "column_test.pdf")
-        
-        converter.convert_to_html(column_md, html_file)
-        converter.convert_to_pdf(column_md, pdf_file)
-        
-        # Check HTML content
-        with open(html_file, 'r') as f:
-            html_content = f.read()
-        
-        # Verify markdown elements are properly processed
-        assert '<strong>bold</strong>' in html_content, "Bold text not processed"
-        assert '<em>italic</em>' in html_content, "Italic text not processed"
-        assert '<ul>' in html_content, "Lists not processed"
-        assert '<li>List item 1</li>' in html_content, "List items not processed"
-        assert '<table>' in html_content, "Tables not processed"
-        assert '<blockquote>' in html_content, "Blockquotes not processed"
-        assert 'codehilite' in html_content, "Code blocks not processed"
-        assert '<a href="http://example.com">' in html_content, "Links not processed"
-        
-        assert os.path.exists(pdf_file), "PDF not created"
-        print("✅ Column markdown processing works correctly")
-    
-    def test_dynamic_column_count(self):
-        """Test that column count is dynamic based on content"""
-        test_cases = [
-            ("2 columns", 2, """
-::: {.column}
-Column 1
-:::
-
-::: {.column}
-Column 2
-:::
-"""),
-            ("3 columns", 3, """
-::: {.column}
-Column 1
-:::
-
-::: {.column}
-Column 2
-:::
-
-::: {.column}
-Column 3
-:::
-"""),
-            ("4 columns", 4, """
-::: {.column}
-Column 1
-:::
-
-::: {.column}
-Column 2
-:::
-
-::: {.column}
-Column 3
-:::
+"""
 
-::: {.column}
-Column 4
-:::
-"""),
-        ]
-        
-        for name, expected_count, content in test_cases:
-            test_md = os.path.join(self.temp_dir, f"columns_{expected_count}.md")
-            with open(test_md, 'w') as f:
-                f.write(f"# {name}\n{content}")
-            
-            converter = MarkdownToPDF()
-            html_file = os.path.join(self.temp_dir, f"columns_{expected_count}.html")
-            
-            converter.convert_to_html(test_md, html_file)
-            
-            with open(html_file, 'r') as f:
-                html_content = f.read()
-            
-            # Check that correct column class is used
-            assert f'columns-{expected_count}' in html_content, f"Expected columns-{expected_count} class for {name}"
-            
-            # Check that column count in CSS matches
-            assert f'grid-template-columns: {" ".join(["1fr"] * expected_count)}' in html_content, f"CSS grid not correct for {name}"
-            
-            print(f"✅ {name} handled correctly")
-    
-    def test_mixed_column_content(self):
-        """Test columns with different types of content"""
-        mixed_md = os.path.join(self.temp_dir, "mixed_columns.md")
-        with open(mixed_md, 'w') as f:
-            f.write("""# Mixed Column Content
+# Four columns, each holding a different kind of content
+MIXED_COLUMN_MARKDOWN = """# Mixed Column Content
 
 ::: {.column}
 ### Text Column
@@ -197,36 +86,165 @@ Numbered list:
 | Lists   | ✅ |
 | Code    | ✅ |
 :::
-""")
+"""
+
+# Minimal two-column deck for checking the generated column CSS
+CSS_TEST_MARKDOWN = """# CSS Test
+
+::: {.column}
+Column 1
+:::
+
+::: {.column}
+Column 2
+:::
+"""
+
+
+# Markup COLUMN_MARKDOWN must produce (marker -> failure message)
+COLUMN_MARKUP = {
+    '<strong>bold</strong>': "Bold text not processed",
+    '<em>italic</em>': "Italic text not processed",
+    '<ul>': "Lists not processed",
+    '<li>List item 1</li>': "List items not processed",
+    '<table>': "Tables not processed",
+    '<blockquote>': "Blockquotes not processed",
+    'codehilite': "Code blocks not processed",
+    '<a href="http://example.com">': "Links not processed",
+}
+
+# Markup MIXED_COLUMN_MARKDOWN must produce
+MIXED_COLUMN_MARKUP = {
+    'columns-4': "Should have 4 columns",
+    'codehilite': "Code blocks should be highlighted",
+    '<table>': "Tables should be processed",
+    '<ul>': "Unordered lists should be processed",
+    '<ol>': "Ordered lists should be processed",
+    '<p>': "Paragraphs should be processed",
+}
+
+# Column CSS every rendered deck must include
+COLUMN_CSS_RULES = {
+    '.columns-layout': "Column layout CSS missing",
+    '.columns-2': "2-column CSS missing",
+    '.columns-3': "3-column CSS missing",
+    '.columns-4': "4-column CSS missing",
+    '.columns-5': "5-column CSS missing",
+    '.column': "Column CSS missing",
+    'display: grid': "Grid display CSS missing",
+    'grid-template-columns': "Grid template CSS missing",
+    'flex-direction: column': "Flex direction CSS missing",
+}
+
+
+def _render_html(converter, md_content):
+    """Render markdown to the navigable HTML convert_to_html would write, without any file round-trip"""
+    slides = converter.parse_markdown_slides(md_content)
+    return converter._render_presentation_html(converter._load_presentation('deck', slides))
+
+
+@pytest.fixture(scope="module")
+def rendered_pdf(request, tmp_path_factory, default_converter, pdf_backend):
+    """Render the markdown given by indirect parametrization to PDF once per module; returns the PDF path"""
+    pdf_file = str(tmp_path_factory.mktemp("column_pdf") / "deck.pdf")
+    default_converter.convert_string_to_pdf(request.param, pdf_file)
+    return pdf_file
+
+
+class TestColumnBugs:
+    """Test column functionality edge cases"""
+    
+    @pytest.mark.fast
+    def test_column_markdown_processing(self, default_converter):
+        """Test that column content is properly processed as markdown"""
+        # Check HTML content
+        html_content = _render_html(default_converter, COLUMN_MARKDOWN)
+        
+        # Verify markdown elements are properly processed
+        missing = [message for marker, message in COLUMN_MARKUP.items() if marker not in html_content]
+        assert not missing, f"Missing markers: {missing}"
+        print("✅ Column markdown processing works correctly")
+    
+    @pytest.mark.fast
+    @pytest.mark.parametrize("expected_count, content", [
+        (2, """
+::: {.column}
+Column 1
+:::
+
+::: {.column}
+Column 2
+:::
+"""),
+        (3, """
+::: {.column}
+Column 1
+:::
+
+::: {.column}
+Column 2
+:::
+
+::: {.column}
+Column 3
+:::
+"""),
+        (4, """
+::: {.column}
+Column 1
+:::
+
+::: {.column}
+Column 2
+:::
+
+::: {.column}
+Column 3
+:::
+
+::: {.column}
+Column 4
+:::
+"""),
+    ], ids=["2col", "3col", "4col"])
+    def test_dynamic_column_count(self, default_converter, expected_count, content):
+        """Test that column count is dynamic based on content"""
+        name = f"{expected_count} columns"
+        html_content = _render_html(default_converter, f"# {name}\n{content}")
         
-        converter = MarkdownToPDF()
-        html_file = os.path.join(self.temp_dir, "mixed_columns.html")
-        pdf_file = os.path.join(self.temp_dir, "mixed_columns.pdf")
+        # Check that correct column class is used
+        assert f'columns-{expected_count}' in html_content, f"Expected columns-{expected_count} class for {name}"
         
-        converter.convert_to_html(mixed_md, html_file)
-        converter.convert_to_pdf(mixed_md, pdf_file)
+        # Check that column count in CSS matches
+        assert f'grid-template-columns: {" ".join(["1fr"] * expected_count)}' in html_content, f"CSS grid not correct for {name}"
         
-        with open(html_file, 'r') as f:
-            html_content = f.read()
+        print(f"✅ {name} handled correctly")
+    
+    @pytest.mark.fast
+    def test_mixed_column_content(self, default_converter):
+        """Test columns with different types of content"""
+        html_content = _render_html(default_converter, MIXED_COLUMN_MARKDOWN)
         
         # Check that all content types are properly processed
-        assert 'columns-4' in html_content, "Should have 4 columns"
-        assert 'codehilite' in html_content, "Code blocks should be highlighted"
-        assert '<table>' in html_content, "Tables should be processed"
-        assert '<ul>' in html_content, "Unordered lists should be processed"
-        assert '<ol>' in html_content, "Ordered lists should be processed"
-        assert '<p>' in html_content, "Paragraphs should be processed"
-        
-        assert os.path.exists(pdf_file), "PDF not created"
-        pdf_size = os.path.getsize(pdf_file)
-        assert pdf_size > 20000, f"PDF too small: {pdf_size} bytes"
+        missing = [message for marker, message in MIXED_COLUMN_MARKUP.items() if marker not in html_content]
+        assert not missing, f"Missing markers: {missing}"
         
         print("✅ Mixed column content handled correctly")
     
-    def test_column_edge_cases(self):
-        """Test edge cases in column processing"""
-        edge_cases = [
-            ("Empty columns", """
+    @pytest.mark.slow
+    @pytest.mark.parametrize("rendered_pdf, min_size", [
+        (COLUMN_MARKDOWN, 0),
+        (MIXED_COLUMN_MARKDOWN, 20000),
+    ], indirect=["rendered_pdf"], ids=["columns", "mixed"])
+    def test_column_pdf_rendering(self, rendered_pdf, min_size):
+        """Test that column decks render to PDF (each deck is rendered once per module)"""
+        assert os.path.exists(rendered_pdf), "PDF not created"
+        pdf_size = os.path.getsize(rendered_pdf)
+        assert pdf_size > min_size, f"PDF too small: {pdf_size} bytes"
+    
+    @pytest.mark.fast
+    @pytest.mark.parametrize("name, content", [
+        ("Empty columns", """
 ::: {.column}
 :::
 
@@ -234,7 +252,7 @@ Numbered list:
 Content
 :::
 """),
-            ("Whitespace only", """
+        ("Whitespace only", """
 ::: {.column}
    
    
@@ -244,7 +262,7 @@ Content
 Content
 :::
 """),
-            ("Nested markdown", """
+        ("Nested markdown", """
 ::: {.column}
 ### Nested
 
@@ -265,7 +283,7 @@ def func():
 ```
 :::
 """),
-            ("Special characters", """
+        ("Special characters", """
 ::: {.column}
 ### Special chars: ñáéíóú
 
@@ -282,62 +300,27 @@ Currency: $ € £ ¥
 Symbols: © ™ ® ℠
 :::
 """),
-        ]
+    ], ids=["empty", "whitespace", "nested", "special-chars"])
+    def test_column_edge_cases(self, default_converter, name, content):
+        """Test edge cases in column processing (rendered through the shared, already-compiled template and CSS)"""
+        # Should not crash with edge cases
+        html_content = _render_html(default_converter, f"# {name}\n{content}")
         
-        for name, content in edge_cases:
-            test_md = os.path.join(self.temp_dir, f"edge_{name.replace(' ', '_')}.md")
-            with open(test_md, 'w') as f:
-                f.write(f"# {name}\n{content}")
-            
-            converter = MarkdownToPDF()
-            html_file = os.path.join(self.temp_dir, f"edge_{name.replace(' ', '_')}.html")
-            
-            # Should not crash with edge cases
-            converter.convert_to_html(test_md, html_file)
-            
-            assert os.path.exists(html_file), f"HTML not created for {name}"
-            
-            with open(html_file, 'r') as f:
-                html_content = f.read()
-            
-            # Should have column layout
-            assert 'columns-layout' in html_content, f"Column layout missing for {name}"
-            
-            print(f"✅ Edge case '{name}' handled correctly")
-    
-    def test_column_css_generation(self):
-        """Test that column CSS is properly generated"""
-        column_md = os.path.join(self.temp_dir, "css_test.md")
-        with open(column_md, 'w') as f:
-            f.write("""# CSS Test
-
-::: {.column}
-Column 1
-:::
-
-::: {.column}
-Column 2
-:::
-""")
-        
-        converter = MarkdownToPDF()
-        html_file = os.path.join(self.temp_dir, "css_test.html")
+        assert html_content, f"HTML not created for {name}"
         
-        converter.convert_to_html(column_md, html_file)
+        # Should have column layout
+        assert 'columns-layout' in html_content, f"Column layout missing for {name}"
         
-        with open(html_file, 'r') as f:
-            html_content = f.read()
+        print(f"✅ Edge case '{name}' handled correctly")
+    
+    @pytest.mark.fast
+    def test_column_css_generation(self, default_converter):
+        """Test that column CSS is properly generated"""
+        html_content = _render_html(default_converter, CSS_TEST_MARKDOWN)
         
         # Check CSS rules are present
-        assert '.columns-layout' in html_content, "Column layout CSS missing"
-        assert '.columns-2' in html_content, "2-column CSS missing"
-        assert '.columns-3' in html_content, "3-column CSS missing"
-        assert '.columns-4' in html_content, "4-column CSS missing"
-        assert '.columns-5' in html_content, "5-column CSS missing"
-        assert '.column' in html_content, "Column CSS missing"
-        assert 'display: grid' in html_content, "Grid display CSS missing"
-        assert 'grid-template-columns' in html_content, "Grid template CSS missing"
-        assert 'flex-direction: column' in html_content, "Flex direction CSS missing"
+        missing = [message for marker, message in COLUMN_CSS_RULES.items() if marker not in html_content]
+        assert not missing, f"Missing markers: {missing}"
         
         print("✅ Column CSS generation works correctly")
 
@@ -347,15 +330,8 @@ def run_column_tests():
     print("🏛️ Running Column Bug Tests...")
     print("=" * 50)
     
-    result = subprocess.run([
-        sys.executable, "-m", "pytest", __file__, "-v", "--tb=short"
-    ], capture_output=True, text=True)
-    
-    print(result.stdout)
-    if result.stderr:
-        print("STDERR:", result.stderr)
-    
-    if result.returncode == 0:
+    # Run pytest in this interpreter, streaming its output
+    if pytest.main([__file__, "-v", "--tb=short"]) == 0:
         print("✅ All column tests passed!")
         return True
     else:
@@ -5,8 +5,6 @@ World-class testing to catch real-world issues and edge cases
 """
 
 import os
-import tempfile
-import shutil
 import re
 import pytest
 from bodh import MarkdownToPDF, ThemeLoader, StyleGenerator
@@ -16,11 +14,9 @@ from config import PresentationConfig, load_config
 class TestCSSRenderingIssues:
     """Test CSS rendering and layout issues that cause visual problems"""
     
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        self.temp_dir = str(tmp_path)
     
     def test_gradient_theme_excessive_whitespace(self):
         """Test the specific issue with gradient theme having too much whitespace"""
@@ -156,11 +152,9 @@ The gradient should fill the slide properly without huge margins.
 class TestMarkdownParsingEdgeCases:
     """Test markdown parsing edge cases that could cause layout issues"""
     
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        self.temp_dir = str(tmp_path)
     
     def test_extremely_long_lines(self):
         """Test handling of extremely long lines that could break layout"""
@@ -348,11 +342,9 @@ def test_unicode():
 class TestConfigurationEdgeCases:
     """Test configuration edge cases and validation"""
     
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        self.temp_dir = str(tmp_path)
     
     def test_missing_theme_fallback(self):
         """Test behavior when theme files are missing or corrupted"""
@@ -447,11 +439,9 @@ class TestConfigurationEdgeCases:
 class TestContentRenderingIssues:
     """Test content rendering issues that could cause visual problems"""
     
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        self.temp_dir = str(tmp_path)
     
     def test_table_overflow_handling(self):
         """Test handling of tables that exceed slide width"""
@@ -4,8 +4,6 @@ Test the fixed logo and slide numbering issues
 """
 
 import os
-import tempfile
-import shutil
 import pytest
 from bodh import MarkdownToPDF
 from config import PresentationConfig
@@ -14,11 +12,9 @@ from config import PresentationConfig
 class TestFixedIssues:
     """Test that the issues are actually fixed"""
     
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        self.temp_dir = str(tmp_path)
     
     def test_svg_logo_displays_correctly(self):
         """Test that SVG logos display with correct MIME type"""
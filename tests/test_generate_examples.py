@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Test the docs example generator's incremental build (HTML cache, stamps, write skipping)
+"""
+
+import base64
+import gzip
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+import generate_examples
+
+
+EXAMPLES_DIR = Path(__file__).resolve().parent.parent / 'examples'
+
+
+@pytest.fixture
+def showcase_dir(tmp_path, monkeypatch):
+    """Showcase image directory and output paths for the default theme, all inside tmp_path"""
+    shutil.copyfile(EXAMPLES_DIR / 'sample-image-small.png', tmp_path / 'figure.png')
+    monkeypatch.setattr(generate_examples, 'SHOWCASE_DIR', str(tmp_path))
+    monkeypatch.setattr(generate_examples, 'HTML_CACHE_DIR', tmp_path / 'cache')
+    monkeypatch.setattr(generate_examples, 'THEME_PATHS', {
+        'default': (tmp_path / 'showcase-default.html', tmp_path / 'showcase-default.pdf')
+    })
+    return tmp_path
+
+
+@pytest.fixture
+def stamp_inputs(tmp_path, monkeypatch):
+    """A working directory holding the default theme's inputs and outputs; returns the touchable input paths"""
+    monkeypatch.chdir(tmp_path)
+    for input_path in ['examples/showcase.md', 'themes/default.json', 'templates/base.css', 'examples/figure.png']:
+        (tmp_path / input_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / input_path).write_text('input')
+    monkeypatch.setattr(generate_examples, 'SHOWCASE_DIR', str(tmp_path / 'examples'))
+    monkeypatch.setattr(generate_examples, 'THEME_PATHS', {
+        'default': (tmp_path / 'showcase-default.html', tmp_path / 'showcase-default.pdf')
+    })
+    for output_path in generate_examples.THEME_PATHS['default']:
+        output_path.write_text('output')
+    return tmp_path
+
+
+def _touch(path):
+    """Move a file's mtime one second forward"""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+@pytest.mark.fast
+class TestStamps:
+    """Test skipping themes whose inputs are unchanged since they were generated"""
+    
+    def test_referenced_images(self, stamp_inputs):
+        """Test that local images are resolved against the showcase directory and web images are ignored"""
+        images = generate_examples._showcase_images("![Figure](figure.png)\n![Web](https://example.com/logo.png)")
+        
+        assert images == [str(stamp_inputs / 'examples' / 'figure.png')]
+    
+    def test_unchanged_inputs_skip(self, stamp_inputs):
+        """Test that a theme stamped after generation is not regenerated"""
+        images = generate_examples._showcase_images("![Figure](figure.png)")
+        assert generate_examples._needs_regen('default', images)
+        
+        generate_examples._write_stamp('default', images)
+        
+        assert not generate_examples._needs_regen('default', images)
+    
+    @pytest.mark.parametrize("input_path", [
+        'examples/showcase.md', 'themes/default.json', 'templates/base.css', 'examples/figure.png',
+    ], ids=["showcase", "theme-json", "base-css", "image"])
+    def test_touched_input_regenerates(self, stamp_inputs, input_path):
+        """Test that touching any input of the theme forces regeneration"""
+        images = generate_examples._showcase_images("![Figure](figure.png)")
+        generate_examples._write_stamp('default', images)
+        
+        _touch(stamp_inputs / input_path)
+        
+        assert generate_examples._needs_regen('default', images)
+    
+    def test_added_image_regenerates(self, stamp_inputs):
+        """Test that an image missing at the last generation forces regeneration once it appears"""
+        images = generate_examples._showcase_images("![Figure](new.png)")
+        generate_examples._write_stamp('default', images)
+        assert not generate_examples._needs_regen('default', images)
+        
+        (stamp_inputs / 'examples' / 'new.png').write_text('image')
+        
+        assert generate_examples._needs_regen('default', images)
+    
+    def test_missing_output_regenerates(self, stamp_inputs):
+        """Test that a deleted PDF is regenerated even though the inputs are unchanged"""
+        generate_examples._write_stamp('default')
+        
+        os.remove(generate_examples.THEME_PATHS['default'][1])
+        
+        assert generate_examples._needs_regen('default')
+
+
+@pytest.mark.fast
+class TestWriteSkipping:
+    """Test that unchanged HTML (and its .gz copy) is not rewritten"""
+    
+    def test_unchanged_html_not_rewritten(self, tmp_path):
+        """Test that writing identical HTML leaves the file untouched and changed HTML replaces it"""
+        html_path = tmp_path / 'page.html'
+        generate_examples._write_html(html_path, b'<p>one</p>')
+        os.utime(html_path, ns=(1, 1))
+        
+        generate_examples._write_html(html_path, b'<p>one</p>')
+        assert os.stat(html_path).st_mtime_ns == 1
+        
+        generate_examples._write_html(html_path, b'<p>two</p>')
+        assert html_path.read_bytes() == b'<p>two</p>'
+        assert not (tmp_path / 'page.html.gz').exists()
+    
+    def test_gz_written_with_html(self, tmp_path, monkeypatch):
+        """Test that BODH_GZIP=1 keeps a matching .gz copy, rewritten only when the HTML changes or it is missing"""
+        monkeypatch.setenv('BODH_GZIP', '1')
+        html_path = tmp_path / 'page.html'
+        gz_path = tmp_path / 'page.html.gz'
+        
+        generate_examples._write_html(html_path, b'<p>one</p>')
+        assert gzip.decompress(gz_path.read_bytes()) == b'<p>one</p>'
+        
+        os.utime(gz_path, ns=(1, 1))
+        generate_examples._write_html(html_path, b'<p>one</p>')
+        assert os.stat(gz_path).st_mtime_ns == 1
+        
+        generate_examples._write_html(html_path, b'<p>two</p>')
+        assert gzip.decompress(gz_path.read_bytes()) == b'<p>two</p>'
+        
+        os.remove(gz_path)
+        generate_examples._write_html(html_path, b'<p>two</p>')
+        assert gzip.decompress(gz_path.read_bytes()) == b'<p>two</p>'
+    
+    def test_cached_html_written_once(self, tmp_path, monkeypatch):
+        """Test that an output already matching its cache entry is left alone, and a new entry replaces it"""
+        monkeypatch.setenv('BODH_GZIP', '1')
+        html_path = tmp_path / 'page.html'
+        cache_path = tmp_path / 'entry.html'
+        cache_path.write_bytes(b'<p>cached</p>')
+        
+        generate_examples._write_cached_html(cache_path, html_path)
+        assert html_path.read_bytes() == b'<p>cached</p>'
+        assert gzip.decompress((tmp_path / 'page.html.gz').read_bytes()) == b'<p>cached</p>'
+        
+        os.utime(tmp_path / 'page.html.gz', ns=(1, 1))
+        generate_examples._write_cached_html(cache_path, html_path)
+        assert os.stat(tmp_path / 'page.html.gz').st_mtime_ns == 1
+        
+        new_entry = tmp_path / 'new-entry.html'
+        new_entry.write_bytes(b'<p>new</p>')
+        generate_examples._write_cached_html(new_entry, html_path)
+        assert html_path.read_bytes() == b'<p>new</p>'
+        assert cache_path.read_bytes() == b'<p>cached</p>'
+        assert gzip.decompress((tmp_path / 'page.html.gz').read_bytes()) == b'<p>new</p>'
+
+
+@pytest.mark.fast
+class TestHtmlCache:
+    """Test the BODH_CACHE=1 showcase HTML cache"""
+    
+    def test_image_change_invalidates_cache(self, showcase_dir, monkeypatch):
+        """Test that editing an image referenced by the deck regenerates the cached HTML"""
+        monkeypatch.setenv('BODH_CACHE', '1')
+        content = "# Showcase\n\n![Figure](figure.png)\n"
+        html_path = showcase_dir / 'showcase-default.html'
+        
+        generate_examples._render_theme('default', content)
+        first_image = (showcase_dir / 'figure.png').read_bytes()
+        assert base64.b64encode(first_image).decode('ascii') in html_path.read_text(encoding='utf-8')
+        
+        # Replace the image only; the markdown stays the same
+        shutil.copyfile(EXAMPLES_DIR / 'gd-lr-0.1.png', showcase_dir / 'figure.png')
+        os.utime(showcase_dir / 'figure.png', ns=(1, 1))
+        generate_examples._render_theme('default', content)
+        
+        second_image = (showcase_dir / 'figure.png').read_bytes()
+        assert base64.b64encode(second_image).decode('ascii') in html_path.read_text(encoding='utf-8')
+
+
+@pytest.mark.fast
+class TestLogging:
+    """Test the progress logger's output stream"""
+    
+    def test_progress_in_order_and_kept_on_crash(self):
+        """Test that progress lines and bodh's prints share stdout in order, even when the process dies"""
+        code = ("import os, generate_examples as g; g._setup_logging(); g.logger.info('first'); "
+                "print('bodh print'); g.logger.info('last'); os._exit(1)")
+        
+        # A piped stdout is block-buffered unless PYTHONUNBUFFERED is set
+        env = {name: value for name, value in os.environ.items() if name != 'PYTHONUNBUFFERED'}
+        result = subprocess.run([sys.executable, '-c', code], cwd=EXAMPLES_DIR.parent, env=env,
+                                stdout=subprocess.PIPE, text=True)
+        
+        assert result.stdout == 'first\nbodh print\nlast\n'
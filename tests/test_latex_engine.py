@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Test the LaTeX PDF engine: markdown to LaTeX conversion, and compiling with a stand-in pdflatex
+"""
+
+import json
+import os
+import sys
+import pytest
+import latex_engine
+from latex_engine import LaTeXPDFEngine, MAX_LATEX_PASSES
+
+
+# Stand-in for pdflatex: logs each run's arguments, writes a log asking for FAKE_LATEX_RERUNS
+# reruns, fails on \undefined (or on any -fmt= run with FAKE_LATEX_BAD_FMT), and skips the PDF in draft mode
+FAKE_LATEX = r'''#!PYTHON
+import json, os, sys
+args = sys.argv[1:]
+if args == ['--version']:
+    sys.exit(0)
+with open(os.environ['FAKE_LATEX_RUNS'], 'a') as f:
+    f.write(json.dumps(args) + '\n')
+if '-ini' in args:
+    jobname = next(arg for arg in args if arg.startswith('-jobname='))[len('-jobname='):]
+    with open(jobname + '.fmt', 'w') as f:
+        f.write('format')
+    sys.exit(0)
+
+tex_file = args[-1]
+base = os.path.join(args[args.index('-output-directory') + 1], os.path.basename(tex_file)[:-4])
+with open(tex_file) as f:
+    source = f.read()
+if '\\undefined' in source or (os.environ.get('FAKE_LATEX_BAD_FMT') and any(arg.startswith('-fmt=') for arg in args)):
+    with open(base + '.log', 'w') as f:
+        f.write('! Undefined control sequence.')
+    sys.exit(1)
+
+passes = int(open(base + '.passes').read()) + 1 if os.path.exists(base + '.passes') else 1
+with open(base + '.passes', 'w') as f:
+    f.write(str(passes))
+with open(base + '.log', 'w') as f:
+    if passes <= int(os.environ.get('FAKE_LATEX_RERUNS', '0')):
+        f.write('LaTeX Warning: Label(s) may have changed. Rerun to get cross-references right.')
+if '-draftmode' not in args:
+    with open(base + '.pdf', 'w') as f:
+        f.write('%PDF fake ' + source)
+'''
+
+DOCUMENT = "\\documentclass{article}\n\\begin{document}\nHello\n\\end{document}\n"
+CROSS_REFERENCED_DOCUMENT = "\\documentclass{article}\n\\begin{document}\nSee \\ref{fig}\n\\end{document}\n"
+BROKEN_DOCUMENT = "\\documentclass{article}\n\\begin{document}\n\\undefined\n\\end{document}\n"
+
+
+def _clear_cache_dirs(monkeypatch):
+    """Forget the cache directories and failed formats remembered by earlier tests"""
+    latex_engine._format_cache_dir.cache_clear()
+    latex_engine._pdf_cache_dir.cache_clear()
+    monkeypatch.setattr(latex_engine, '_failed_formats', set())
+
+
+@pytest.fixture
+def fake_latex(tmp_path, monkeypatch):
+    """Put the stand-in pdflatex alone on PATH with fresh caches; returns a reader for its logged runs"""
+    bin_dir = tmp_path / 'bin'
+    bin_dir.mkdir()
+    engine_path = bin_dir / 'pdflatex'
+    engine_path.write_text(FAKE_LATEX.replace('PYTHON', sys.executable, 1))
+    engine_path.chmod(0o755)
+    runs_file = tmp_path / 'runs.jsonl'
+    monkeypatch.setenv('PATH', str(bin_dir))
+    monkeypatch.setenv('FAKE_LATEX_RUNS', str(runs_file))
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    _clear_cache_dirs(monkeypatch)
+    
+    def runs():
+        """Arguments of every engine run so far, format builds included"""
+        if not runs_file.exists():
+            return []
+        return [json.loads(line) for line in runs_file.read_text().splitlines()]
+    
+    yield runs
+    _clear_cache_dirs(monkeypatch)
+
+
+def _compile_runs(runs):
+    """Engine runs that compiled a document (not format builds)"""
+    return [args for args in runs if '-ini' not in args]
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """LaTeX engine used only for its markdown conversion (no TeX install needed)"""
+    return LaTeXPDFEngine({})
+
+
+@pytest.mark.fast
+class TestMarkdownToLatex:
+    """Test markdown to LaTeX conversion"""
+    
+    @pytest.mark.parametrize("markdown, expected", [
+        ("Let $x^*$ be optimal and $y^*$ dual", "Let $x^*$ be optimal and $y^*$ dual"),
+        ("$a_1 * b_1 * c$", "$a_1 * b_1 * c$"),
+    ], ids=["starred-vars", "products"])
+    def test_inline_math_copied_verbatim(self, engine, markdown, expected):
+        """Test that * inside inline math is not treated as bold/italic markup"""
+        latex = engine._markdown_to_latex(markdown)
+        
+        assert latex == expected
+        assert '\\textit' not in latex
+    
+    def test_inline_math_with_markup(self, engine):
+        """Test that markup outside inline math is still converted"""
+        latex = engine._markdown_to_latex("- **Bold** item with $x^*$ and *emphasis*")
+        
+        assert '\\item \\textbf{Bold} item with $x^*$ and \\textit{emphasis}' in latex
+        assert '\\begin{itemize}' in latex
+    
+    def test_display_math(self, engine):
+        """Test that display math becomes a \\[ \\] block"""
+        latex = engine._markdown_to_latex("$$E = mc^2$$")
+        
+        assert latex == "\\[E = mc^2\\]"
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(os.name != 'posix', reason="stand-in engine is an executable script")
+class TestCompileMany:
+    """Test compiling several LaTeX documents at once"""
+    
+    def test_outputs_and_errors(self, fake_latex, tmp_path, capsys):
+        """Test that each document gets its own PDF and a failing one yields None with its log printed"""
+        engine = LaTeXPDFEngine({})
+        outputs = [str(tmp_path / f'doc{i}.pdf') for i in range(3)]
+        
+        results = engine.compile_many([DOCUMENT, BROKEN_DOCUMENT, CROSS_REFERENCED_DOCUMENT], outputs)
+        
+        assert results == [outputs[0], None, outputs[2]]
+        assert 'Hello' in open(outputs[0]).read()
+        assert '\\ref{fig}' in open(outputs[2]).read()
+        assert not os.path.exists(outputs[1])
+        output = capsys.readouterr().out
+        assert 'LaTeX compilation failed' in output
+        assert '! Undefined control sequence.' in output
+    
+    def test_work_dir_cleaned(self, fake_latex, tmp_path):
+        """Test that compiled jobs leave nothing behind in the shared work directory"""
+        engine = LaTeXPDFEngine({})
+        
+        engine.compile_many([DOCUMENT, BROKEN_DOCUMENT], [str(tmp_path / 'a.pdf'), str(tmp_path / 'b.pdf')])
+        
+        assert os.listdir(latex_engine._get_work_dir()) == []
+    
+    def test_latex_unavailable(self, fake_latex, monkeypatch):
+        """Test that compiling without any LaTeX engine raises instead of returning empty results"""
+        monkeypatch.setenv('PATH', '')
+        engine = LaTeXPDFEngine({})
+        
+        assert not engine.is_available()
+        with pytest.raises(RuntimeError, match="LaTeX not available"):
+            engine.compile_many([DOCUMENT], ['out.pdf'])
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(os.name != 'posix', reason="stand-in engine is an executable script")
+class TestDraftPasses:
+    """Test the draft passes run for documents with cross-references"""
+    
+    @pytest.mark.parametrize("document, reruns, expected_drafts", [
+        (DOCUMENT, 5, 0),
+        (CROSS_REFERENCED_DOCUMENT, 0, 1),
+        (CROSS_REFERENCED_DOCUMENT, 1, 2),
+        (CROSS_REFERENCED_DOCUMENT, 5, MAX_LATEX_PASSES - 1),
+    ], ids=["no-references", "settled-first-pass", "one-rerun", "capped"])
+    def test_pass_count(self, fake_latex, tmp_path, monkeypatch, document, reruns, expected_drafts):
+        """Test that draft passes repeat while the log asks for a rerun, up to MAX_LATEX_PASSES in total"""
+        monkeypatch.setenv('FAKE_LATEX_RERUNS', str(reruns))
+        
+        assert LaTeXPDFEngine({}).compile_many([document], [str(tmp_path / 'out.pdf')]) == [str(tmp_path / 'out.pdf')]
+        
+        runs = _compile_runs(fake_latex())
+        assert ['-draftmode' in args for args in runs] == [True] * expected_drafts + [False]
+    
+    def test_failed_draft_stops_passes(self, fake_latex, tmp_path):
+        """Test that a failing draft pass goes straight to the final pass, which reports the error"""
+        document = CROSS_REFERENCED_DOCUMENT.replace('See', '\\undefined See')
+        
+        assert LaTeXPDFEngine({}).compile_many([document], [str(tmp_path / 'out.pdf')]) == [None]
+        
+        # One draft and the final pass with the cached format, then the same again with the plain engine
+        runs = _compile_runs(fake_latex())
+        assert ['-draftmode' in args for args in runs] == [True, False, True, False]
+        assert [any(arg.startswith('-fmt=') for arg in args) for args in runs] == [True, True, False, False]
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(os.name != 'posix', reason="stand-in engine is an executable script")
+class TestFormatCache:
+    """Test the precompiled preamble format cache"""
+    
+    def test_format_built_once(self, fake_latex, tmp_path):
+        """Test that the preamble is dumped once and later compiles load the cached format"""
+        engine = LaTeXPDFEngine({})
+        
+        engine.compile_many([DOCUMENT], [str(tmp_path / 'a.pdf')])
+        engine.compile_many([DOCUMENT.replace('Hello', 'Again')], [str(tmp_path / 'b.pdf')])
+        
+        runs = fake_latex()
+        assert sum('-ini' in args for args in runs) == 1
+        assert all(any(arg.startswith('-fmt=') for arg in args) for args in _compile_runs(runs))
+        assert len(os.listdir(tmp_path / 'cache' / 'mkpred' / 'latex-formats')) == 1
+    
+    def test_broken_format_discarded(self, fake_latex, tmp_path, monkeypatch):
+        """Test that a format that breaks the compile is dropped and the plain engine is used instead"""
+        monkeypatch.setenv('FAKE_LATEX_BAD_FMT', '1')
+        engine = LaTeXPDFEngine({})
+        
+        assert engine.compile_many([DOCUMENT], [str(tmp_path / 'out.pdf')]) == [str(tmp_path / 'out.pdf')]
+        
+        runs = _compile_runs(fake_latex())
+        assert [any(arg.startswith('-fmt=') for arg in args) for args in runs] == [True, False]
+        assert os.listdir(tmp_path / 'cache' / 'mkpred' / 'latex-formats') == []
+    
+    def test_no_format_without_preamble(self, fake_latex, tmp_path):
+        """Test that documents without \\begin{document} compile without a format"""
+        LaTeXPDFEngine({}).compile_many(["\\relax Hello"], [str(tmp_path / 'out.pdf')])
+        
+        runs = fake_latex()
+        assert len(runs) == 1
+        assert not any(arg.startswith('-fmt=') for arg in runs[0])
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(os.name != 'posix', reason="stand-in engine is an executable script")
+class TestPdfCache:
+    """Test the compiled PDF cache for markdown decks"""
+    
+    def test_unchanged_deck_skips_engine(self, fake_latex, tmp_path):
+        """Test that converting the same deck again copies the cached PDF without running TeX"""
+        engine = LaTeXPDFEngine({})
+        
+        assert engine.convert_markdown_text_to_pdf("# Title\n\nHello", str(tmp_path / 'a.pdf'))
+        first_runs = len(_compile_runs(fake_latex()))
+        assert engine.convert_markdown_text_to_pdf("# Title\n\nHello", str(tmp_path / 'b.pdf'))
+        
+        assert first_runs > 0
+        assert len(_compile_runs(fake_latex())) == first_runs
+        assert open(tmp_path / 'a.pdf').read() == open(tmp_path / 'b.pdf').read()
+    
+    def test_changed_deck_recompiles(self, fake_latex, tmp_path):
+        """Test that a different deck misses the cache"""
+        engine = LaTeXPDFEngine({})
+        
+        engine.convert_markdown_text_to_pdf("# Title\n\nHello", str(tmp_path / 'a.pdf'))
+        first_runs = len(_compile_runs(fake_latex()))
+        engine.convert_markdown_text_to_pdf("# Title\n\nGoodbye", str(tmp_path / 'b.pdf'))
+        
+        assert len(_compile_runs(fake_latex())) > first_runs
+        assert 'Goodbye' in open(tmp_path / 'b.pdf').read()
+        assert len(os.listdir(tmp_path / 'cache' / 'mkpred' / 'latex')) == 2
+    
+    def test_failed_compile_not_cached(self, fake_latex, tmp_path):
+        """Test that a failing deck is not cached and fails again on the next conversion"""
+        engine = LaTeXPDFEngine({})
+        
+        assert not engine.convert_markdown_text_to_pdf("# Title\n\n$$\\undefined$$", str(tmp_path / 'a.pdf'))
+        assert not engine.convert_markdown_text_to_pdf("# Title\n\n$$\\undefined$$", str(tmp_path / 'b.pdf'))
+        
+        assert not os.path.exists(tmp_path / 'b.pdf')
+        assert os.listdir(tmp_path / 'cache' / 'mkpred' / 'latex') == []
@@ -4,8 +4,6 @@ Test and fix logo and slide numbering issues found in production PDFs
 """
 
 import os
-import tempfile
-import shutil
 import pytest
 from bodh import MarkdownToPDF
 from config import PresentationConfig, load_config
@@ -14,11 +12,9 @@ from config import PresentationConfig, load_config
 class TestLogoSlideNumberIssues:
     """Test specific issues with logo display and slide numbering"""
     
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        self.temp_dir = str(tmp_path)
     
     def test_logo_not_showing_issue(self):
         """Test the exact issue where logo is not showing in PDF"""
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Test the enhanced mkpred converter (slide parsing, caching and PDF backends)
+"""
+
+import base64
+import os
+import sys
+import pytest
+import latex_engine
+import mkpred_enhanced
+from mkpred_enhanced import MarkdownToPDF, LatexBackend, PisaBackend, PlaywrightBackend, _sniff_image_mime
+
+
+DECK = """# First Slide
+
+Some **bold** text
+
+---
+
+# Second Slide
+
+- Item
+"""
+
+
+@pytest.fixture
+def cache_home(tmp_path, monkeypatch):
+    """Fresh XDG_CACHE_HOME for one test"""
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    return tmp_path
+
+
+@pytest.mark.fast
+class TestSlideParsing:
+    """Test splitting a deck into slides"""
+    
+    def test_crlf_separators(self):
+        """Test that CRLF separators split slides without merging the surrounding blank lines"""
+        slides = MarkdownToPDF(slide_cache=False).parse_markdown_slides(DECK.replace('\n', '\r\n'))
+        
+        assert len(slides) == 2
+        assert '<h1>First Slide</h1>' in slides[0]
+        assert '<h1>Second Slide</h1>' in slides[1]
+    
+    def test_separator_inside_fenced_code(self):
+        """Test that a --- line inside a fenced code block does not start a new slide"""
+        md_content = "# Front Matter\n\n```yaml\n---\ntitle: Demo\n---\n```\n\n---\n\n# Next\n"
+        converter = MarkdownToPDF(slide_cache=False)
+        
+        assert list(converter._iter_slides(md_content)) == [
+            "# Front Matter\n\n```yaml\n---\ntitle: Demo\n---\n```",
+            "# Next",
+        ]
+        slides = converter.parse_markdown_slides(md_content)
+        assert len(slides) == 2
+        assert 'title: Demo' in slides[0]
+    
+    def test_separator_with_whitespace(self):
+        """Test that separators may carry spaces or tabs but text next to --- is not a separator"""
+        converter = MarkdownToPDF(slide_cache=False)
+        
+        assert len(list(converter._iter_slides("A\n \t---\t \nB\n"))) == 2
+        assert len(list(converter._iter_slides("A\n--- not a separator\nB\n"))) == 1
+
+
+@pytest.mark.fast
+class TestSlideCache:
+    """Test the rendered slide cache"""
+    
+    def test_cached_slides_reused(self, cache_home):
+        """Test that a second parse of the same deck is served from the per-user cache"""
+        slides = MarkdownToPDF().parse_markdown_slides(DECK)
+        cache_dir = cache_home / 'mkpred' / 'slides'
+        
+        assert len(os.listdir(cache_dir)) == 2
+        assert MarkdownToPDF().parse_markdown_slides(DECK) == slides
+        assert MarkdownToPDF(slide_cache=False).parse_markdown_slides(DECK) == slides
+    
+    def test_cache_keyed_on_renderer(self, cache_home, monkeypatch):
+        """Test that slides cached by a different renderer setup are not reused"""
+        MarkdownToPDF().parse_markdown_slides(DECK)
+        monkeypatch.setattr(mkpred_enhanced, 'SLIDE_MARKDOWN_EXTENSION_CONFIGS', {'fenced_code': {'lang_prefix': 'x-'}})
+        MarkdownToPDF().parse_markdown_slides(DECK)
+        
+        assert len(os.listdir(cache_home / 'mkpred' / 'slides')) == 4
+    
+    def test_no_cache(self, cache_home):
+        """Test that slide_cache=False leaves the cache directory alone"""
+        MarkdownToPDF(slide_cache=False).parse_markdown_slides(DECK)
+        
+        assert not (cache_home / 'mkpred').exists()
+
+
+@pytest.mark.fast
+class TestImageEncoding:
+    """Test base64 image embedding"""
+    
+    def test_encoded_image_cached(self, tmp_path):
+        """Test that an unchanged image is encoded once per converter"""
+        image_path = str(tmp_path / 'logo.png')
+        with open(image_path, 'wb') as f:
+            f.write(b'\x89PNG\r\n\x1a\n' + b'a' * 100)
+        converter = MarkdownToPDF(slide_cache=False)
+        
+        encoded = converter._encode_image(image_path)
+        
+        assert base64.b64decode(encoded) == b'\x89PNG\r\n\x1a\n' + b'a' * 100
+        assert converter._encode_image(image_path) is encoded
+        assert len(converter._encoded_images) == 1
+    
+    def test_changed_image_reencoded(self, tmp_path):
+        """Test that rewriting an image at the same path invalidates its cached encoding"""
+        image_path = str(tmp_path / 'logo.png')
+        converter = MarkdownToPDF(slide_cache=False)
+        with open(image_path, 'wb') as f:
+            f.write(b'old image')
+        os.utime(image_path, ns=(1, 1))
+        assert base64.b64decode(converter._encode_image(image_path)) == b'old image'
+        
+        # Same size, only the mtime tells the two versions apart
+        with open(image_path, 'wb') as f:
+            f.write(b'new image')
+        os.utime(image_path, ns=(2, 2))
+        
+        assert base64.b64decode(converter._encode_image(image_path)) == b'new image'
+    
+    def test_missing_image(self, tmp_path):
+        """Test that a missing image is reported and not cached"""
+        converter = MarkdownToPDF(slide_cache=False)
+        
+        assert converter._encode_image(str(tmp_path / 'missing.png')) is None
+        assert converter._encoded_images == {}
+
+
+@pytest.mark.fast
+class TestImageMime:
+    """Test image type detection from magic bytes"""
+    
+    @pytest.mark.parametrize("header, expected", [
+        (b'\x89PNG\r\n\x1a\n\x00\x00', 'image/png'),
+        (b'\xff\xd8\xff\xe0\x00\x10JFIF', 'image/jpeg'),
+        (b'GIF87a\x01\x00', 'image/gif'),
+        (b'GIF89a\x01\x00', 'image/gif'),
+        (b'<svg xmlns=', None),
+        (b'\x89PN', None),
+        (b'', None),
+    ], ids=["png", "jpeg", "gif87a", "gif89a", "svg", "truncated-png", "empty"])
+    def test_sniff_image_mime(self, header, expected):
+        """Test that known signatures are recognized and anything else is left to the extension"""
+        assert _sniff_image_mime(header) == expected
+    
+    def test_misnamed_logo_embedded_with_real_type(self, tmp_path):
+        """Test that a JPEG saved as .png is embedded as a data URI typed image/jpeg"""
+        logo_path = tmp_path / 'logo.png'
+        logo_path.write_bytes(b'\xff\xd8\xff\xe0' + b'\x00' * 32)
+        
+        logo_src = MarkdownToPDF(slide_cache=False)._logo_source(str(logo_path))
+        
+        assert logo_src.startswith('data:image/jpeg;base64,')
+    
+    def test_correctly_named_logo_referenced_by_path(self, tmp_path):
+        """Test that pisa gets a logo whose extension matches its content by path"""
+        logo_path = tmp_path / 'logo.png'
+        logo_path.write_bytes(b'\x89PNG\r\n\x1a\n' + b'\x00' * 32)
+        
+        assert MarkdownToPDF(slide_cache=False)._logo_source(str(logo_path)) == str(logo_path)
+
+
+@pytest.mark.fast
+class TestBackends:
+    """Test PDF backend selection and what each backend is handed"""
+    
+    @pytest.mark.parametrize("backend, backend_class", [
+        ('pisa', PisaBackend),
+        ('playwright', PlaywrightBackend),
+        ('latex', LatexBackend),
+    ])
+    def test_backend_selection(self, backend, backend_class):
+        """Test that the backend name picks the matching backend class"""
+        with MarkdownToPDF(slide_cache=False, backend=backend) as converter:
+            assert type(converter.backend) is backend_class
+    
+    def test_default_backend_is_pisa(self):
+        """Test that pisa stays the default backend"""
+        assert type(MarkdownToPDF(slide_cache=False).backend) is PisaBackend
+    
+    def test_font_file_by_path_for_pisa(self, tmp_path):
+        """Test that pisa gets the font file's path in @font-face"""
+        font_path = tmp_path / 'Custom.ttf'
+        font_path.write_bytes(b'\x00\x01\x00\x00font')
+        converter = MarkdownToPDF(font_family='Custom', slide_cache=False, font_file=str(font_path))
+        
+        assert f"@font-face {{ font-family: 'Custom'; src: url('{font_path}'); }}" in converter._get_css_styles()
+    
+    def test_font_file_embedded_for_playwright(self, tmp_path, monkeypatch):
+        """Test that the browser backend gets the font file as a data URI, since about:blank pages cannot load files"""
+        font_path = tmp_path / 'Custom.ttf'
+        font_path.write_bytes(b'\x00\x01\x00\x00font')
+        deck_path = tmp_path / 'deck.md'
+        deck_path.write_text(DECK)
+        rendered = {}
+        
+        def fake_render(html_chunks, output_file):
+            rendered[output_file] = ''.join(html_chunks)
+        
+        converter = MarkdownToPDF(font_family='Custom', slide_cache=False, font_file=str(font_path), backend='playwright')
+        monkeypatch.setattr(converter.backend, 'render', fake_render)
+        converter.convert_to_pdf(str(deck_path), str(tmp_path / 'deck.pdf'))
+        
+        font_uri = 'data:font/ttf;base64,' + base64.b64encode(b'\x00\x01\x00\x00font').decode('ascii')
+        html = rendered[str(tmp_path / 'deck.pdf')]
+        assert f"@font-face {{ font-family: 'Custom'; src: url('{font_uri}'); }}" in html
+        assert str(font_path) not in html
+    
+    def test_font_file_rejected_for_latex(self, tmp_path, monkeypatch, capsys):
+        """Test that the CLI refuses --font-file with the LaTeX backend instead of ignoring it"""
+        monkeypatch.setattr(sys, 'argv', ['mkpred_enhanced', 'deck.md', '--backend', 'latex', '--font-file', 'Custom.ttf'])
+        
+        with pytest.raises(SystemExit):
+            mkpred_enhanced.main()
+        
+        assert '--font-file is not supported by the latex backend' in capsys.readouterr().err
+
+
+class FakeLaTeXPDFEngine:
+    """Records what LatexBackend hands the LaTeX engine; fails on decks containing FAIL"""
+    instances = []
+    
+    def __init__(self, config):
+        self.config = config
+        self.converted = []
+        FakeLaTeXPDFEngine.instances.append(self)
+    
+    def convert_markdown_text_to_pdf(self, md_content, output_file):
+        self.converted.append((md_content, output_file))
+        return 'FAIL' not in md_content
+
+
+@pytest.mark.fast
+class TestLatexBackend:
+    """Test the native LaTeX backend"""
+    
+    @pytest.fixture(autouse=True)
+    def fake_engine(self, monkeypatch):
+        """Replace the LaTeX engine with a recorder"""
+        monkeypatch.setattr(latex_engine, 'LaTeXPDFEngine', FakeLaTeXPDFEngine)
+        monkeypatch.setattr(FakeLaTeXPDFEngine, 'instances', [])
+    
+    def test_markdown_passed_through(self, tmp_path, monkeypatch):
+        """Test that the deck's raw markdown goes to the engine with the theme's colors, skipping the HTML step"""
+        deck_path = tmp_path / 'deck.md'
+        deck_path.write_text(DECK)
+        monkeypatch.chdir(tmp_path)
+        converter = MarkdownToPDF(theme='dark', slide_cache=False, backend='latex')
+        monkeypatch.setattr(converter, 'parse_markdown_slides', None)
+        
+        assert converter.convert_to_pdf(str(deck_path)) == 'deck.pdf'
+        
+        engine, = FakeLaTeXPDFEngine.instances
+        colors = mkpred_enhanced.THEMES['dark']
+        assert engine.config == {'theme': {'colors': {'background': colors['bg_color'], 'text': colors['text_color'],
+                                                      'accent': colors['accent_color']}}}
+        assert engine.converted == [(DECK, 'deck.pdf')]
+    
+    def test_engine_reused_per_color_set(self):
+        """Test that one engine is built per theme color set and reused across documents"""
+        backend = LatexBackend()
+        colors = mkpred_enhanced.THEMES
+        
+        backend.render_markdown('# A', 'a.pdf', colors['default'])
+        backend.render_markdown('# B', 'b.pdf', colors['default'])
+        backend.render_markdown('# C', 'c.pdf', colors['dark'])
+        
+        assert [len(engine.converted) for engine in FakeLaTeXPDFEngine.instances] == [2, 1]
+    
+    def test_failure_raises(self):
+        """Test that a failed LaTeX conversion surfaces as an error"""
+        with pytest.raises(Exception, match="PDF generation failed"):
+            LatexBackend().render_markdown('# FAIL', 'out.pdf', mkpred_enhanced.THEMES['default'])
@@ -5,8 +5,6 @@ Compare Playwright vs WeasyPrint vs xhtml2pdf
 """
 
 import os
-import tempfile
-import shutil
 import time
 import pytest
 from bodh import MarkdownToPDF
@@ -15,11 +13,9 @@ from bodh import MarkdownToPDF
 class TestPDFBackends:
     """Test different PDF generation backends"""
     
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        self.temp_dir = str(tmp_path)
     
     def test_weasyprint_backend(self):
         """Test WeasyPrint backend performance and quality"""
@@ -4,8 +4,6 @@ Critical PDF bug testing - tests that focus on the most important PDF functional
 """
 
 import os
-import tempfile
-import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -17,11 +15,9 @@ from config import PresentationConfig, load_config
 class TestPDFCriticalBugs:
     """Test critical PDF rendering bugs that could make PDFs unusable"""
     
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        self.temp_dir = str(tmp_path)
     
     def test_pdf_slide_numbers_actually_render(self):
         """Test that slide numbers are ACTUALLY rendered in PDF, not just HTML"""
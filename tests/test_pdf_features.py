@@ -5,8 +5,6 @@ Test PDF-specific functionality and accuracy
 """
 
 import os
-import tempfile
-import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -19,11 +17,9 @@ import json
 class TestPDFSlideNumbers:
     """Test PDF slide number rendering"""
     
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        self.temp_dir = str(tmp_path)
     
     def test_pdf_slide_numbers_all_themes(self):
         """Test that slide numbers appear in PDF for all themes"""
@@ -126,11 +122,9 @@ Third slide
 class TestPDFLogoRendering:
     """Test PDF logo rendering"""
     
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        self.temp_dir = str(tmp_path)
     
     def test_pdf_logo_all_positions(self):
         """Test logo rendering in all positions for PDF"""
@@ -175,11 +169,9 @@ Logo should be on this slide too.
 class TestPDFComplexContent:
     """Test PDF rendering with complex content"""
     
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        self.temp_dir = str(tmp_path)
     
     def test_pdf_code_highlighting(self):
         """Test PDF code syntax highlighting"""
@@ -348,11 +340,9 @@ Einstein's famous equation $E = mc^2$ relates energy and mass.
 class TestPDFPrintMediaQueries:
     """Test PDF print media query handling"""
     
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        self.temp_dir = str(tmp_path)
     
     def test_pdf_print_queries_present(self):
         """Test that print media queries are present in HTML"""
@@ -395,11 +385,9 @@ More content.
 class TestPDFContentAccuracy:
     """Test PDF content accuracy"""
     
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        self.temp_dir = str(tmp_path)
     
     def test_pdf_slide_count_accuracy(self):
         """Test that PDF processes correct number of slides"""
@@ -528,11 +516,9 @@ def hello():
 class TestPDFErrorHandling:
     """Test PDF error handling"""
     
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        self.temp_dir = str(tmp_path)
     
     def test_pdf_missing_images(self):
         """Test PDF generation with missing images"""
@@ -4,8 +4,6 @@ Test specific Playwright edge cases that could cause issues
 """
 
 import os
-import tempfile
-import shutil
 import time
 import pytest
 from bodh import MarkdownToPDF
@@ -14,11 +12,9 @@ from bodh import MarkdownToPDF
 class TestPlaywrightEdgeCases:
     """Test specific edge cases for Playwright timeout handling"""
     
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        self.temp_dir = str(tmp_path)
     
     def test_original_failing_scenario(self):
         """Test the exact scenario that was failing before the fix"""
@@ -5,8 +5,6 @@ Test the most extreme scenarios to ensure no regressions
 """
 
 import os
-import tempfile
-import shutil
 import time
 import pytest
 from bodh import MarkdownToPDF
@@ -15,11 +13,9 @@ from bodh import MarkdownToPDF
 class TestPlaywrightFinalVerification:
     """Final verification of timeout fix robustness"""
     
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        self.temp_dir = str(tmp_path)
     
     def test_extreme_missing_image_scenario(self):
         """Test the most extreme missing image scenario"""
@@ -5,8 +5,6 @@ Testing edge cases that could cause timeout issues in PDF generation
 """
 
 import os
-import tempfile
-import shutil
 import subprocess
 import sys
 import time
@@ -19,11 +17,9 @@ from config import PresentationConfig
 class TestPlaywrightTimeoutRobustness:
     """Test edge cases that could cause Playwright timeouts"""
     
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        self.temp_dir = str(tmp_path)
     
     def test_many_missing_images_different_types(self):
         """Test with many missing images of different types and URLs"""
@@ -4,8 +4,6 @@ Test the exact production issues that were reported
 """
 
 import os
-import tempfile
-import shutil
 import pytest
 from bodh import MarkdownToPDF
 from config import load_config
@@ -14,11 +12,9 @@ from config import load_config
 class TestProductionIssueFixes:
     """Test the exact issues reported from production"""
     
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        self.temp_dir = str(tmp_path)
     
     def test_logo_demo_configuration_works(self):
         """Test the exact logo-demo.yml configuration that was failing"""
@@ -6,9 +6,8 @@ Test actual production PDF issues:
 """
 
 import os
-import tempfile
-import shutil
 import time
+import pytest
 from bodh import MarkdownToPDF
 from config import load_config
 
@@ -16,11 +15,9 @@ from config import load_config
 class TestProductionPDFIssues:
     """Test the specific issues found in production PDFs"""
     
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        self.temp_dir = str(tmp_path)
     
     def test_logo_demo_exact_reproduction(self):
         """Test the exact logo-demo scenario to reproduce issues"""
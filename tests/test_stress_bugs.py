@@ -5,8 +5,6 @@ High-stakes testing with boundary conditions and error scenarios
 """
 
 import os
-import tempfile
-import shutil
 import subprocess
 import sys
 import time
@@ -19,11 +17,9 @@ from config import PresentationConfig, load_config
 class TestExtremeBoundaryConditions:
     """Test extreme boundary conditions that could break the system"""
     
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        self.temp_dir = str(tmp_path)
     
     def test_massive_presentation_100_slides(self):
         """Test with 100 slides to check memory and performance"""
@@ -298,11 +294,9 @@ ___
 class TestConfigurationEdgeCases:
     """Test edge cases in configuration handling"""
     
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        self.temp_dir = str(tmp_path)
     
     def test_invalid_theme_fallback(self):
         """Test behavior with invalid theme"""
@@ -422,11 +416,9 @@ layout:
 class TestPerformanceAndMemoryEdgeCases:
     """Test performance and memory edge cases"""
     
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        self.temp_dir = str(tmp_path)
     
     def test_rapid_fire_pdf_generation(self):
         """Test rapid generation of multiple PDFs"""
@@ -510,11 +502,9 @@ Large table follows:
 class TestImageAndMediaEdgeCases:
     """Test edge cases with images and media"""
     
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        self.temp_dir = str(tmp_path)
     
     def test_missing_images_stress(self):
         """Test with many missing images"""
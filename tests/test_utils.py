@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test the shared per-user cache directory and slide cache helpers
+"""
+
+import os
+import pytest
+from utils import SlideCache, user_cache_dir
+
+
+@pytest.fixture
+def cache_home(tmp_path, monkeypatch):
+    """Fresh XDG_CACHE_HOME for one test"""
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    return tmp_path
+
+
+@pytest.mark.fast
+class TestUserCacheDir:
+    """Test the per-user cache directory location and permissions"""
+    
+    def test_user_cache_dir_is_private(self, cache_home):
+        """Test that the cache directory is created under XDG_CACHE_HOME with mode 0700"""
+        cache_dir = user_cache_dir('bodh', 'slides')
+        
+        assert cache_dir == cache_home / 'bodh' / 'slides'
+        assert cache_dir.stat().st_mode & 0o777 == 0o700
+    
+    @pytest.mark.skipif(not hasattr(os, 'getuid'), reason="POSIX permissions only")
+    def test_shared_cache_dir_rejected(self, cache_home):
+        """Test that a cache directory writable by other users is not used"""
+        shared_dir = cache_home / 'mkpred' / 'latex-formats'
+        shared_dir.mkdir(parents=True)
+        shared_dir.chmod(0o777)
+        
+        assert user_cache_dir('mkpred', 'latex-formats') is None
+
+
+@pytest.mark.fast
+class TestSlideCache:
+    """Test the on-disk rendered slide cache"""
+    
+    def test_round_trip(self, cache_home):
+        """Test that a stored slide is returned for the same source and key"""
+        cache = SlideCache(('bodh', 'slides'), 'renderer-a')
+        assert cache.get('# Slide') is None
+        
+        cache.put('# Slide', '<h1>Slide</h1>')
+        
+        assert cache.get('# Slide') == '<h1>Slide</h1>'
+        assert SlideCache(('bodh', 'slides'), 'renderer-a').get('# Slide') == '<h1>Slide</h1>'
+    
+    def test_renderer_key_change_misses(self, cache_home):
+        """Test that entries written by a different renderer (code, versions or extensions) are not reused"""
+        SlideCache(('bodh', 'slides'), 'renderer-a').put('# Slide', '<h1>Old</h1>')
+        
+        assert SlideCache(('bodh', 'slides'), 'renderer-b').get('# Slide') is None
+    
+    def test_prune_evicts_least_recently_used(self, cache_home):
+        """Test that pruning keeps at most max_entries slides, dropping the least recently used"""
+        cache = SlideCache(('bodh', 'slides'), 'renderer-a', max_entries=2)
+        for i in range(3):
+            cache.put(f'slide {i}', f'<p>{i}</p>')
+            cache_path = cache._path(f'slide {i}')
+            os.utime(cache_path, ns=(i * 10**9, i * 10**9))
+        
+        # A hit refreshes slide 0, so slide 1 becomes the oldest entry
+        assert cache.get('slide 0') == '<p>0</p>'
+        cache.prune()
+        
+        assert len(os.listdir(cache.cache_dir)) == 2
+        assert cache.get('slide 1') is None
+        assert cache.get('slide 0') == '<p>0</p>'
+        assert cache.get('slide 2') == '<p>2</p>'
+    
+    @pytest.mark.skipif(not hasattr(os, 'getuid'), reason="POSIX permissions only")
+    def test_no_private_directory_disables_cache(self, cache_home):
+        """Test that the cache turns into a no-op when its directory is not private"""
+        shared_dir = cache_home / 'bodh' / 'slides'
+        shared_dir.mkdir(parents=True)
+        shared_dir.chmod(0o777)
+        cache = SlideCache(('bodh', 'slides'), 'renderer-a')
+        
+        cache.put('# Slide', '<h1>Slide</h1>')
+        
+        assert cache.get('# Slide') is None
+        assert os.listdir(shared_dir) == []
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Font Baking Script
+Pre-generate embedded CSS for all supported Google Fonts into baked_fonts.py,
+so presentations can be rendered without any font network access at runtime
+
+The baked CSS is served as-is and never refreshed, so re-run this script
+(python tools/bake_fonts.py) after changing the supported fonts or to pick up
+new font releases. The generated module is not committed (see .gitignore).
+"""
+
+import argparse
+from pathlib import Path
+import sys
+
+# Add the repository root to path for imports
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from font_manager import FontManager
+
+# font_manager imports the baked module from the repository root
+DEFAULT_OUTPUT = REPO_ROOT / "baked_fonts.py"
+
+
+def bake_fonts(output_file: str = str(DEFAULT_OUTPUT)) -> int:
+    """Write a module mapping font family -> fully embedded @font-face CSS"""
+    font_manager = FontManager()
+    fonts = {}
+
+    for font_family in font_manager.google_fonts:
+        embedded_css = font_manager.generate_embedded_css(font_family)
+        if embedded_css:
+            fonts[font_family] = embedded_css
+            print(f"✅ Baked {font_family} ({len(embedded_css)} characters)")
+        else:
+            print(f"⚠️  Skipping {font_family} (could not download font CSS)")
+
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write('"""\nPre-baked embedded font CSS - generated by tools/bake_fonts.py, do not edit\n"""\n\n')
+        f.write('FONTS = {\n')
+        for font_family, css in fonts.items():
+            f.write(f'    {font_family!r}: {css!r},\n')
+        f.write('}\n')
+
+    print(f"💾 Baked {len(fonts)} font families into {output_file}")
+    return len(fonts)
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Bake embedded Google Fonts CSS into a Python module')
+    parser.add_argument('-o', '--output', default=str(DEFAULT_OUTPUT),
+                        help='Output module (default: baked_fonts.py in the repository root)')
+    args = parser.parse_args()
+
+    bake_fonts(args.output)
+
+
+if __name__ == '__main__':
+    main()
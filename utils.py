@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the Bodh converters - input readers, per-user cache directories and the rendered slide cache
+"""
+
+import functools
+import hashlib
+import os
+import re
+from pathlib import Path
+
+
+# LaTeX log messages asking for another pass to settle references
+LATEX_RERUN_NEEDED = re.compile(r'Rerun to get|There were undefined references|Label\(s\) may have changed')
+
+# Upper bound on cached slides per cache directory; the least recently used ones are evicted beyond it
+SLIDE_CACHE_MAX_ENTRIES = 4096
+
+
+def read_markdown(markdown_file, errors='strict'):
+    """Read a markdown file as UTF-8 in one bytes read, normalizing newlines like text mode does"""
+    md_content = Path(markdown_file).read_bytes().decode('utf-8', errors)
+    if '\r' in md_content:
+        md_content = md_content.replace('\r\n', '\n').replace('\r', '\n')
+    return md_content
+
+
+def read_latex_log(log_file):
+    """Contents of a LaTeX log, or '' when the engine did not write one"""
+    try:
+        with open(log_file, encoding='utf-8', errors='replace') as f:
+            return f.read()
+    except OSError:
+        return ''
+
+
+def user_cache_dir(*parts):
+    """Per-user cache directory under $XDG_CACHE_HOME or ~/.cache (created 0700), or None if it isn't private to this user"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    cache_dir = Path(base, *parts)
+    try:
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = cache_dir.stat()
+    except OSError:
+        return None
+    
+    # Cached entries are trusted as-is, so refuse a directory someone else owns or can write to
+    if hasattr(os, 'getuid') and (st.st_uid != os.getuid() or st.st_mode & 0o022):
+        return None
+    return cache_dir
+
+
+@functools.lru_cache(maxsize=None)
+def source_fingerprint(*paths):
+    """Digest of the given source files, so cache keys built on it change whenever the code does"""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        digest.update(Path(path).read_bytes())
+    return digest.hexdigest()
+
+
+class SlideCache:
+    """Rendered slide HTML on disk, keyed by slide source plus everything else that shapes the output"""
+    
+    def __init__(self, subdir, key, max_entries=SLIDE_CACHE_MAX_ENTRIES):
+        # key covers the renderer: code fingerprint, library versions, extensions and their configs
+        self.cache_dir = user_cache_dir(*subdir)
+        self.max_entries = max_entries
+        self._key_prefix = key.encode('utf-8') + b'\0'
+        self._writes = 0
+    
+    def _path(self, slide_content):
+        """Cache file for one slide's source"""
+        key = hashlib.blake2b(self._key_prefix + slide_content.encode('utf-8'), digest_size=16).hexdigest()
+        return self.cache_dir / f"{key}.html"
+    
+    def get(self, slide_content):
+        """Cached HTML for a slide, or None on a miss or without a private cache directory"""
+        if self.cache_dir is None:
+            return None
+        cache_path = self._path(slide_content)
+        try:
+            html = cache_path.read_text(encoding='utf-8')
+            # Mark the entry as recently used so eviction drops stale slides first
+            os.utime(cache_path)
+        except OSError:
+            return None
+        return html
+    
+    def put(self, slide_content, html):
+        """Store rendered slide HTML; the cache is best-effort, so write failures are ignored"""
+        if self.cache_dir is None:
+            return
+        cache_path = self._path(slide_content)
+        try:
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(html, encoding='utf-8')
+            os.replace(tmp_path, cache_path)
+            self._writes += 1
+        except OSError:
+            pass
+    
+    def prune(self):
+        """Evict the least recently used entries beyond max_entries (a no-op unless this cache wrote something)"""
+        if not self._writes:
+            return
+        self._writes = 0
+        entries = []
+        try:
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith('.html'):
+                    entries.append((entry.stat().st_mtime_ns, entry.path))
+        except OSError:
+            return
+        
+        entries.sort()
+        for _, path in entries[:max(0, len(entries) - self.max_entries)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass